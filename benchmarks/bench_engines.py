@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import io
+import time
+
+from benchmarks.synthetic import build_synthetic_resumes, load_base_resume
+from src.core.settings import ENGINE_CANVAS, ENGINE_PLATYPUS
+from src.models.render_options import RenderOptions
+from src.services import canvas_renderer
+from src.services.paragraph_cache import DEFAULT_PARAGRAPH_CACHE
+from src.services.pdf_renderer import render_resume_pdf_to_stream
+from src.services.yaml_parser import _build_resume_data
+
+
+def main() -> None:
+    args = parse_arguments()
+    resumes = [
+        _build_resume_data(resume)
+        for resume in build_synthetic_resumes(load_base_resume(), args.count, bullet_count=args.bullets)
+    ]
+
+    baselines = {}
+    for warm in (False, True):
+        for engine in (ENGINE_PLATYPUS, ENGINE_CANVAS):
+            elapsed = _render_all(resumes, RenderOptions(deterministic=True, engine=engine), warm)
+            baseline = baselines.setdefault(warm, elapsed)
+            label = f"{engine} ({'warm' if warm else 'cold'})"
+            print(
+                f"{label:18s} {elapsed * 1000 / len(resumes):8.2f} ms/doc  "
+                f"{len(resumes) / elapsed:8.1f} docs/s  {baseline / elapsed:5.2f}x"
+            )
+
+
+def _render_all(resumes, options: RenderOptions, warm: bool) -> float:
+    # Cold clears Platypus's paragraph cache and the canvas engine's word
+    # width cache before every document, as a batch of distinct resumes would;
+    # warm renders each one once beforehand.
+    _clear_render_caches()
+    if warm:
+        for resume_data in resumes:
+            render_resume_pdf_to_stream(resume_data, io.BytesIO(), options)
+    started = time.perf_counter()
+    for resume_data in resumes:
+        if not warm:
+            _clear_render_caches()
+        render_resume_pdf_to_stream(resume_data, io.BytesIO(), options)
+    return time.perf_counter() - started
+
+
+def _clear_render_caches() -> None:
+    DEFAULT_PARAGRAPH_CACHE.clear()
+    canvas_renderer._unit_width.cache_clear()
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare the Platypus and canvas rendering engines")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--bullets", type=int, default=None)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
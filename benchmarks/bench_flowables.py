@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import argparse
+import io
+import time
+import tracemalloc
+
+from benchmarks.synthetic import build_synthetic_resume, load_base_resume
+from src.models.render_options import DEFAULT_RENDER_OPTIONS
+from src.services.paragraph_cache import paragraph_cache_stats
+from src.services.pdf_renderer import _build_all_flowables, _create_document
+from src.services.yaml_parser import _build_resume_data
+
+
+def main() -> None:
+    args = parse_arguments()
+    resume_data = _build_resume_data(
+        build_synthetic_resume(load_base_resume(), bullet_count=args.bullets, section_repeat=args.sections)
+    )
+
+    build_seconds = _best_of(args.repeat, lambda: _build_all_flowables(resume_data), args.iterations)
+    render_seconds = _best_of(args.repeat, lambda: _render(resume_data), args.iterations)
+    blocks, size = _allocations(lambda: _build_all_flowables(resume_data))
+
+    print(f"_build_all_flowables  {build_seconds * 1000:8.3f} ms/resume  {blocks:6d} blocks  {size / 1024:8.1f} KiB")
+    print(f"full render           {render_seconds * 1000:8.3f} ms/resume")
+    for name, stats in paragraph_cache_stats().items():
+        print(f"paragraph {name} cache  hit rate {stats.hit_rate:6.1%}  entries {stats.size}")
+
+
+def _render(resume_data) -> None:
+    doc = _create_document(resume_data, io.BytesIO(), DEFAULT_RENDER_OPTIONS)
+    doc.build(_build_all_flowables(resume_data))
+
+
+def _best_of(repeat: int, function, iterations: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best
+
+
+def _allocations(function) -> tuple[int, int]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    built = function()
+    differences = tracemalloc.take_snapshot().compare_to(before, "filename")
+    tracemalloc.stop()
+    del built
+    return sum(d.count_diff for d in differences), sum(d.size_diff for d in differences)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure flowable construction cost and allocations")
+    parser.add_argument("--bullets", type=int, default=6)
+    parser.add_argument("--sections", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+
+import yaml
+
+from benchmarks.synthetic import build_synthetic_resumes, load_base_resume
+from src.core.settings import INPUT_FORMAT_JSON, INPUT_FORMAT_MSGPACK, INPUT_FORMAT_YAML
+from src.services import yaml_parser
+from src.services.yaml_parser import parse_resume_bytes, parse_resume_dict
+
+
+def main() -> None:
+    args = parse_arguments()
+    resumes = build_synthetic_resumes(load_base_resume(), args.documents, bullet_count=args.bullets)
+    print(f"{args.documents} documents")
+
+    baseline = None
+    for name, parse, payloads in _build_cases(resumes):
+        elapsed = min(_time_parse(parse, payloads) for _ in range(args.repeat))
+        baseline = baseline or elapsed
+        size_kb = sum(len(payload) for payload in payloads if isinstance(payload, bytes)) / 1024
+        size = f"{size_kb:8.0f} KB" if size_kb else " " * 11
+        print(f"{name:14s} {elapsed * 1e6 / len(payloads):8.1f} us/doc {size}  {baseline / elapsed:6.2f}x")
+
+
+def _build_cases(resumes: list[dict]) -> list[tuple]:
+    yaml_payloads = [yaml.safe_dump(resume).encode("utf-8") for resume in resumes]
+    json_payloads = [json.dumps(resume).encode("utf-8") for resume in resumes]
+    cases = [
+        ("yaml", lambda payload: parse_resume_bytes(payload, INPUT_FORMAT_YAML), yaml_payloads),
+        ("json", lambda payload: parse_resume_bytes(payload, INPUT_FORMAT_JSON), json_payloads),
+        ("json (stdlib)", _parse_stdlib_json, json_payloads),
+    ]
+    if yaml_parser.msgpack is not None:
+        msgpack_payloads = [yaml_parser.msgpack.packb(resume) for resume in resumes]
+        cases.append(("msgpack", lambda payload: parse_resume_bytes(payload, INPUT_FORMAT_MSGPACK), msgpack_payloads))
+    cases.append(("dict", parse_resume_dict, resumes))
+    return cases
+
+
+def _parse_stdlib_json(payload: bytes):
+    return parse_resume_dict(json.loads(payload))
+
+
+def _time_parse(parse, payloads: list) -> float:
+    started = time.perf_counter()
+    for payload in payloads:
+        parse(payload)
+    return time.perf_counter() - started
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare YAML, JSON, MessagePack and dict resume loaders")
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--bullets", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
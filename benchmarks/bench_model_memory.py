@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import gc
+import tracemalloc
+
+from benchmarks.synthetic import build_synthetic_resumes, load_base_resume
+from src.models import resume_data as models
+from src.models.frozen_resume_data import freeze_resume_data
+from src.services.yaml_parser import _build_resume_data
+
+
+def main() -> None:
+    args = parse_arguments()
+    raw_resumes = build_synthetic_resumes(load_base_resume(), args.count)
+
+    # Each model is built from a private copy of its raw dict so the containers it
+    # keeps alive are counted; strings are shared by deepcopy and excluded.
+    unslotted = _measure(lambda: [_build_unslotted(copy.deepcopy(raw)) for raw in raw_resumes])
+    slotted = _measure(lambda: [_build_resume_data(copy.deepcopy(raw)) for raw in raw_resumes])
+    frozen = _measure(lambda: [
+        freeze_resume_data(_build_resume_data(copy.deepcopy(raw))) for raw in raw_resumes
+    ])
+
+    print(f"{args.count} resumes, retained model bytes per resume")
+    for label, total in (("dict-backed", unslotted), ("slots", slotted), ("frozen slots", frozen)):
+        print(f"{label:14s} {total / args.count:9.0f}  {total / unslotted:5.2f}x")
+
+
+def _measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    built = build()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, "filename"))
+    del built
+    return total
+
+
+def _unslotted_twin(cls: type) -> type:
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [(field.name, field.type, field) for field in dataclasses.fields(cls)],
+    )
+
+
+_UNSLOTTED = {
+    name: _unslotted_twin(getattr(models, name))
+    for name in ("ContactInfo", "SkillCategory", "Experience", "Education", "Project", "ResumeData")
+}
+
+
+def _build_unslotted(raw: dict):
+    contact = _UNSLOTTED["ContactInfo"](**raw["contact"])
+    return _UNSLOTTED["ResumeData"](
+        contact=contact,
+        summary=raw["summary"],
+        skills=[_UNSLOTTED["SkillCategory"](**entry) for entry in raw.get("skills", [])],
+        experience=[
+            _UNSLOTTED["Experience"](**{**entry, "start_date": str(entry["start_date"]), "end_date": str(entry["end_date"])})
+            for entry in raw.get("experience", [])
+        ],
+        education=[
+            _UNSLOTTED["Education"](**{**entry, "start_date": str(entry["start_date"]), "end_date": str(entry["end_date"])})
+            for entry in raw.get("education", [])
+        ],
+        projects=[_UNSLOTTED["Project"](**entry) for entry in raw.get("projects", [])],
+    )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure per-resume memory of the data model variants")
+    parser.add_argument("--count", type=int, default=10000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
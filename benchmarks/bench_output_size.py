@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from dataclasses import replace
+
+import reportlab
+
+from src.core.settings import COMPRESSION_MODES, DEFAULT_INPUT_PATH, RENDER_ENGINES
+from src.models.render_options import RenderOptions
+from src.models.theme import DEFAULT_THEME, Theme
+from src.services.pdf_renderer import render_resume_pdf_bytes
+from src.services.yaml_parser import parse_resume_file
+
+REPORTLAB_FONTS = os.path.join(os.path.dirname(reportlab.__file__), "fonts")
+TTF_THEME = replace(
+    DEFAULT_THEME,
+    name="vera",
+    font_name="Vera",
+    font_name_bold="VeraBd",
+    font_name_italic="VeraIt",
+    font_file=os.path.join(REPORTLAB_FONTS, "Vera.ttf"),
+    font_file_bold=os.path.join(REPORTLAB_FONTS, "VeraBd.ttf"),
+    font_file_italic=os.path.join(REPORTLAB_FONTS, "VeraIt.ttf"),
+)
+
+
+def main() -> None:
+    args = parse_arguments()
+    resume_data = parse_resume_file(args.input)
+
+    print(f"{'theme':8s} {'engine':9s} {'compression':12s} {'metadata':9s} {'bytes':>8s} {'ms/doc':>8s}")
+    for theme in (DEFAULT_THEME, TTF_THEME):
+        for engine in RENDER_ENGINES:
+            for compression in COMPRESSION_MODES:
+                for strip_metadata in (False, True):
+                    options = RenderOptions(
+                        deterministic=True,
+                        theme=theme,
+                        engine=engine,
+                        compression=compression,
+                        strip_metadata=strip_metadata,
+                    )
+                    size, elapsed = _measure(resume_data, options, args.repeat)
+                    print(
+                        f"{_theme_label(theme):8s} {engine:9s} {compression:12s} "
+                        f"{'stripped' if strip_metadata else 'full':9s} {size:8d} {elapsed * 1000:8.2f}"
+                    )
+
+
+def _measure(resume_data, options: RenderOptions, repeat: int) -> tuple[int, float]:
+    pdf = render_resume_pdf_bytes(resume_data, options)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        render_resume_pdf_bytes(resume_data, options)
+    return len(pdf), (time.perf_counter() - started) / repeat
+
+
+def _theme_label(theme: Theme) -> str:
+    return "ttf" if theme.font_file else "base14"
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report output size and render time for each output setting")
+    parser.add_argument("--input", default=DEFAULT_INPUT_PATH)
+    parser.add_argument("--repeat", type=int, default=20)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
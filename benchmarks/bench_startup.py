@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+
+IMPORT_TIME_PREFIX = "import time:"
+
+COMMANDS = {
+    "python": ["-c", "pass"],
+    "--help": ["main.py", "--help"],
+    "--validate-only": ["main.py", "--validate-only"],
+    "render": ["main.py", "--output", "{tmp}/resume.pdf"],
+}
+
+
+def main() -> None:
+    args = parse_arguments()
+
+    with tempfile.TemporaryDirectory() as directory:
+        interpreter_seconds = None
+        for label, command in COMMANDS.items():
+            command = [part.format(tmp=directory) for part in command]
+            wall_seconds = best_wall_time(command, args.repeat)
+            if interpreter_seconds is None:
+                interpreter_seconds = wall_seconds
+            overhead_ms = (wall_seconds - interpreter_seconds) * 1000
+            imports = import_times(command)
+            top = ", ".join(f"{name} {micros / 1000:.1f}" for name, micros in imports[:args.top])
+            print(f"{label:16s} {wall_seconds * 1000:7.1f} ms (+{overhead_ms:6.1f})  top-level imports (ms): {top}")
+
+
+def best_wall_time(command: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *command], capture_output=True, check=True)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def import_times(command: list[str]) -> list[tuple[str, int]]:
+    completed = subprocess.run([sys.executable, "-X", "importtime", *command], capture_output=True, text=True)
+    top_level = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith(IMPORT_TIME_PREFIX) or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len(IMPORT_TIME_PREFIX):].split("|")
+        # -X importtime indents nested imports by two extra spaces per level.
+        if not name.startswith("   "):
+            top_level.append((name.strip(), int(cumulative)))
+    return sorted(top_level, key=lambda entry: entry[1], reverse=True)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure CLI startup wall time and -X importtime breakdown")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=4)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import argparse
+import time
+
+from benchmarks.synthetic import build_synthetic_resumes, load_base_resume
+from src.utils.validators import validate_resume_data
+
+
+def main() -> None:
+    args = parse_arguments()
+    resumes = build_synthetic_resumes(load_base_resume(), args.count)
+
+    best = float("inf")
+    for _ in range(args.repeat):
+        started = time.perf_counter()
+        for raw_dict in resumes:
+            validate_resume_data(raw_dict)
+        best = min(best, time.perf_counter() - started)
+
+    print(f"{args.count} resumes in {best:.2f} s: {args.count / best:,.0f} resumes/s")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure validate_resume_data throughput")
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
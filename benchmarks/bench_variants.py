@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+
+from src.core.settings import DEFAULT_INPUT_PATH
+from src.models.render_options import RenderOptions
+from src.models.variant_spec import VariantSpec
+from src.services.paragraph_cache import DEFAULT_PARAGRAPH_CACHE
+from src.services.pdf_renderer import render_resume_pdf
+from src.services.variant_renderer import apply_variant, render_variants
+from src.services.yaml_parser import parse_resume_file
+
+OPTIONS = RenderOptions(deterministic=True)
+
+
+def main() -> None:
+    args = parse_arguments()
+    base = parse_resume_file(DEFAULT_INPUT_PATH)
+    specs = build_variant_specs(base, args.variants)
+
+    with tempfile.TemporaryDirectory() as directory:
+        _report("separate runs", len(specs), lambda: _render_separately(specs, directory))
+        _report("fan-out", len(specs), lambda: _consume(render_variants(base, specs, directory, options=OPTIONS)))
+        if args.workers > 1:
+            _report(
+                f"fan-out x{args.workers}", len(specs),
+                lambda: _consume(render_variants(base, specs, directory, args.workers, options=OPTIONS)),
+            )
+
+
+def build_variant_specs(base, count: int) -> list[VariantSpec]:
+    categories = [skill.category for skill in base.skills]
+    companies = [exp.company for exp in base.experience]
+    return [
+        VariantSpec(
+            name=f"variant-{index}",
+            skill_categories=tuple(categories[index % len(categories):] + categories[:index % len(categories)]),
+            experience_order=tuple(companies[index % len(companies):]),
+            max_bullets=2 + index % 3,
+        )
+        for index in range(count)
+    ]
+
+
+def _render_separately(specs: list[VariantSpec], directory: str) -> None:
+    # Mirrors one main.py run per variant: parse the base again and start cold.
+    for spec in specs:
+        DEFAULT_PARAGRAPH_CACHE.clear()
+        base = parse_resume_file(DEFAULT_INPUT_PATH)
+        render_resume_pdf(apply_variant(base, spec), f"{directory}/{spec.name}.pdf", OPTIONS)
+
+
+def _consume(outcomes) -> None:
+    for outcome in outcomes:
+        if not outcome.succeeded:
+            raise RuntimeError(outcome.error)
+
+
+def _report(label: str, count: int, function) -> None:
+    DEFAULT_PARAGRAPH_CACHE.clear()
+    started = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - started
+    print(f"{label:16s} {elapsed * 1000 / count:8.2f} ms/variant  {count / elapsed:8.1f} variants/s")
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare variant fan-out against one run per variant")
+    parser.add_argument("--variants", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=4)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
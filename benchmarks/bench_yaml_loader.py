@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+from benchmarks.synthetic import build_synthetic_resumes, load_base_resume, write_multi_document_yaml
+
+
+def main() -> None:
+    args = parse_arguments()
+    resumes = build_synthetic_resumes(load_base_resume(), args.documents, bullet_count=args.bullets)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bundle.yaml")
+        write_multi_document_yaml(path, resumes)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"{args.documents} documents, {size_mb:.1f} MB")
+
+        loaders = [("SafeLoader", yaml.SafeLoader)]
+        if yaml.__with_libyaml__:
+            loaders.append(("CSafeLoader", yaml.CSafeLoader))
+
+        baseline = None
+        for name, loader in loaders:
+            elapsed = min(_time_load(path, loader) for _ in range(args.repeat))
+            baseline = baseline or elapsed
+            print(f"{name:12s} {elapsed * 1000:9.1f} ms  {baseline / elapsed:5.2f}x")
+
+
+def _time_load(path: str, loader: type) -> float:
+    started = time.perf_counter()
+    with open(path, "r") as file:
+        for _ in yaml.load_all(file, Loader=loader):
+            pass
+    return time.perf_counter() - started
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare PyYAML pure-Python and libyaml loaders")
+    parser.add_argument("--documents", type=int, default=500)
+    parser.add_argument("--bullets", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
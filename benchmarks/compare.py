@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+
+DEFAULT_THRESHOLD = 0.10
+COMPARED_METRIC = "p50_ms"
+
+
+def main() -> None:
+    args = parse_arguments()
+    baseline = _load(args.baseline)
+    current = _load(args.current)
+
+    regressions = compare_results(baseline, current, args.threshold, args.metric)
+
+    for line in regressions:
+        sys.stdout.write(f"REGRESSION {line}\n")
+    if regressions:
+        sys.exit(1)
+    sys.stdout.write(f"No {args.metric} regressions above {args.threshold:.0%}\n")
+
+
+def compare_results(baseline: dict, current: dict, threshold: float, metric: str = COMPARED_METRIC) -> list[str]:
+    baseline_scenarios = {scenario["name"]: scenario for scenario in baseline["scenarios"]}
+    regressions = []
+
+    for scenario in current["scenarios"]:
+        reference = baseline_scenarios.get(scenario["name"])
+        if reference is None:
+            continue
+        for stage, summary in scenario["stages"].items():
+            reference_value = reference["stages"].get(stage, {}).get(metric)
+            current_value = summary.get(metric)
+            if not reference_value or current_value is None:
+                continue
+            change = (current_value - reference_value) / reference_value
+            if change > threshold:
+                regressions.append(
+                    f"{scenario['name']} {stage}: {metric} {reference_value:.3f} -> {current_value:.3f} (+{change:.0%})"
+                )
+
+    return regressions
+
+
+def _load(path: str) -> dict:
+    with open(path, "r") as file:
+        return json.load(file)
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Diff a pipeline benchmark result against a stored baseline")
+    parser.add_argument("baseline", help="Baseline JSON written by benchmarks.pipeline")
+    parser.add_argument("current", help="Current JSON written by benchmarks.pipeline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative slowdown")
+    parser.add_argument("--metric", default=COMPARED_METRIC, help="Stage metric to compare")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import reportlab
+import yaml
+
+from benchmarks.synthetic import build_synthetic_resume, load_base_resume
+from src.models.render_options import DEFAULT_RENDER_OPTIONS
+from src.services.pdf_renderer import _build_all_flowables, _create_document
+from src.services.yaml_parser import _build_resume_data, _load_yaml_file
+from src.utils.profiling import (
+    PIPELINE_STAGES,
+    STAGE_BUILD_FLOWABLES,
+    STAGE_BUILD_MODEL,
+    STAGE_LAYOUT,
+    STAGE_LOAD,
+    STAGE_VALIDATE,
+)
+from src.utils.validators import validate_resume_data
+
+RESULT_FORMAT_VERSION = 1
+
+
+def main() -> None:
+    args = parse_arguments()
+    base = load_base_resume()
+    scenarios = [
+        _run_scenario_in_subprocess(base, bullets, sections, documents)
+        for bullets, sections, documents in itertools.product(args.bullets, args.sections, args.documents)
+    ]
+    result = {
+        "format_version": RESULT_FORMAT_VERSION,
+        "meta": _environment_metadata(),
+        "scenarios": scenarios,
+    }
+
+    with open(args.output, "w") as output_file:
+        json.dump(result, output_file, indent=2)
+
+    for scenario in scenarios:
+        _print_scenario(scenario)
+    print(f"Results written to {args.output}")
+
+
+def _run_scenario_in_subprocess(base: dict, bullets: int, sections: int, documents: int) -> dict:
+    # ru_maxrss is a process-wide high-water mark, so each scenario gets a
+    # fresh spawned worker to keep earlier scenarios out of its peak.
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(run_scenario, base, bullets, sections, documents).result()
+
+
+def run_scenario(base: dict, bullets: int, sections: int, documents: int) -> dict:
+    timings = {stage: [] for stage in PIPELINE_STAGES}
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(documents):
+            path = os.path.join(directory, f"resume_{index}.yaml")
+            with open(path, "w") as file:
+                yaml.safe_dump(build_synthetic_resume(base, index, bullets, sections), file, sort_keys=False)
+            paths.append(path)
+
+        for path in paths:
+            _time_pipeline(path, timings)
+
+    return {
+        "name": f"bullets={bullets},sections={sections},documents={documents}",
+        "params": {"bullets": bullets, "sections": sections, "documents": documents},
+        "stages": {stage: _summarize(samples) for stage, samples in timings.items()},
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def _time_pipeline(path: str, timings: dict[str, list[float]]) -> None:
+    clock = time.perf_counter
+
+    started = clock()
+    raw_dict = _load_yaml_file(path)
+    loaded = clock()
+    validate_resume_data(raw_dict)
+    validated = clock()
+    resume_data = _build_resume_data(raw_dict)
+    modelled = clock()
+    flowables = _build_all_flowables(resume_data)
+    flowed = clock()
+    doc = _create_document(resume_data, io.BytesIO(), DEFAULT_RENDER_OPTIONS)
+    laid_out_start = clock()
+    doc.build(flowables)
+    laid_out = clock()
+
+    timings[STAGE_LOAD].append(loaded - started)
+    timings[STAGE_VALIDATE].append(validated - loaded)
+    timings[STAGE_BUILD_MODEL].append(modelled - validated)
+    timings[STAGE_BUILD_FLOWABLES].append(flowed - modelled)
+    timings[STAGE_LAYOUT].append(laid_out - laid_out_start)
+
+
+def _summarize(samples: list[float]) -> dict:
+    total = sum(samples)
+    ordered = sorted(samples)
+    return {
+        "count": len(samples),
+        "total_s": total,
+        "throughput_per_s": len(samples) / total if total else None,
+        "mean_ms": statistics.fmean(samples) * 1000,
+        "p50_ms": _percentile(ordered, 50) * 1000,
+        "p90_ms": _percentile(ordered, 90) * 1000,
+        "p99_ms": _percentile(ordered, 99) * 1000,
+    }
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * percent / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def _environment_metadata() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "reportlab": reportlab.Version,
+        "pyyaml": yaml.__version__,
+        "libyaml": yaml.__with_libyaml__,
+    }
+
+
+def _print_scenario(scenario: dict) -> None:
+    print(f"{scenario['name']}  peak RSS {scenario['peak_rss_kb'] / 1024:.0f} MB")
+    for stage, summary in scenario["stages"].items():
+        print(
+            f"  {stage:16s} p50 {summary['p50_ms']:8.2f} ms  p99 {summary['p99_ms']:8.2f} ms"
+            f"  {summary['throughput_per_s'] or 0:10,.0f}/s"
+        )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time the parse, validate, model, flowable and layout stages on synthetic resumes"
+    )
+    parser.add_argument("--bullets", type=int, nargs="+", default=[4, 16], help="Bullets per experience entry")
+    parser.add_argument("--sections", type=int, nargs="+", default=[1, 3], help="Repeats of each list section")
+    parser.add_argument("--documents", type=int, nargs="+", default=[50], help="Documents per scenario")
+    parser.add_argument("--output", default="bench_results.json", help="Path for the JSON result")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    main()
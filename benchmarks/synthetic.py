@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import copy
+
+import yaml
+
+from src.core.settings import DEFAULT_INPUT_PATH
+
+
+def load_base_resume(path: str = DEFAULT_INPUT_PATH) -> dict:
+    with open(path, "r") as file:
+        return yaml.safe_load(file)
+
+
+def build_synthetic_resume(
+    base: dict,
+    index: int = 0,
+    bullet_count: int | None = None,
+    section_repeat: int = 1,
+) -> dict:
+    resume = copy.deepcopy(base)
+    resume["contact"]["name"] = f"{base['contact']['name']} {index}"
+    resume["contact"]["email"] = f"candidate{index}@example.com"
+
+    for section in ("experience", "projects", "education"):
+        entries = resume.get(section) or []
+        resume[section] = [copy.deepcopy(entry) for _ in range(section_repeat) for entry in entries]
+
+    if bullet_count is not None:
+        for entry in resume.get("experience", []):
+            entry["bullets"] = _scale_list(entry.get("bullets", []), bullet_count)
+
+    return resume
+
+
+def build_synthetic_resumes(base: dict, count: int, **kwargs) -> list[dict]:
+    return [build_synthetic_resume(base, index, **kwargs) for index in range(count)]
+
+
+def write_multi_document_yaml(path: str, resumes: list[dict]) -> None:
+    with open(path, "w") as file:
+        yaml.safe_dump_all(resumes, file, sort_keys=False)
+
+
+def _scale_list(items: list[str], count: int) -> list[str]:
+    if not items:
+        return []
+    return [items[index % len(items)] for index in range(count)]
@@ -1,28 +1,327 @@
+from __future__ import annotations
+
 import argparse
 import sys
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from src.core.settings import (
+    COMPRESSION_MODES,
+    DEFAULT_BATCH_OUTPUT_DIR,
+    DEFAULT_CACHE_MAX_MB,
+    DEFAULT_COMPRESSION,
+    DEFAULT_INPUT_PATH,
+    DEFAULT_OUTPUT_PATH,
+    DEFAULT_QUEUE_LIMIT,
+    DEFAULT_RENDER_ENGINE,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    DEFAULT_SERVER_HOST,
+    DEFAULT_SERVER_PORT,
+    DEFAULT_THEME_NAME,
+    RENDER_ENGINES,
+)
 
-from src.core.settings import DEFAULT_INPUT_PATH, DEFAULT_OUTPUT_PATH
-from src.services.pdf_renderer import render_resume_pdf
-from src.services.yaml_parser import ResumeParseError, parse_resume_file
-from src.utils.validators import ResumeValidationError
+# Rendering modules pull in reportlab and build every style at import, so they
+# are imported by the run_* function that needs them. --help, usage errors and
+# --validate-only never load them.
+if TYPE_CHECKING:
+    from src.models.render_job import RenderOutcome
+    from src.models.render_options import RenderOptions
+    from src.models.theme import Theme
+    from src.services.page_fit import FitResult
+    from src.services.parse_cache import ParseCache
+    from src.services.render_cache import RenderCache
+    from src.services.watcher import WatchEvent
 
 
 def main() -> None:
     args = parse_arguments()
 
+    from src.services.yaml_parser import ResumeParseError
+    from src.utils.validators import ResumeValidationError
+
+    with stage_instrumentation(args):
+        try:
+            if args.validate_only:
+                exit_code = run_validate(args)
+            elif args.serve:
+                exit_code = run_server(args)
+            elif args.batch:
+                exit_code = run_batch(args)
+            elif args.variants:
+                exit_code = run_variants(args)
+            elif args.watch:
+                exit_code = run_watch(args)
+            else:
+                exit_code = run_single(args)
+            sys.exit(exit_code)
+        except ResumeParseError as parse_error:
+            sys.stderr.write(f"Parse error: {parse_error}\n")
+            sys.exit(1)
+        except ResumeValidationError as validation_error:
+            sys.stderr.write(f"Validation error: {validation_error}\n")
+            sys.exit(1)
+        except Exception as unexpected_error:
+            sys.stderr.write(f"Unexpected error: {unexpected_error}\n")
+            sys.exit(1)
+
+
+@contextmanager
+def stage_instrumentation(args: argparse.Namespace) -> Iterator[None]:
+    timings_stream = None
+    timings_hook = None
+    profiler = None
+
+    if args.timings:
+        from src.utils.profiling import JsonLinesStageWriter, add_stage_hook
+
+        timings_stream = sys.stderr if args.timings == "-" else open(args.timings, "a")
+        timings_hook = JsonLinesStageWriter(timings_stream)
+        add_stage_hook(timings_hook)
+    if args.trace_allocations:
+        import tracemalloc
+
+        tracemalloc.start()
+    if args.profile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+        if args.trace_allocations:
+            tracemalloc.stop()
+        if timings_hook is not None:
+            from src.utils.profiling import remove_stage_hook
+
+            remove_stage_hook(timings_hook)
+            if timings_stream is not sys.stderr:
+                timings_stream.close()
+
+
+def run_validate(args: argparse.Namespace) -> int:
+    from src.models.render_job import RenderOutcome
+    from src.services.input_sources import resolve_resume_inputs
+    from src.services.yaml_parser import format_render_error, parse_resume_file
+
+    input_paths = resolve_resume_inputs(args.batch) if args.batch else [args.input]
+    outcomes = []
+    for input_path in input_paths:
+        try:
+            parse_resume_file(input_path)
+        except Exception as error:
+            outcomes.append(RenderOutcome(input_path, error=format_render_error(error)))
+        else:
+            outcomes.append(RenderOutcome(input_path))
+    return report_outcomes(outcomes, "resumes", "Validated")
+
+
+def run_single(args: argparse.Namespace) -> int:
+    from dataclasses import replace
+
+    from src.services.page_fit import PageFitter
+    from src.services.pdf_renderer import render_resume_pdf, resolve_styles
+    from src.services.yaml_parser import parse_resume_file
+
+    resume_data = parse_resume_file(args.input)
+    options = build_render_options(args)
+    section_cache = None
+    if args.fit_pages is not None:
+        fitter = PageFitter(base_styles=resolve_styles(options))
+        fit_result = fitter.fit(resume_data, args.fit_pages)
+        report_fit(fit_result, args.fit_pages)
+        options = replace(options, style_scale=fit_result.scale)
+        section_cache = fitter.section_cache
+    render_resume_pdf(resume_data, args.output, options, build_render_cache(args), section_cache)
+    return 0
+
+
+def report_fit(fit_result: FitResult, max_pages: int) -> None:
+    if fit_result.fits:
+        sys.stderr.write(
+            f"Fitted to {fit_result.page_count} page(s) at style scale {fit_result.scale:g} "
+            f"({fit_result.trials} trial layouts)\n"
+        )
+    else:
+        sys.stderr.write(
+            f"Does not fit on {max_pages} page(s) even at style scale {fit_result.scale:g}; "
+            f"rendering {fit_result.page_count} pages\n"
+        )
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    from src.services.input_sources import resolve_resume_inputs
+    from src.services.pdf_renderer import render_many
+    from src.services.render_pool import render_many_parallel
+
+    input_paths = resolve_resume_inputs(args.batch)
+    options = build_render_options(args)
+    cache = build_render_cache(args)
+    parse_cache = build_parse_cache(args)
+    if args.workers > 1:
+        outcomes = render_many_parallel(
+            input_paths, args.output_dir, args.workers,
+            ordered=not args.unordered, options=options, cache=cache, parse_cache=parse_cache,
+        )
+    else:
+        outcomes = render_many(input_paths, args.output_dir, options, cache, parse_cache)
+    exit_code = report_outcomes(outcomes)
+    if parse_cache is not None:
+        report_parse_cache(parse_cache)
+    return exit_code
+
+
+def run_variants(args: argparse.Namespace) -> int:
+    import time
+
+    from src.services.variant_renderer import render_variants
+    from src.services.yaml_parser import parse_resume_file, parse_variant_file
+
+    base = parse_resume_file(args.input)
+    specs = parse_variant_file(args.variants)
+    started = time.perf_counter()
+    outcomes = render_variants(
+        base, specs, args.output_dir, args.workers,
+        options=build_render_options(args), cache=build_render_cache(args),
+    )
+    exit_code = report_outcomes(outcomes, "variants")
+    elapsed = time.perf_counter() - started
+    sys.stdout.write(f"Total {elapsed:.2f} s ({len(specs) / elapsed:.1f} variants/s)\n")
+    return exit_code
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    from src.services.watcher import ResumeWatcher
+
+    parse_cache = build_parse_cache(args, verify_hash=True)
+    watcher = ResumeWatcher(args.input, args.output, build_render_options(args), parse_cache=parse_cache)
+    sys.stderr.write(f"Watching {args.input} for changes\n")
+    try:
+        watcher.run(report_watch_event)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def report_watch_event(event: WatchEvent) -> None:
+    elapsed_ms = event.elapsed_seconds * 1000
+    if event.error:
+        sys.stderr.write(f"FAILED {event.error}\n")
+    elif event.rendered:
+        rebuilt = ", ".join(event.rebuilt_sections) or "none"
+        sys.stderr.write(f"Rendered in {elapsed_ms:.0f} ms (rebuilt sections: {rebuilt})\n")
+    else:
+        sys.stderr.write(f"No content changes, render skipped ({elapsed_ms:.0f} ms)\n")
+
+
+def run_server(args: argparse.Namespace) -> int:
+    from src.services.render_server import RenderServer, create_http_server, create_unix_server
+
+    render_server = RenderServer(
+        workers=args.workers,
+        queue_limit=args.queue_limit,
+        timeout=args.timeout,
+        options=build_render_options(args),
+        themes=load_themes(args),
+    )
+    with render_server:
+        if args.socket:
+            http_server = create_unix_server(render_server, args.socket)
+            address = args.socket
+        else:
+            http_server = create_http_server(render_server, args.host, args.port)
+            address = f"http://{args.host}:{http_server.server_port}"
+        sys.stderr.write(f"Serving resume renders on {address}\n")
+        try:
+            http_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            http_server.server_close()
+    return 0
+
+
+def build_render_options(args: argparse.Namespace) -> RenderOptions:
+    from src.models.render_options import RenderOptions
+    from src.utils.validators import ResumeValidationError
+
+    themes = load_themes(args)
+    if args.theme not in themes:
+        raise ResumeValidationError([f"Unknown theme: '{args.theme}'"])
+    return RenderOptions(
+        deterministic=args.deterministic,
+        theme=themes[args.theme],
+        engine=args.engine,
+        compression=args.compression,
+        strip_metadata=args.strip_metadata,
+    )
+
+
+def load_themes(args: argparse.Namespace) -> dict[str, Theme]:
+    from src.models.theme import DEFAULT_THEME
+    from src.services.yaml_parser import parse_theme_file
+
+    themes = {DEFAULT_THEME_NAME: DEFAULT_THEME}
+    if args.themes:
+        themes.update(parse_theme_file(args.themes))
+    return themes
+
+
+def build_render_cache(args: argparse.Namespace) -> RenderCache | None:
+    if not args.cache_dir:
+        return None
+
+    from src.services.render_cache import BYTES_PER_MB, RenderCache
+
+    return RenderCache(args.cache_dir, args.cache_max_mb * BYTES_PER_MB, hard_link=args.cache_hard_link)
+
+
+def build_parse_cache(args: argparse.Namespace, verify_hash: bool = False) -> ParseCache | None:
+    if not args.parse_cache_dir:
+        return None
+
+    from src.services.parse_cache import ParseCache
+
+    return ParseCache(directory=args.parse_cache_dir, verify_hash=verify_hash or args.parse_cache_hash)
+
+
+def report_parse_cache(parse_cache: ParseCache) -> None:
+    stats = parse_cache.stats()
+    sys.stderr.write(
+        f"Parse cache: {stats.hits} hits ({stats.disk_hits} from disk), {stats.misses} misses\n"
+    )
+
+
+def report_outcomes(outcomes: Iterable[RenderOutcome], noun: str = "resumes", verb: str = "Rendered") -> int:
+    total = 0
+    failures = 0
+    for outcome in outcomes:
+        total += 1
+        elapsed = "" if outcome.elapsed_seconds is None else f" ({outcome.elapsed_seconds * 1000:.0f} ms)"
+        if outcome.succeeded:
+            target = f" -> {outcome.output_path}" if outcome.output_path else ""
+            sys.stdout.write(f"OK {outcome.source}{target}{elapsed}\n")
+        else:
+            failures += 1
+            sys.stderr.write(f"FAILED {outcome.source}: {outcome.error}{elapsed}\n")
+
+    sys.stdout.write(f"{verb} {total - failures}/{total} {noun}\n")
+    return 1 if failures else 0
+
+
+def positive_int(value: str) -> int:
     try:
-        resume_data = parse_resume_file(args.input)
-        render_resume_pdf(resume_data, args.output)
-        sys.exit(0)
-    except ResumeParseError as parse_error:
-        sys.stderr.write(f"Parse error: {parse_error}\n")
-        sys.exit(1)
-    except ResumeValidationError as validation_error:
-        sys.stderr.write(f"Validation error: {validation_error}\n")
-        sys.exit(1)
-    except Exception as unexpected_error:
-        sys.stderr.write(f"Unexpected error: {unexpected_error}\n")
-        sys.exit(1)
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -39,7 +338,167 @@ def parse_arguments() -> argparse.Namespace:
         default=DEFAULT_OUTPUT_PATH,
         help=f"Path for output PDF (default: {DEFAULT_OUTPUT_PATH})",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--validate-only",
+        action="store_true",
+        help="Parse and validate --input (or every --batch input) without rendering",
+    )
+    parser.add_argument(
+        "--fit-pages",
+        type=positive_int,
+        metavar="N",
+        help="Shrink fonts and spacing as little as needed for --input to fit on N pages",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="SOURCE",
+        help="Render many resumes: a directory, glob pattern or manifest file of YAML paths",
+    )
+    parser.add_argument(
+        "--variants",
+        metavar="SPEC",
+        help="Render every variant in the YAML SPEC file from the --input base resume",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=DEFAULT_BATCH_OUTPUT_DIR,
+        help=f"Directory for batch and variant output PDFs (default: {DEFAULT_BATCH_OUTPUT_DIR})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of render processes for batch, variant and server mode (default: 1)",
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Report batch results as they complete instead of in input order",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory for the rendered PDF cache; unchanged resumes are copied from it",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=positive_int,
+        default=DEFAULT_CACHE_MAX_MB,
+        help=f"Size limit of the render cache in MB (default: {DEFAULT_CACHE_MAX_MB})",
+    )
+    parser.add_argument(
+        "--cache-hard-link",
+        action="store_true",
+        help="Hard-link cached PDFs into place instead of copying them",
+    )
+    parser.add_argument(
+        "--parse-cache-dir",
+        help="Directory of parsed resumes reused across batch and watch runs while inputs are unchanged",
+    )
+    parser.add_argument(
+        "--parse-cache-hash",
+        action="store_true",
+        help="Match parse cache entries by content hash instead of modification time and size",
+    )
+    parser.add_argument(
+        "--deterministic",
+        action="store_true",
+        help=(
+            "Reproducible output: fixed dates (SOURCE_DATE_EPOCH when set), no render timestamp "
+            "and a document ID derived from the content, so identical input gives identical bytes"
+        ),
+    )
+    parser.add_argument(
+        "--themes",
+        metavar="FILE",
+        help="YAML file mapping theme names to font size, margin and column settings",
+    )
+    parser.add_argument(
+        "--theme",
+        default=DEFAULT_THEME_NAME,
+        help=f"Theme to render with; the server also accepts ?theme=NAME per request (default: {DEFAULT_THEME_NAME})",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=RENDER_ENGINES,
+        default=DEFAULT_RENDER_ENGINE,
+        help=(
+            "Layout engine: platypus flows ReportLab flowables, canvas draws the fixed layout "
+            f"directly and is several times faster (default: {DEFAULT_RENDER_ENGINE})"
+        ),
+    )
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSION_MODES,
+        default=DEFAULT_COMPRESSION,
+        help=(
+            "Page stream encoding: none, binary flate (smallest), or flate wrapped in ascii85 "
+            f"(7-bit safe) (default: {DEFAULT_COMPRESSION})"
+        ),
+    )
+    parser.add_argument(
+        "--strip-metadata",
+        action="store_true",
+        help="Keep only title and author in the document info, dropping fields that repeat page content",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-render --input whenever its content changes",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run a resident render server that accepts YAML or JSON payloads over HTTP",
+    )
+    parser.add_argument(
+        "--host",
+        default=DEFAULT_SERVER_HOST,
+        help=f"Server bind address (default: {DEFAULT_SERVER_HOST})",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=DEFAULT_SERVER_PORT,
+        help=f"Server TCP port (default: {DEFAULT_SERVER_PORT})",
+    )
+    parser.add_argument(
+        "--socket",
+        help="Serve on this Unix domain socket path instead of TCP",
+    )
+    parser.add_argument(
+        "--queue-limit",
+        type=positive_int,
+        default=DEFAULT_QUEUE_LIMIT,
+        help=f"Maximum queued or running renders before rejecting with 503 (default: {DEFAULT_QUEUE_LIMIT})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        help=f"Per-request render timeout in seconds (default: {DEFAULT_REQUEST_TIMEOUT_SECONDS:g})",
+    )
+    parser.add_argument(
+        "--timings",
+        nargs="?",
+        const="-",
+        metavar="PATH",
+        help="Emit per-stage wall and CPU times as JSON lines to PATH (default: stderr)",
+    )
+    parser.add_argument(
+        "--trace-allocations",
+        action="store_true",
+        help="Add tracemalloc allocation counts to --timings records; implies --timings (slower)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write a cProfile pstats dump of the run to PATH",
+    )
+    args = parser.parse_args()
+    if args.trace_allocations and not args.timings:
+        # Allocation counts only surface through the timings records.
+        args.timings = "-"
+    return args
 
 
 if __name__ == "__main__":
@@ -1,2 +1,43 @@
 DEFAULT_INPUT_PATH = "resume.yaml"
 DEFAULT_OUTPUT_PATH = "resume.pdf"
+DEFAULT_BATCH_OUTPUT_DIR = "output"
+DEFAULT_CACHE_MAX_MB = 512
+DEFAULT_THEME_NAME = "default"
+
+INPUT_FORMAT_YAML = "yaml"
+INPUT_FORMAT_JSON = "json"
+INPUT_FORMAT_MSGPACK = "msgpack"
+
+ENGINE_PLATYPUS = "platypus"
+ENGINE_CANVAS = "canvas"
+RENDER_ENGINES = (ENGINE_PLATYPUS, ENGINE_CANVAS)
+DEFAULT_RENDER_ENGINE = ENGINE_PLATYPUS
+
+COMPRESSION_NONE = "none"
+COMPRESSION_FLATE = "flate"
+COMPRESSION_ASCII85 = "ascii85"
+COMPRESSION_MODES = (COMPRESSION_NONE, COMPRESSION_FLATE, COMPRESSION_ASCII85)
+DEFAULT_COMPRESSION = COMPRESSION_ASCII85
+
+RENDERER_VERSION = "1"
+SOURCE_DATE_EPOCH_ENV = "SOURCE_DATE_EPOCH"
+
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8765
+DEFAULT_QUEUE_LIMIT = 64
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 30.0
+MAX_PAYLOAD_BYTES = 1024 * 1024
+
+DEFAULT_ASYNC_CONCURRENCY = 4
+
+DEFAULT_PARAGRAPH_CACHE_SIZE = 4096
+DEFAULT_SECTION_CACHE_SIZE = 256
+DEFAULT_WORD_WIDTH_CACHE_SIZE = 65536
+DEFAULT_PARSE_CACHE_SIZE = 1024
+# Bump when parsing or the resume models change shape, to orphan disk entries.
+PARSE_CACHE_VERSION = "1"
+
+DEFAULT_WATCH_POLL_SECONDS = 0.05
+
+DEFAULT_MIN_FIT_SCALE = 0.7
+FIT_SCALE_STEP = 0.01
@@ -1,127 +1,52 @@
+import hashlib
+from dataclasses import astuple, dataclass, fields, replace
+from functools import lru_cache
+
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.fonts import addMapping
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.platypus import TableStyle
 
-FONT_NAME = "Helvetica"
-FONT_NAME_BOLD = "Helvetica-Bold"
-FONT_NAME_ITALIC = "Helvetica-Oblique"
+from src.models.theme import DEFAULT_THEME, DEFAULT_THEME_NAME, Theme
+from src.utils.validators import ResumeValidationError
+
+FONT_NAME = DEFAULT_THEME.font_name
+FONT_NAME_BOLD = DEFAULT_THEME.font_name_bold
+FONT_NAME_ITALIC = DEFAULT_THEME.font_name_italic
 
-NAME_FONT_SIZE = 16
-CONTACT_FONT_SIZE = 9
-SECTION_HEADER_FONT_SIZE = 10.5
-COMPANY_ROLE_FONT_SIZE = 10
-DATE_LOCATION_FONT_SIZE = 9
-BULLET_FONT_SIZE = 9
-SKILLS_FONT_SIZE = 9
+NAME_FONT_SIZE = DEFAULT_THEME.name_font_size
+CONTACT_FONT_SIZE = DEFAULT_THEME.contact_font_size
+SECTION_HEADER_FONT_SIZE = DEFAULT_THEME.section_header_font_size
+COMPANY_ROLE_FONT_SIZE = DEFAULT_THEME.company_role_font_size
+DATE_LOCATION_FONT_SIZE = DEFAULT_THEME.date_location_font_size
+BULLET_FONT_SIZE = DEFAULT_THEME.bullet_font_size
+SKILLS_FONT_SIZE = DEFAULT_THEME.skills_font_size
 
 PAGE_WIDTH, PAGE_HEIGHT = letter
-PAGE_MARGIN = 36
+PAGE_MARGIN = DEFAULT_THEME.page_margin
 CONTENT_WIDTH = PAGE_WIDTH - (2 * PAGE_MARGIN)
+CONTENT_HEIGHT = PAGE_HEIGHT - (2 * PAGE_MARGIN)
 
-SECTION_SPACING = 4
-BULLET_SPACING = 1
+SECTION_SPACING = DEFAULT_THEME.section_spacing
+BULLET_SPACING = DEFAULT_THEME.bullet_spacing
 LINE_RULE_WIDTH = 0.5
+# Same tolerance ReportLab's Frame uses before rejecting a flowable.
+LAYOUT_FUZZ = 1e-6
+SECTION_RULE_SPACE_AFTER = 2
 
-LEFT_COLUMN_RATIO = 0.72
-RIGHT_COLUMN_RATIO = 0.28
-ITEM_VERTICAL_GAP = 3
+LEFT_COLUMN_RATIO = DEFAULT_THEME.left_column_ratio
+RIGHT_COLUMN_RATIO = DEFAULT_THEME.right_column_ratio
+TWO_COLUMN_WIDTHS = (CONTENT_WIDTH * LEFT_COLUMN_RATIO, CONTENT_WIDTH * RIGHT_COLUMN_RATIO)
+ITEM_VERTICAL_GAP = DEFAULT_THEME.item_vertical_gap
 
 EN_DASH = "\u2013"
 EM_DASH = "\u2014"
 BULLET_CHAR = "\u2022"
 CONTACT_SEPARATOR = " | "
 
-STYLE_NAME = ParagraphStyle(
-    name="ResumeName",
-    fontName=FONT_NAME_BOLD,
-    fontSize=NAME_FONT_SIZE,
-    alignment=TA_CENTER,
-    spaceAfter=1,
-    leading=NAME_FONT_SIZE + 2,
-)
-
-STYLE_CONTACT = ParagraphStyle(
-    name="ContactInfo",
-    fontName=FONT_NAME,
-    fontSize=CONTACT_FONT_SIZE,
-    alignment=TA_CENTER,
-    spaceAfter=2,
-    leading=CONTACT_FONT_SIZE + 2,
-)
-
-STYLE_SECTION_HEADER = ParagraphStyle(
-    name="SectionHeader",
-    fontName=FONT_NAME_BOLD,
-    fontSize=SECTION_HEADER_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=SECTION_SPACING,
-    spaceAfter=0,
-    leading=SECTION_HEADER_FONT_SIZE + 2,
-)
-
-STYLE_ROLE_LEFT = ParagraphStyle(
-    name="RoleLeft",
-    fontName=FONT_NAME_BOLD,
-    fontSize=COMPANY_ROLE_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=0,
-    spaceAfter=0,
-    leading=COMPANY_ROLE_FONT_SIZE + 2,
-)
-
-STYLE_DATE_RIGHT = ParagraphStyle(
-    name="DateRight",
-    fontName=FONT_NAME,
-    fontSize=COMPANY_ROLE_FONT_SIZE,
-    alignment=TA_RIGHT,
-    spaceBefore=0,
-    spaceAfter=0,
-    leading=COMPANY_ROLE_FONT_SIZE + 2,
-)
-
-STYLE_LOCATION_LEFT = ParagraphStyle(
-    name="LocationLeft",
-    fontName=FONT_NAME_ITALIC,
-    fontSize=DATE_LOCATION_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=0,
-    spaceAfter=0,
-    leading=DATE_LOCATION_FONT_SIZE + 2,
-)
-
-STYLE_BULLET = ParagraphStyle(
-    name="BulletText",
-    fontName=FONT_NAME,
-    fontSize=BULLET_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=BULLET_SPACING,
-    spaceAfter=0,
-    leading=BULLET_FONT_SIZE + 2,
-    leftIndent=6,
-    firstLineIndent=-6,
-)
-
-STYLE_SKILLS = ParagraphStyle(
-    name="SkillsText",
-    fontName=FONT_NAME,
-    fontSize=SKILLS_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=0,
-    spaceAfter=0,
-    leading=SKILLS_FONT_SIZE + 2,
-)
-
-STYLE_SUMMARY = ParagraphStyle(
-    name="Summary",
-    fontName=FONT_NAME,
-    fontSize=BULLET_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=0,
-    spaceAfter=0,
-    leading=BULLET_FONT_SIZE + 2,
-)
-
 TABLE_STYLE_DEFAULT = TableStyle([
     ("VALIGN", (0, 0), (-1, -1), "TOP"),
     ("LEFTPADDING", (0, 0), (-1, -1), 0),
@@ -130,22 +55,248 @@ TABLE_STYLE_DEFAULT = TableStyle([
     ("BOTTOMPADDING", (0, 0), (-1, -1), 0),
 ])
 
-STYLE_PROJECT_NAME = ParagraphStyle(
-    name="ProjectName",
-    fontName=FONT_NAME_BOLD,
-    fontSize=COMPANY_ROLE_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=0,
-    spaceAfter=0,
-    leading=COMPANY_ROLE_FONT_SIZE + 2,
-)
-
-STYLE_PROJECT_DETAIL = ParagraphStyle(
-    name="ProjectDetail",
-    fontName=FONT_NAME,
-    fontSize=BULLET_FONT_SIZE,
-    alignment=TA_LEFT,
-    spaceBefore=0,
-    spaceAfter=0,
-    leading=BULLET_FONT_SIZE + 2,
-)
+
+@dataclass(frozen=True, eq=False)
+class ResumeStyles:
+    key: str
+    name: ParagraphStyle
+    contact: ParagraphStyle
+    section_header: ParagraphStyle
+    role_left: ParagraphStyle
+    date_right: ParagraphStyle
+    location_row: ParagraphStyle
+    bullet: ParagraphStyle
+    skills: ParagraphStyle
+    summary: ParagraphStyle
+    project_name: ParagraphStyle
+    project_detail: ParagraphStyle
+    item_gap: float
+    rule_space_after: float
+    page_margin: float
+    content_width: float
+    content_height: float
+    column_widths: tuple[float, float]
+
+
+STYLES_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=STYLES_CACHE_SIZE)
+def build_resume_styles(theme: Theme = DEFAULT_THEME) -> ResumeStyles:
+    _register_font_files(theme)
+    _check_fonts(theme)
+    key = theme_key(theme)
+    # Paragraph caches key on the style name, so every theme needs its own.
+    suffix = "" if key == DEFAULT_THEME_NAME else f"[{key}]"
+    content_width = PAGE_WIDTH - (2 * theme.page_margin)
+    column_widths = (content_width * theme.left_column_ratio, content_width * theme.right_column_ratio)
+
+    location_left = ParagraphStyle(
+        name="LocationLeft" + suffix,
+        fontName=theme.font_name_italic,
+        fontSize=theme.date_location_font_size,
+        alignment=TA_LEFT,
+        spaceBefore=0,
+        spaceAfter=0,
+        leading=theme.date_location_font_size + 2,
+    )
+
+    return ResumeStyles(
+        key=key,
+        name=ParagraphStyle(
+            name="ResumeName" + suffix,
+            fontName=theme.font_name_bold,
+            fontSize=theme.name_font_size,
+            alignment=TA_CENTER,
+            spaceAfter=1,
+            leading=theme.name_font_size + 2,
+        ),
+        contact=ParagraphStyle(
+            name="ContactInfo" + suffix,
+            fontName=theme.font_name,
+            fontSize=theme.contact_font_size,
+            alignment=TA_CENTER,
+            spaceAfter=2,
+            leading=theme.contact_font_size + 2,
+        ),
+        section_header=ParagraphStyle(
+            name="SectionHeader" + suffix,
+            fontName=theme.font_name_bold,
+            fontSize=theme.section_header_font_size,
+            alignment=TA_LEFT,
+            spaceBefore=theme.section_spacing,
+            spaceAfter=0,
+            leading=theme.section_header_font_size + 2,
+        ),
+        role_left=ParagraphStyle(
+            name="RoleLeft" + suffix,
+            fontName=theme.font_name_bold,
+            fontSize=theme.company_role_font_size,
+            alignment=TA_LEFT,
+            spaceBefore=0,
+            spaceAfter=0,
+            leading=theme.company_role_font_size + 2,
+        ),
+        date_right=ParagraphStyle(
+            name="DateRight" + suffix,
+            fontName=theme.font_name,
+            fontSize=theme.company_role_font_size,
+            alignment=TA_RIGHT,
+            spaceBefore=0,
+            spaceAfter=0,
+            leading=theme.company_role_font_size + 2,
+        ),
+        location_row=ParagraphStyle(
+            name="LocationRow" + suffix,
+            parent=location_left,
+            rightIndent=column_widths[1],
+        ),
+        bullet=ParagraphStyle(
+            name="BulletText" + suffix,
+            fontName=theme.font_name,
+            fontSize=theme.bullet_font_size,
+            alignment=TA_LEFT,
+            spaceBefore=theme.bullet_spacing,
+            spaceAfter=0,
+            leading=theme.bullet_font_size + 2,
+            leftIndent=6,
+            firstLineIndent=-6,
+        ),
+        skills=ParagraphStyle(
+            name="SkillsText" + suffix,
+            fontName=theme.font_name,
+            fontSize=theme.skills_font_size,
+            alignment=TA_LEFT,
+            spaceBefore=0,
+            spaceAfter=0,
+            leading=theme.skills_font_size + 2,
+        ),
+        summary=ParagraphStyle(
+            name="Summary" + suffix,
+            fontName=theme.font_name,
+            fontSize=theme.bullet_font_size,
+            alignment=TA_LEFT,
+            spaceBefore=0,
+            spaceAfter=0,
+            leading=theme.bullet_font_size + 2,
+        ),
+        project_name=ParagraphStyle(
+            name="ProjectName" + suffix,
+            fontName=theme.font_name_bold,
+            fontSize=theme.company_role_font_size,
+            alignment=TA_LEFT,
+            spaceBefore=0,
+            spaceAfter=0,
+            leading=theme.company_role_font_size + 2,
+        ),
+        project_detail=ParagraphStyle(
+            name="ProjectDetail" + suffix,
+            fontName=theme.font_name,
+            fontSize=theme.bullet_font_size,
+            alignment=TA_LEFT,
+            spaceBefore=0,
+            spaceAfter=0,
+            leading=theme.bullet_font_size + 2,
+        ),
+        item_gap=theme.item_vertical_gap,
+        rule_space_after=SECTION_RULE_SPACE_AFTER,
+        page_margin=theme.page_margin,
+        content_width=content_width,
+        content_height=PAGE_HEIGHT - (2 * theme.page_margin),
+        column_widths=column_widths,
+    )
+
+
+def theme_key(theme: Theme) -> str:
+    if theme == DEFAULT_THEME:
+        return DEFAULT_THEME_NAME
+    digest = hashlib.sha256(repr(astuple(theme)).encode("utf-8")).hexdigest()[:12]
+    return f"{theme.name}-{digest}"
+
+
+def _register_font_files(theme: Theme) -> None:
+    font_files = (
+        (theme.font_name, theme.font_file),
+        (theme.font_name_bold, theme.font_file_bold),
+        (theme.font_name_italic, theme.font_file_italic),
+    )
+    errors = []
+    for font_name, font_file in font_files:
+        if not font_file:
+            continue
+        if font_name in pdfmetrics.standardFonts:
+            errors.append(f"Font file '{font_file}' needs its own font name, not built-in '{font_name}'")
+            continue
+        try:
+            _load_font_file(font_name, font_file)
+        except Exception as error:
+            errors.append(f"Cannot load font file '{font_file}': {error}")
+    if errors:
+        raise ResumeValidationError(errors)
+    if theme.font_file:
+        # <b>/<i> markup and the canvas engine find variants through the family map.
+        # Bold-italic borrows the bold face and is mapped first so the bold
+        # face still reads back as plain bold.
+        family = theme.font_name
+        addMapping(family, 1, 1, theme.font_name_bold)
+        addMapping(family, 0, 0, theme.font_name)
+        addMapping(family, 1, 0, theme.font_name_bold)
+        addMapping(family, 0, 1, theme.font_name_italic)
+
+
+@lru_cache(maxsize=None)
+def _load_font_file(font_name: str, font_file: str) -> None:
+    # ReportLab embeds only the glyphs each document uses from a TTFont.
+    pdfmetrics.registerFont(TTFont(font_name, font_file))
+
+
+def _check_fonts(theme: Theme) -> None:
+    unknown_fonts = []
+    for font_name in (theme.font_name, theme.font_name_bold, theme.font_name_italic):
+        try:
+            pdfmetrics.getFont(font_name)
+        except KeyError:
+            unknown_fonts.append(f"Unknown font: '{font_name}'")
+    if unknown_fonts:
+        raise ResumeValidationError(unknown_fonts)
+
+
+DEFAULT_RESUME_STYLES = build_resume_styles(DEFAULT_THEME)
+
+STYLE_NAME = DEFAULT_RESUME_STYLES.name
+STYLE_CONTACT = DEFAULT_RESUME_STYLES.contact
+STYLE_SECTION_HEADER = DEFAULT_RESUME_STYLES.section_header
+STYLE_ROLE_LEFT = DEFAULT_RESUME_STYLES.role_left
+STYLE_DATE_RIGHT = DEFAULT_RESUME_STYLES.date_right
+STYLE_LOCATION_ROW = DEFAULT_RESUME_STYLES.location_row
+STYLE_LOCATION_LEFT = STYLE_LOCATION_ROW.parent
+STYLE_BULLET = DEFAULT_RESUME_STYLES.bullet
+STYLE_SKILLS = DEFAULT_RESUME_STYLES.skills
+STYLE_SUMMARY = DEFAULT_RESUME_STYLES.summary
+STYLE_PROJECT_NAME = DEFAULT_RESUME_STYLES.project_name
+STYLE_PROJECT_DETAIL = DEFAULT_RESUME_STYLES.project_detail
+
+# Vertical metrics only: margins, column widths and the indents that line up
+# the two-column rows stay fixed so a scaled resume keeps its page geometry.
+SCALED_STYLE_ATTRIBUTES = ("fontSize", "leading", "spaceBefore", "spaceAfter", "leftIndent", "firstLineIndent")
+SCALED_SPACING_FIELDS = ("item_gap", "rule_space_after")
+
+
+@lru_cache(maxsize=STYLES_CACHE_SIZE)
+def scale_resume_styles(styles: ResumeStyles, scale: float) -> ResumeStyles:
+    if scale == 1:
+        return styles
+    scaled = {}
+    for field in fields(styles):
+        value = getattr(styles, field.name)
+        if isinstance(value, ParagraphStyle):
+            scaled[field.name] = _scale_paragraph_style(value, scale)
+        elif field.name in SCALED_SPACING_FIELDS:
+            scaled[field.name] = value * scale
+    return replace(styles, key=f"{styles.key}@{scale:g}", **scaled)
+
+
+def _scale_paragraph_style(style: ParagraphStyle, scale: float) -> ParagraphStyle:
+    # Paragraph caches key on the style name, so every scaled set needs its own.
+    overrides = {attribute: getattr(style, attribute) * scale for attribute in SCALED_STYLE_ATTRIBUTES}
+    return ParagraphStyle(name=f"{style.name}@{scale:g}", parent=style, **overrides)
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+
+from src.models.resume_data import ContactInfo, Education, Experience, Project, ResumeData, SkillCategory
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenContactInfo:
+    name: str
+    email: str
+    phone: str | None = None
+    linkedin: str | None = None
+    github: str | None = None
+    leetcode: str | None = None
+    location: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenSkillCategory:
+    category: str
+    items: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenExperience:
+    company: str
+    role: str
+    location: str
+    start_date: str
+    end_date: str
+    bullets: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenEducation:
+    degree: str
+    university: str
+    start_date: str
+    end_date: str
+    details: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenProject:
+    name: str
+    description: str = ""
+    tech_stack: tuple[str, ...] = ()
+    link: str | None = None
+    bullets: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class FrozenResumeData:
+    contact: FrozenContactInfo
+    summary: str
+    skills: tuple[FrozenSkillCategory, ...] = ()
+    experience: tuple[FrozenExperience, ...] = ()
+    education: tuple[FrozenEducation, ...] = ()
+    projects: tuple[FrozenProject, ...] = ()
+
+
+def freeze_resume_data(resume_data: ResumeData) -> FrozenResumeData:
+    return FrozenResumeData(
+        contact=freeze_contact(resume_data.contact),
+        summary=resume_data.summary,
+        skills=freeze_skills(resume_data.skills),
+        experience=freeze_experience(resume_data.experience),
+        education=freeze_education(resume_data.education),
+        projects=freeze_projects(resume_data.projects),
+    )
+
+
+def freeze_contact(contact: ContactInfo) -> FrozenContactInfo:
+    return FrozenContactInfo(**asdict(contact))
+
+
+def freeze_skills(skills: list[SkillCategory]) -> tuple[FrozenSkillCategory, ...]:
+    return tuple(FrozenSkillCategory(skill.category, tuple(skill.items)) for skill in skills)
+
+
+def freeze_experience(experience: list[Experience]) -> tuple[FrozenExperience, ...]:
+    return tuple(
+        FrozenExperience(
+            exp.company, exp.role, exp.location, exp.start_date, exp.end_date,
+            tuple(exp.bullets),
+        )
+        for exp in experience
+    )
+
+
+def freeze_education(education: list[Education]) -> tuple[FrozenEducation, ...]:
+    return tuple(
+        FrozenEducation(
+            edu.degree, edu.university, edu.start_date, edu.end_date,
+            tuple(edu.details),
+        )
+        for edu in education
+    )
+
+
+def freeze_projects(projects: list[Project]) -> tuple[FrozenProject, ...]:
+    return tuple(
+        FrozenProject(
+            proj.name, proj.description, tuple(proj.tech_stack), proj.link,
+            tuple(proj.bullets),
+        )
+        for proj in projects
+    )
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.models.resume_data import ResumeData
+
+
+@dataclass
+class RenderJob:
+    source: str
+    resume_data: ResumeData
+    output_path: str
+
+
+@dataclass
+class RenderOutcome:
+    source: str
+    output_path: str | None = None
+    error: str | None = None
+    elapsed_seconds: float | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
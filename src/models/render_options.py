@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.core.settings import DEFAULT_COMPRESSION, DEFAULT_RENDER_ENGINE
+from src.models.theme import DEFAULT_THEME, Theme
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    deterministic: bool = False
+    style_scale: float = 1.0
+    theme: Theme = DEFAULT_THEME
+    engine: str = DEFAULT_RENDER_ENGINE
+    compression: str = DEFAULT_COMPRESSION
+    strip_metadata: bool = False
+
+
+DEFAULT_RENDER_OPTIONS = RenderOptions()
@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactInfo:
     name: str
     email: str
@@ -14,13 +14,13 @@ class ContactInfo:
     location: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillCategory:
     category: str
     items: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Experience:
     company: str
     role: str
@@ -30,7 +30,7 @@ class Experience:
     bullets: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Education:
     degree: str
     university: str
@@ -39,7 +39,7 @@ class Education:
     details: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     name: str
     description: str = ""
@@ -48,7 +48,7 @@ class Project:
     bullets: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeData:
     contact: ContactInfo
     summary: str
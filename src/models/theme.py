@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.core.settings import DEFAULT_THEME_NAME
+
+
+@dataclass(frozen=True)
+class Theme:
+    name: str = DEFAULT_THEME_NAME
+    font_name: str = "Helvetica"
+    font_name_bold: str = "Helvetica-Bold"
+    font_name_italic: str = "Helvetica-Oblique"
+    font_file: str = ""
+    font_file_bold: str = ""
+    font_file_italic: str = ""
+    name_font_size: float = 16
+    contact_font_size: float = 9
+    section_header_font_size: float = 10.5
+    company_role_font_size: float = 10
+    date_location_font_size: float = 9
+    bullet_font_size: float = 9
+    skills_font_size: float = 9
+    page_margin: float = 36
+    section_spacing: float = 4
+    bullet_spacing: float = 1
+    item_vertical_gap: float = 3
+    left_column_ratio: float = 0.72
+    right_column_ratio: float = 0.28
+
+
+DEFAULT_THEME = Theme()
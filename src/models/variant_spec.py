@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    name: str
+    summary: str | None = None
+    skill_categories: tuple[str, ...] | None = None
+    include_skills: tuple[str, ...] | None = None
+    exclude_skills: tuple[str, ...] = ()
+    experience_order: tuple[str, ...] = ()
+    projects: tuple[str, ...] | None = None
+    max_bullets: int | None = None
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from functools import partial
+
+from src.core.settings import DEFAULT_ASYNC_CONCURRENCY
+from src.models.render_options import RenderOptions
+from src.models.resume_data import ResumeData
+from src.services.pdf_renderer import render_resume_pdf, render_resume_pdf_bytes
+from src.services.yaml_parser import parse_resume_file, parse_resume_text
+
+
+async def async_parse_resume(filepath: str, executor: Executor | None = None) -> ResumeData:
+    return await _run_blocking(executor, parse_resume_file, filepath)
+
+
+async def async_parse_resume_text(text: str, executor: Executor | None = None) -> ResumeData:
+    return await _run_blocking(executor, parse_resume_text, text)
+
+
+async def async_render_resume_pdf(
+    resume_data: ResumeData,
+    output_path: str,
+    options: RenderOptions | None = None,
+    executor: Executor | None = None,
+) -> None:
+    await _run_blocking(executor, render_resume_pdf, resume_data, output_path, options)
+
+
+async def async_render_resume_pdf_bytes(
+    resume_data: ResumeData,
+    options: RenderOptions | None = None,
+    executor: Executor | None = None,
+) -> bytes:
+    return await _run_blocking(executor, render_resume_pdf_bytes, resume_data, options)
+
+
+class AsyncRenderer:
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+        options: RenderOptions | None = None,
+    ) -> None:
+        self.executor = executor
+        self.options = options
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def parse(self, filepath: str) -> ResumeData:
+        return await self._run_in_slot(parse_resume_file, filepath)
+
+    async def parse_text(self, text: str) -> ResumeData:
+        return await self._run_in_slot(parse_resume_text, text)
+
+    async def render(self, resume_data: ResumeData, output_path: str) -> None:
+        await self._run_in_slot(render_resume_pdf, resume_data, output_path, self.options)
+
+    async def render_bytes(self, resume_data: ResumeData) -> bytes:
+        return await self._run_in_slot(render_resume_pdf_bytes, resume_data, self.options)
+
+    async def _run_in_slot(self, function, *args):
+        # The slot follows the executor job, not the awaiting task: a running
+        # job cannot be interrupted, so cancelling the caller must not free its
+        # slot early. Shielding lets the job finish and release it.
+        await self._semaphore.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, partial(function, *args))
+        except BaseException:
+            self._semaphore.release()
+            raise
+        future.add_done_callback(self._release_slot)
+        return await asyncio.shield(future)
+
+    def _release_slot(self, future: asyncio.Future) -> None:
+        self._semaphore.release()
+        if not future.cancelled():
+            # Mark an abandoned job's error as retrieved so asyncio does not log it.
+            future.exception()
+
+
+async def _run_blocking(executor: Executor | None, function, *args):
+    # Cancelling the awaiting task cancels the executor job if it has not started yet.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(function, *args))
@@ -0,0 +1,454 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+from typing import Callable, Union
+
+from reportlab.lib.enums import TA_CENTER, TA_RIGHT
+from reportlab.lib.fonts import ps2tt, tt2ps
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen.canvas import Canvas
+
+from src.core.settings import DEFAULT_WORD_WIDTH_CACHE_SIZE
+from src.core.styles import (
+    BULLET_CHAR,
+    CONTACT_SEPARATOR,
+    EM_DASH,
+    EN_DASH,
+    LAYOUT_FUZZ,
+    LINE_RULE_WIDTH,
+    ResumeStyles,
+)
+from src.models.resume_data import ContactInfo, Education, Experience, Project, SkillCategory
+
+# The fixed resume layout drawn straight onto a canvas. Blocks follow the
+# Platypus rules the flowable engine relies on (greedy word wrap, first
+# baseline at height - fontSize, collapsed spaceAfter/spaceBefore, paragraph
+# splits without orphans) so both engines place every line at the same spot.
+ROUND_LINE_CAP = 1
+
+Word = tuple[str, str]
+Line = tuple[float, list[Word]]
+
+
+class TextBlock:
+    def __init__(self, words: list[Word], style: ParagraphStyle, first_line_indent: float | None = None) -> None:
+        self.words = words
+        self.style = style
+        self.first_line_indent = style.firstLineIndent if first_line_indent is None else first_line_indent
+        self.space_before = style.spaceBefore
+        self.space_after = style.spaceAfter
+        self.lines: list[Line] = []
+        self.width = None
+        self.height = 0.0
+
+    def wrap(self, width: float) -> float:
+        if width != self.width:
+            style = self.style
+            indent = style.leftIndent + style.rightIndent
+            self.lines = break_lines(
+                self.words, style.fontSize,
+                width - indent - self.first_line_indent, width - indent,
+                style.spaceShrinkage,
+            )
+            self.width = width
+            self.height = len(self.lines) * style.leading
+        return self.height
+
+    def split(self, width: float, available: float) -> list[TextBlock]:
+        self.wrap(width)
+        line_count = int(available / self.style.leading)
+        # Like Paragraph.split: never leave a lone first line behind.
+        if line_count <= 1 or line_count >= len(self.lines):
+            return []
+        return [self._part(self.lines[:line_count], self.first_line_indent), self._part(self.lines[line_count:], 0)]
+
+    def draw(self, page: PageWriter, x: float, y: float) -> None:
+        style = self.style
+        baseline = y + self.height - style.fontSize
+        for index, (line_width, words) in enumerate(self.lines):
+            indent = style.leftIndent + (self.first_line_indent if index == 0 else 0)
+            free_space = self.width - indent - style.rightIndent - line_width
+            word_space = 0.0
+            if free_space < -LAYOUT_FUZZ and len(words) > 1:
+                # An overfull line squeezes its spaces back to the column width.
+                word_space = free_space / (len(words) - 1)
+            elif style.alignment == TA_CENTER:
+                indent += free_space / 2
+            elif style.alignment == TA_RIGHT:
+                indent += free_space
+            page.draw_line(words, style.fontSize, x + indent, baseline - index * style.leading, word_space)
+
+    def _part(self, lines: list[Line], first_line_indent: float) -> TextBlock:
+        part = TextBlock([word for _, line_words in lines for word in line_words], self.style, first_line_indent)
+        part.lines = lines
+        part.width = self.width
+        part.height = len(lines) * self.style.leading
+        return part
+
+
+class ColumnRow:
+    space_before = 0.0
+    space_after = 0.0
+
+    def __init__(self, left: TextBlock, right: TextBlock, column_widths: tuple[float, float]) -> None:
+        self.left = left
+        self.right = right
+        self.column_widths = column_widths
+        self.height = 0.0
+
+    def wrap(self, width: float) -> float:
+        left_width, right_width = self.column_widths
+        self.height = max(self.left.wrap(left_width), self.right.wrap(right_width))
+        return self.height
+
+    def split(self, width: float, available: float) -> list:
+        return []
+
+    def draw(self, page: PageWriter, x: float, y: float) -> None:
+        self.left.draw(page, x, y + self.height - self.left.height)
+        self.right.draw(page, x + self.column_widths[0], y + self.height - self.right.height)
+
+
+class RuleBlock:
+    space_before = 0.0
+
+    def __init__(self, space_after: float) -> None:
+        self.space_after = space_after
+        self.width = 0.0
+
+    def wrap(self, width: float) -> float:
+        self.width = width
+        return LINE_RULE_WIDTH
+
+    def split(self, width: float, available: float) -> list:
+        return []
+
+    def draw(self, page: PageWriter, x: float, y: float) -> None:
+        page.canvas.line(x, y, x + self.width, y)
+
+
+class GapBlock:
+    space_before = 0.0
+    space_after = 0.0
+
+    def __init__(self, height: float) -> None:
+        self.height = height
+
+    def wrap(self, width: float) -> float:
+        return self.height
+
+    def split(self, width: float, available: float) -> list:
+        return []
+
+    def draw(self, page: PageWriter, x: float, y: float) -> None:
+        pass
+
+
+Block = Union[TextBlock, ColumnRow, RuleBlock, GapBlock]
+
+
+def break_lines(
+    words: list[Word],
+    font_size: float,
+    first_width: float,
+    width: float,
+    space_shrinkage: float = 0.0,
+) -> list[Line]:
+    lines = []
+    line: list[Word] = []
+    line_width = 0.0
+    max_width = first_width
+    # Pieces of a split word are flagged so they are never split again.
+    pending = deque((font_name, word, False) for font_name, word in words)
+    end_line_after_word = False
+    while pending:
+        font_name, word, is_piece = pending.popleft()
+        word_width = text_width(word, font_name, font_size)
+        space_width = text_width(" ", font_name, font_size)
+        new_width = line_width + space_width + word_width if line else word_width
+        # Paragraph lets each space give up a fraction of its width before it
+        # starts a new line.
+        overflows = new_width > max_width + space_shrinkage * space_width * len(line)
+        if overflows and not (is_piece or end_line_after_word) and word_width > max_width:
+            start_width = line_width + space_width if line else 0.0
+            pieces = _split_word(word, font_name, font_size, start_width, max_width, width)
+            pending.extendleft((font_name, piece, True) for piece in reversed(pieces))
+            end_line_after_word = True
+            continue
+        if end_line_after_word:
+            # The head of a split word fills the rest of the current line.
+            if word:
+                line.append((font_name, word))
+            lines.append((new_width, line))
+            line = []
+            line_width = 0.0
+            max_width = width
+            end_line_after_word = False
+            continue
+        if overflows and line:
+            lines.append((line_width, line))
+            line = []
+            new_width = word_width
+            max_width = width
+        line.append((font_name, word))
+        line_width = new_width
+    if line:
+        lines.append((line_width, line))
+    return lines
+
+
+def _split_word(
+    word: str,
+    font_name: str,
+    font_size: float,
+    line_width: float,
+    max_width: float,
+    next_width: float,
+) -> list[str]:
+    # Splits character by character as Paragraph does for splitLongWords, so
+    # long URLs and tech stacks wrap instead of running off the page.
+    pieces = []
+    piece = ""
+    for char in word:
+        char_width = text_width(char, font_name, font_size)
+        new_width = line_width + char_width
+        if new_width > max_width and (piece or char_width <= next_width):
+            pieces.append(piece)
+            max_width = next_width
+            new_width = char_width
+            piece = ""
+        piece += char
+        line_width = new_width
+    pieces.append(piece)
+    return pieces
+
+
+def text_width(text: str, font_name: str, font_size: float) -> float:
+    return _unit_width(text, font_name) * font_size
+
+
+@lru_cache(maxsize=DEFAULT_WORD_WIDTH_CACHE_SIZE)
+def _unit_width(text: str, font_name: str) -> float:
+    # Resumes reuse a small vocabulary across lines, sections and documents,
+    # and ReportLab measures Type 1 text in pure Python.
+    return stringWidth(text, font_name, 1)
+
+
+class PageWriter:
+    # All text on a page goes through one text object, so a font is only
+    # re-selected when it actually changes.
+    def __init__(self, canvas: Canvas) -> None:
+        self.canvas = canvas
+        self._start_page()
+
+    def draw_line(self, words: list[Word], font_size: float, x: float, y: float, word_space: float = 0.0) -> None:
+        text = self._text
+        if word_space:
+            text.setWordSpace(word_space)
+        text.setTextOrigin(x, y)
+        start = 0
+        while start < len(words):
+            font_name = words[start][0]
+            end = start + 1
+            while end < len(words) and words[end][0] == font_name:
+                end += 1
+            if (font_name, font_size) != self._font:
+                text.setFont(font_name, font_size)
+                self._font = (font_name, font_size)
+            # Later runs carry their leading space and continue from where the
+            # previous run left the text cursor, as Paragraph draws them.
+            run = " ".join(word for _, word in words[start:end])
+            text.textOut(" " + run if start else run)
+            start = end
+        if word_space:
+            text.setWordSpace(0)
+
+    def next_page(self) -> None:
+        self.finish()
+        self.canvas.showPage()
+        self._start_page()
+
+    def finish(self) -> None:
+        self.canvas.drawText(self._text)
+
+    def _start_page(self) -> None:
+        self.canvas.setLineWidth(LINE_RULE_WIDTH)
+        self.canvas.setLineCap(ROUND_LINE_CAP)
+        self._text = self.canvas.beginText()
+        self._font = None
+
+
+def draw_blocks(canvas: Canvas, blocks: list[Block], styles: ResumeStyles) -> None:
+    frame = _Frame(PageWriter(canvas), styles)
+    pending = deque(blocks)
+    while pending:
+        block = pending.popleft()
+        space_before = frame.space_before(block)
+        available = frame.remaining - space_before
+        if available > 0:
+            height = block.wrap(frame.width)
+            if space_before + height <= frame.remaining + LAYOUT_FUZZ:
+                frame.place(block, space_before + height)
+                continue
+            parts = block.split(frame.width, available)
+            if parts:
+                pending.extendleft(reversed(parts))
+                continue
+            if frame.at_top:
+                # Taller than an empty page and unsplittable: draw it from the
+                # top and let it overrun the margin rather than loop forever.
+                frame.place(block, height)
+                continue
+        frame.next_page()
+        pending.appendleft(block)
+    frame.page.finish()
+
+
+class _Frame:
+    def __init__(self, page: PageWriter, styles: ResumeStyles) -> None:
+        self.page = page
+        self.left = styles.page_margin
+        self.bottom = styles.page_margin
+        self.width = styles.content_width
+        self.height = styles.content_height
+        self.remaining = self.height
+        self.at_top = True
+        self.previous_space_after = 0.0
+
+    def space_before(self, block: Block) -> float:
+        if self.at_top:
+            return 0.0
+        return max(block.space_before - self.previous_space_after, 0.0)
+
+    def place(self, block: Block, height: float) -> None:
+        self.remaining -= height
+        block.draw(self.page, self.left, self.bottom + self.remaining)
+        self.remaining -= block.space_after
+        self.previous_space_after = block.space_after
+        if height + block.space_after:
+            self.at_top = False
+
+    def next_page(self) -> None:
+        self.page.next_page()
+        self.remaining = self.height
+        self.at_top = True
+        self.previous_space_after = 0.0
+
+
+def build_section_blocks(section_name: str, section_input: object, styles: ResumeStyles) -> list[Block]:
+    return _SECTION_BUILDERS[section_name](section_input, styles)
+
+
+@lru_cache(maxsize=None)
+def font_variant(font_name: str, bold: bool = False, italic: bool = False) -> str:
+    # The same family lookup Paragraph markup uses for <b> and <i>.
+    family, is_bold, is_italic = ps2tt(font_name)
+    return tt2ps(family, is_bold or bold, is_italic or italic)
+
+
+def _words(text: str, font_name: str) -> list[Word]:
+    return [(font_name, word) for word in text.split()]
+
+
+def _text_block(text: str, style: ParagraphStyle) -> TextBlock:
+    return TextBlock(_words(text, style.fontName), style)
+
+
+def _bullet_block(text: str, style: ParagraphStyle) -> TextBlock:
+    return _text_block(f"{BULLET_CHAR} {text}", style)
+
+
+def _labelled_block(label: str, text: str, style: ParagraphStyle) -> TextBlock:
+    return TextBlock(_words(label, font_variant(style.fontName, bold=True)) + _words(text, style.fontName), style)
+
+
+def _build_contact_header(contact: ContactInfo, styles: ResumeStyles) -> list[Block]:
+    contact_parts = [contact.email]
+    for part in (contact.phone, contact.linkedin, contact.github, contact.leetcode, contact.location):
+        if part:
+            contact_parts.append(part)
+    return [
+        _text_block(contact.name, styles.name),
+        _text_block(CONTACT_SEPARATOR.join(contact_parts), styles.contact),
+    ]
+
+
+def _build_section_header(title: str, styles: ResumeStyles) -> list[Block]:
+    return [_text_block(title.upper(), styles.section_header), RuleBlock(styles.rule_space_after)]
+
+
+def _build_summary_section(summary: str, styles: ResumeStyles) -> list[Block]:
+    return _build_section_header("Summary", styles) + [_text_block(summary, styles.summary)]
+
+
+def _build_skills_section(skills: list[SkillCategory], styles: ResumeStyles) -> list[Block]:
+    blocks = _build_section_header("Skills", styles)
+    for skill_category in skills:
+        blocks.append(_labelled_block(f"{skill_category.category}:", ", ".join(skill_category.items), styles.skills))
+    return blocks
+
+
+def _build_list_section(title: str, items: list, build_single_item: Callable, styles: ResumeStyles) -> list[Block]:
+    blocks = _build_section_header(title, styles)
+    for index, item in enumerate(items):
+        if index > 0:
+            blocks.append(GapBlock(styles.item_gap))
+        blocks.extend(build_single_item(item, styles))
+    return blocks
+
+
+def _build_dated_row(title: str, detail: str, start_date: str, end_date: str, styles: ResumeStyles) -> ColumnRow:
+    left = _labelled_block(title, f"{EM_DASH} {detail}", styles.role_left)
+    right = _text_block(f"{start_date} {EN_DASH} {end_date}", styles.date_right)
+    return ColumnRow(left, right, styles.column_widths)
+
+
+def _build_single_experience(exp: Experience, styles: ResumeStyles) -> list[Block]:
+    location_font = font_variant(styles.location_row.fontName, italic=True)
+    blocks = [
+        _build_dated_row(exp.company, exp.role, exp.start_date, exp.end_date, styles),
+        TextBlock(_words(exp.location, location_font), styles.location_row),
+    ]
+    blocks.extend(_bullet_block(bullet, styles.bullet) for bullet in exp.bullets)
+    return blocks
+
+
+def _build_single_education(edu: Education, styles: ResumeStyles) -> list[Block]:
+    blocks = [_build_dated_row(edu.university, edu.degree, edu.start_date, edu.end_date, styles)]
+    blocks.extend(_bullet_block(detail, styles.bullet) for detail in edu.details)
+    return blocks
+
+
+def _build_single_project(proj: Project, styles: ResumeStyles) -> list[Block]:
+    link = f"| {proj.link}" if proj.link else ""
+    blocks = [_labelled_block(proj.name, link, styles.project_name)]
+    if proj.description:
+        blocks.append(_text_block(proj.description, styles.project_detail))
+    blocks.extend(_bullet_block(bullet, styles.bullet) for bullet in proj.bullets)
+    if proj.tech_stack:
+        blocks.append(_labelled_block("Tech:", ", ".join(proj.tech_stack), styles.project_detail))
+    return blocks
+
+
+def _build_experience_section(experiences: list[Experience], styles: ResumeStyles) -> list[Block]:
+    return _build_list_section("Experience", experiences, _build_single_experience, styles)
+
+
+def _build_education_section(education: list[Education], styles: ResumeStyles) -> list[Block]:
+    return _build_list_section("Education", education, _build_single_education, styles)
+
+
+def _build_projects_section(projects: list[Project], styles: ResumeStyles) -> list[Block]:
+    return _build_list_section("Projects", projects, _build_single_project, styles)
+
+
+_SECTION_BUILDERS = {
+    "contact": _build_contact_header,
+    "summary": _build_summary_section,
+    "skills": _build_skills_section,
+    "experience": _build_experience_section,
+    "projects": _build_projects_section,
+    "education": _build_education_section,
+}
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Flowable, HRFlowable, Paragraph, Spacer
+
+from src.core.styles import ITEM_VERTICAL_GAP, LINE_RULE_WIDTH, SECTION_RULE_SPACE_AFTER, TWO_COLUMN_WIDTHS
+from src.services.paragraph_cache import DEFAULT_PARAGRAPH_CACHE
+
+# Flowable instances carry per-layout state (the canvas while drawing, the
+# "postponed" marker when pushed to the next frame), so only their immutable
+# ingredients are shared and each document gets fresh, cheap instances.
+SECTION_RULE_OPTIONS = {
+    "width": "100%",
+    "thickness": LINE_RULE_WIDTH,
+    "color": "black",
+    "spaceAfter": SECTION_RULE_SPACE_AFTER,
+    "spaceBefore": 0,
+}
+
+
+class TwoColumnRow(Flowable):
+    def __init__(
+        self,
+        left: Flowable,
+        right: Flowable,
+        column_widths: tuple[float, float] = TWO_COLUMN_WIDTHS,
+    ) -> None:
+        super().__init__()
+        self.left = left
+        self.right = right
+        self.column_widths = column_widths
+
+    def wrap(self, availWidth: float, availHeight: float) -> tuple[float, float]:
+        left_width, right_width = self.column_widths
+        self._left_height = self.left.wrap(left_width, availHeight)[1]
+        self._right_height = self.right.wrap(right_width, availHeight)[1]
+        self.width = left_width + right_width
+        self.height = max(self._left_height, self._right_height)
+        return self.width, self.height
+
+    def draw(self) -> None:
+        self.left.drawOn(self.canv, 0, self.height - self._left_height)
+        self.right.drawOn(self.canv, self.column_widths[0], self.height - self._right_height)
+
+
+def build_paragraph(text: str, style: ParagraphStyle) -> Paragraph:
+    return DEFAULT_PARAGRAPH_CACHE.paragraph(text, style)
+
+
+def build_section_rule(space_after: float = SECTION_RULE_SPACE_AFTER) -> HRFlowable:
+    return HRFlowable(**{**SECTION_RULE_OPTIONS, "spaceAfter": space_after})
+
+
+def build_item_gap(height: float = ITEM_VERTICAL_GAP) -> Spacer:
+    return Spacer(1, height)
+
+
+def build_two_column_row(
+    left_text: str,
+    left_style: ParagraphStyle,
+    right_text: str,
+    right_style: ParagraphStyle,
+    column_widths: tuple[float, float] = TWO_COLUMN_WIDTHS,
+) -> TwoColumnRow:
+    return TwoColumnRow(
+        build_paragraph(left_text, left_style),
+        build_paragraph(right_text, right_style),
+        column_widths,
+    )
+
+
+def reset_layout_state(flowables: list) -> None:
+    # Reused flowables must not carry the "already postponed once" marker from a
+    # previous build, or ReportLab reports them as too large for any frame.
+    for flowable in flowables:
+        flowable.__dict__.pop("_postponed", None)
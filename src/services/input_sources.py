@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import glob
+import os
+from collections import Counter
+
+from src.services.yaml_parser import ResumeParseError, resume_file_extensions
+
+PDF_EXTENSION = ".pdf"
+
+
+def resolve_resume_inputs(source: str) -> list[str]:
+    if os.path.isdir(source):
+        paths = _list_resume_directory(source)
+    elif os.path.isfile(source) and not _is_resume_path(source):
+        paths = _read_manifest(source)
+    else:
+        paths = sorted(glob.glob(source, recursive=True))
+
+    if not paths:
+        raise ResumeParseError(f"No resume files found for: {source}")
+
+    return paths
+
+
+def build_output_path(input_path: str, output_dir: str, input_root: str | None = None) -> str:
+    if input_root is None:
+        relative_path = os.path.basename(input_path)
+    else:
+        relative_path = os.path.relpath(os.path.abspath(input_path), input_root)
+    stem = os.path.splitext(relative_path)[0]
+    return os.path.join(output_dir, stem + PDF_EXTENSION)
+
+
+def build_output_paths(input_paths: list[str], output_dir: str) -> list[str]:
+    # Mirror the layout below the inputs' common directory, so same-named
+    # files from different folders get separate PDFs.
+    if not input_paths:
+        return []
+    input_root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in input_paths])
+    return [build_output_path(input_path, output_dir, input_root) for input_path in input_paths]
+
+
+def find_output_conflicts(output_paths: list[str]) -> set[str]:
+    # resume.yaml and resume.yml in one folder still share a PDF name.
+    counts = Counter(os.path.normpath(path) for path in output_paths)
+    return {path for path in output_paths if counts[os.path.normpath(path)] > 1}
+
+
+def output_conflict_error(output_path: str) -> str:
+    return f"Output conflict: {output_path} is the output of more than one input"
+
+
+def _is_resume_path(path: str) -> bool:
+    return path.lower().endswith(resume_file_extensions())
+
+
+def _list_resume_directory(directory: str) -> list[str]:
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if _is_resume_path(name)
+    )
+
+
+def _read_manifest(manifest_path: str) -> list[str]:
+    base_directory = os.path.dirname(manifest_path)
+    paths = []
+    with open(manifest_path, "r") as manifest:
+        for line in manifest:
+            entry = line.strip()
+            if not entry or entry.startswith("#"):
+                continue
+            paths.append(os.path.join(base_directory, entry))
+    return paths
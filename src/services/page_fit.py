@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+
+from reportlab.platypus import Flowable
+
+from src.core.settings import DEFAULT_MIN_FIT_SCALE, DEFAULT_SECTION_CACHE_SIZE, FIT_SCALE_STEP
+from src.core.styles import DEFAULT_RESUME_STYLES, LAYOUT_FUZZ, ResumeStyles, scale_resume_styles
+from src.models.resume_data import ResumeData
+from src.services.pdf_renderer import SectionFlowableCache, iter_section_inputs, section_cache_key
+from src.utils.lru_cache import LRUCache
+
+
+@dataclass(frozen=True)
+class SectionExtent:
+    space_before: float
+    height: float
+    space_after: float
+
+
+@dataclass
+class FitResult:
+    scale: float
+    page_count: int
+    fits: bool
+    trials: int
+
+
+class PageFitter:
+    # Trial layouts only call wrap/split, never draw. Whole sections are placed
+    # from their cached extent; only a section straddling a page break is
+    # walked flowable by flowable.
+    def __init__(
+        self,
+        section_cache: SectionFlowableCache | None = None,
+        base_styles: ResumeStyles = DEFAULT_RESUME_STYLES,
+        max_entries: int = DEFAULT_SECTION_CACHE_SIZE,
+    ) -> None:
+        self.section_cache = section_cache or SectionFlowableCache(max_entries)
+        self.base_styles = base_styles
+        self._extents = LRUCache(max_entries)
+
+    def fit(
+        self,
+        resume_data: ResumeData,
+        max_pages: int,
+        min_scale: float = DEFAULT_MIN_FIT_SCALE,
+        max_scale: float = 1.0,
+    ) -> FitResult:
+        if max_pages < 1:
+            raise ValueError(f"max_pages must be at least 1, got {max_pages}")
+        low_step = round(min_scale / FIT_SCALE_STEP)
+        high_step = round(max_scale / FIT_SCALE_STEP)
+        trials = 0
+
+        def pages_at(step: int) -> int:
+            nonlocal trials
+            trials += 1
+            return self.count_pages(resume_data, _step_scale(step))
+
+        page_count = pages_at(high_step)
+        if page_count <= max_pages:
+            return FitResult(_step_scale(high_step), page_count, True, trials)
+        low_pages = pages_at(low_step)
+        if low_pages > max_pages:
+            return FitResult(_step_scale(low_step), low_pages, False, trials)
+
+        # Invariant: low_step fits, high_step does not.
+        while high_step - low_step > 1:
+            middle_step = (low_step + high_step) // 2
+            middle_pages = pages_at(middle_step)
+            if middle_pages <= max_pages:
+                low_step, low_pages = middle_step, middle_pages
+            else:
+                high_step = middle_step
+        return FitResult(_step_scale(low_step), low_pages, True, trials)
+
+    def count_pages(self, resume_data: ResumeData, scale: float = 1.0) -> int:
+        styles = scale_resume_styles(self.base_styles, scale)
+        cursor = _PageCursor(styles.content_height)
+        for section_name, section_input in iter_section_inputs(resume_data):
+            key = section_cache_key(section_name, section_input, styles)
+            extent = self._extents.get(key)
+            if extent is None:
+                flowables, _ = self.section_cache.flowables_for(section_name, section_input, styles)
+                extent = measure_section(flowables, styles.content_width, styles.content_height)
+                self._extents.put(key, extent)
+            if not cursor.place_extent(extent):
+                flowables, _ = self.section_cache.flowables_for(section_name, section_input, styles)
+                cursor.place_flowables(flowables, styles.content_width)
+        return cursor.pages
+
+
+def measure_section(flowables: list[Flowable], width: float, height_limit: float) -> SectionExtent:
+    space_before = flowables[0].getSpaceBefore()
+    height = 0.0
+    previous_space_after = None
+    for flowable in flowables:
+        flowable_height = flowable.wrap(width, height_limit)[1]
+        if previous_space_after is not None:
+            # Adjacent spaceAfter/spaceBefore overlap, as in ReportLab's Frame.
+            height += max(previous_space_after, flowable.getSpaceBefore())
+        height += flowable_height
+        previous_space_after = flowable.getSpaceAfter()
+    return SectionExtent(space_before, height, previous_space_after)
+
+
+class _PageCursor:
+    def __init__(self, frame_height: float) -> None:
+        self.frame_height = frame_height
+        self.pages = 1
+        self.remaining = frame_height
+        self.at_top = True
+        self.previous_space_after = 0.0
+
+    def place_extent(self, extent: SectionExtent) -> bool:
+        needed = self._space_before(extent.space_before) + extent.height
+        if needed > self.remaining + LAYOUT_FUZZ:
+            return False
+        self._advance(needed, extent.space_after)
+        return True
+
+    def place_flowables(self, flowables: list[Flowable], width: float) -> None:
+        pending = deque(flowables)
+        while pending:
+            flowable = pending.popleft()
+            space_before = self._space_before(flowable.getSpaceBefore())
+            available = self.remaining - space_before
+            if available > 0:
+                height = flowable.wrap(width, available)[1]
+                if space_before + height <= self.remaining + LAYOUT_FUZZ:
+                    self._advance(space_before + height, flowable.getSpaceAfter())
+                    continue
+                parts = flowable.split(width, available)
+                if len(parts) > 1:
+                    pending.extendleft(reversed(parts))
+                    continue
+            if self.at_top:
+                # Taller than an empty page and unsplittable: count it as
+                # filling the page rather than looping forever.
+                self._advance(self.remaining, 0.0)
+                continue
+            self._new_page()
+            pending.appendleft(flowable)
+
+    def _space_before(self, space_before: float) -> float:
+        if self.at_top:
+            return 0.0
+        return max(space_before - self.previous_space_after, 0.0)
+
+    def _advance(self, height: float, space_after: float) -> None:
+        self.remaining -= height + space_after
+        self.previous_space_after = space_after
+        if height + space_after:
+            self.at_top = False
+
+    def _new_page(self) -> None:
+        self.pages += 1
+        self.remaining = self.frame_height
+        self.at_top = True
+        self.previous_space_after = 0.0
+
+
+def _step_scale(step: int) -> float:
+    return round(step * FIT_SCALE_STEP, 4)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Paragraph
+
+from src.core.settings import DEFAULT_PARAGRAPH_CACHE_SIZE
+from src.utils.lru_cache import CacheStats, LRUCache
+
+
+class ParagraphCache:
+    def __init__(self, max_entries: int = DEFAULT_PARAGRAPH_CACHE_SIZE) -> None:
+        self.markup = LRUCache(max_entries)
+        self.layout = LRUCache(max_entries)
+
+    def paragraph(self, text: str, style: ParagraphStyle) -> Paragraph:
+        return CachedParagraph(text, style, cache=self)
+
+    def stats(self) -> dict[str, CacheStats]:
+        return {"markup": self.markup.stats(), "layout": self.layout.stats()}
+
+    def clear(self) -> None:
+        self.markup.clear()
+        self.layout.clear()
+
+
+class CachedParagraph(Paragraph):
+    # Keeps Paragraph's constructor signature because Paragraph.split builds
+    # its halves through self.__class__; those halves run uncached.
+    def __init__(
+        self,
+        text,
+        style=None,
+        bulletText=None,
+        frags=None,
+        caseSensitive=1,
+        encoding="utf8",
+        cache: ParagraphCache | None = None,
+    ) -> None:
+        self._cache = cache
+        self._cache_text = text
+        if cache is None or frags is not None:
+            super().__init__(text, style, bulletText, frags, caseSensitive, encoding)
+            return
+
+        markup_key = (text, style.name)
+        parsed = cache.markup.get(markup_key)
+        if parsed is None:
+            super().__init__(text, style, bulletText, None, caseSensitive, encoding)
+            cache.markup.put(markup_key, (self.style, self.frags, self.bulletText))
+        else:
+            parsed_style, parsed_frags, parsed_bullet = parsed
+            super().__init__(text, parsed_style, parsed_bullet, parsed_frags, caseSensitive, encoding)
+
+    def wrap(self, availWidth, availHeight):
+        if self._cache is None:
+            return super().wrap(availWidth, availHeight)
+
+        layout_key = (self._cache_text, self.style.name, availWidth)
+        layout = self._cache.layout.get(layout_key)
+        if layout is None:
+            result = super().wrap(availWidth, availHeight)
+            self._cache.layout.put(layout_key, (
+                self.blPara, self.height, self.frags, self._wrapWidths,
+                getattr(self, "_width_max", None),
+            ))
+            return result
+
+        self.blPara, self.height, self.frags, self._wrapWidths, width_max = layout
+        if width_max is not None:
+            self._width_max = width_max
+        self.width = availWidth
+        return self.width, self.height
+
+
+DEFAULT_PARAGRAPH_CACHE = ParagraphCache()
+
+
+def paragraph_cache_stats() -> dict[str, CacheStats]:
+    return DEFAULT_PARAGRAPH_CACHE.stats()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass
+
+from src.core.settings import DEFAULT_PARSE_CACHE_SIZE, PARSE_CACHE_VERSION
+from src.models.resume_data import ResumeData
+from src.services.yaml_parser import ResumeParseError, input_format_for_path, parse_resume_bytes, parse_resume_file
+from src.utils.lru_cache import CacheStats, LRUCache
+
+PARSE_CACHE_ENTRY_SUFFIX = ".pickle"
+
+
+@dataclass
+class ParseCacheStats(CacheStats):
+    disk_hits: int = 0
+
+
+@dataclass(frozen=True)
+class _ParsedFile:
+    modified_ns: int
+    size: int
+    digest: str | None
+    resume_data: ResumeData
+
+
+class ParseCache:
+    # One entry per absolute path, stamped with the signature it was parsed
+    # from, so an edited file replaces its stale entry rather than piling up
+    # beside it. Disk entries are pickles: keep the directory private.
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_PARSE_CACHE_SIZE,
+        directory: str | None = None,
+        verify_hash: bool = False,
+    ) -> None:
+        self.directory = directory
+        self.verify_hash = verify_hash
+        self._entries = LRUCache(max_entries)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disk_hits = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def parse(self, filepath: str, input_format: str | None = None) -> ResumeData:
+        path = os.path.abspath(filepath)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise ResumeParseError(f"File not found: {filepath}")
+        data = digest = None
+        if self.verify_hash:
+            # Hashing also catches edits that keep the size within one mtime tick.
+            with open(path, "rb") as file:
+                data = file.read()
+            digest = hashlib.sha256(data).hexdigest()
+
+        entry = self._entries.get(path)
+        if entry is not None and self._is_current(entry, stat, digest):
+            self._count_hit()
+            return entry.resume_data
+        entry = self._load_entry(path)
+        if entry is not None and self._is_current(entry, stat, digest):
+            self._entries.put(path, entry)
+            self._count_hit(from_disk=True)
+            return entry.resume_data
+
+        with self._lock:
+            self._misses += 1
+        input_format = input_format or input_format_for_path(path)
+        if data is None:
+            resume_data = parse_resume_file(filepath, input_format)
+        else:
+            resume_data = parse_resume_bytes(data, input_format)
+        entry = _ParsedFile(stat.st_mtime_ns, stat.st_size, digest, resume_data)
+        self._entries.put(path, entry)
+        self._store_entry(path, entry)
+        return resume_data
+
+    def stats(self) -> ParseCacheStats:
+        memory = self._entries.stats()
+        with self._lock:
+            return ParseCacheStats(self._hits, self._misses, memory.evictions, memory.size, self._disk_hits)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        with self._lock:
+            self._hits = self._misses = self._disk_hits = 0
+
+    def _is_current(self, entry: _ParsedFile, stat: os.stat_result, digest: str | None) -> bool:
+        if self.verify_hash:
+            return entry.digest == digest
+        return entry.modified_ns == stat.st_mtime_ns and entry.size == stat.st_size
+
+    def _count_hit(self, from_disk: bool = False) -> None:
+        with self._lock:
+            self._hits += 1
+            if from_disk:
+                self._disk_hits += 1
+
+    def _entry_path(self, path: str) -> str:
+        name = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + PARSE_CACHE_ENTRY_SUFFIX)
+
+    def _load_entry(self, path: str) -> _ParsedFile | None:
+        if not self.directory:
+            return None
+        try:
+            with open(self._entry_path(path), "rb") as file:
+                version, entry = pickle.load(file)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated, or pickled from model classes that have since changed.
+            return None
+        return entry if version == PARSE_CACHE_VERSION else None
+
+    def _store_entry(self, path: str, entry: _ParsedFile) -> None:
+        if not self.directory:
+            return
+        # The entry is already cached in memory, so a full disk or read-only
+        # directory only costs a re-parse in a later run.
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump((PARSE_CACHE_VERSION, entry), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._entry_path(path))
+        except Exception:
+            _remove_quietly(temp_path)
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def parse_resume_cached(filepath: str, parse_cache: ParseCache | None = None) -> ResumeData:
+    if parse_cache is None:
+        return parse_resume_file(filepath)
+    return parse_cache.parse(filepath)
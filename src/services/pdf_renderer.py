@@ -1,47 +1,37 @@
 from __future__ import annotations
 
+import hashlib
 import html
+import io
+import json
 import os
-from datetime import datetime
-from typing import Callable
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, BinaryIO, Callable, Iterator
 
-from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfbase.pdfdoc import PDFZCompress
+from reportlab.pdfgen.canvas import Canvas
 from reportlab.platypus import (
     BaseDocTemplate,
     Frame,
-    HRFlowable,
     PageTemplate,
-    Paragraph,
-    Spacer,
-    Table,
 )
 
 from src.core.styles import (
     BULLET_CHAR,
     CONTACT_SEPARATOR,
-    CONTENT_WIDTH,
+    DEFAULT_RESUME_STYLES,
     EM_DASH,
     EN_DASH,
-    ITEM_VERTICAL_GAP,
-    LEFT_COLUMN_RATIO,
-    LINE_RULE_WIDTH,
     PAGE_HEIGHT,
-    PAGE_MARGIN,
     PAGE_WIDTH,
-    RIGHT_COLUMN_RATIO,
-    STYLE_BULLET,
-    STYLE_CONTACT,
-    STYLE_DATE_RIGHT,
-    STYLE_LOCATION_LEFT,
-    STYLE_NAME,
-    STYLE_PROJECT_DETAIL,
-    STYLE_PROJECT_NAME,
-    STYLE_ROLE_LEFT,
-    STYLE_SECTION_HEADER,
-    STYLE_SKILLS,
-    STYLE_SUMMARY,
-    TABLE_STYLE_DEFAULT,
+    ResumeStyles,
+    build_resume_styles,
+    scale_resume_styles,
 )
+from src.models.render_job import RenderJob, RenderOutcome
+from src.models.render_options import DEFAULT_RENDER_OPTIONS, RenderOptions
 from src.models.resume_data import (
     ContactInfo,
     Education,
@@ -50,44 +40,312 @@ from src.models.resume_data import (
     ResumeData,
     SkillCategory,
 )
+from src.models.frozen_resume_data import (
+    freeze_contact,
+    freeze_education,
+    freeze_experience,
+    freeze_projects,
+    freeze_skills,
+)
+from src.core.settings import (
+    COMPRESSION_FLATE,
+    COMPRESSION_NONE,
+    DEFAULT_SECTION_CACHE_SIZE,
+    ENGINE_CANVAS,
+    RENDERER_VERSION,
+    SOURCE_DATE_EPOCH_ENV,
+)
+from src.services.canvas_renderer import build_section_blocks, draw_blocks
+from src.services.flowable_factory import (
+    build_item_gap,
+    build_paragraph,
+    build_section_rule,
+    build_two_column_row,
+    reset_layout_state,
+)
+from src.services.input_sources import build_output_paths, find_output_conflicts, output_conflict_error
+from src.services.parse_cache import parse_resume_cached
+from src.services.yaml_parser import format_render_error
+from src.utils.lru_cache import CacheStats, LRUCache
+from src.utils.profiling import STAGE_BUILD_FLOWABLES, STAGE_LAYOUT, measure_stage
 
+if TYPE_CHECKING:
+    from src.services.parse_cache import ParseCache
+    from src.services.render_cache import RenderCache
+
+DOCUMENT_CREATOR = "Resume Generator"
+
+SECTION_CONTACT = "contact"
+SECTION_ORDER = (SECTION_CONTACT, "summary", "skills", "experience", "projects", "education")
 
-def render_resume_pdf(resume_data: ResumeData, output_path: str) -> None:
-    _ensure_output_directory(output_path)
-    doc = _create_document(resume_data, output_path)
-    flowables = _build_all_flowables(resume_data)
-    doc.build(flowables)
 
+def render_resume_pdf(
+    resume_data: ResumeData,
+    output_path: str,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+    section_cache: SectionFlowableCache | None = None,
+) -> None:
+    options = options or DEFAULT_RENDER_OPTIONS
 
-def _create_document(resume_data: ResumeData, output_path: str) -> BaseDocTemplate:
+    if cache is not None:
+        cache_key = cache.key_for(resume_data, options)
+        if cache.fetch(cache_key, output_path):
+            return
+
+    _ensure_output_directory(output_path)
+    _render_document(resume_data, output_path, options, section_cache)
+
+    if cache is not None:
+        cache.store(cache_key, output_path)
+
+
+def render_resume_pdf_to_stream(
+    resume_data: ResumeData,
+    stream: BinaryIO,
+    options: RenderOptions | None = None,
+    section_cache: SectionFlowableCache | None = None,
+) -> None:
+    options = options or DEFAULT_RENDER_OPTIONS
+    _render_document(resume_data, stream, options, section_cache)
+
+
+def render_resume_pdf_bytes(
+    resume_data: ResumeData,
+    options: RenderOptions | None = None,
+    section_cache: SectionFlowableCache | None = None,
+) -> bytes:
+    buffer = io.BytesIO()
+    render_resume_pdf_to_stream(resume_data, buffer, options, section_cache)
+    return buffer.getvalue()
+
+
+def render_flowables_pdf(
+    resume_data: ResumeData,
+    flowables: list,
+    output_path: str,
+    options: RenderOptions | None = None,
+) -> None:
+    options = options or DEFAULT_RENDER_OPTIONS
+    _ensure_output_directory(output_path)
+    doc = _create_document(resume_data, output_path, options, resolve_styles(options))
+    _layout_document(doc, flowables, _canvas_maker(resume_data, options))
+
+
+def resolve_styles(options: RenderOptions | None = None) -> ResumeStyles:
+    options = options or DEFAULT_RENDER_OPTIONS
+    return scale_resume_styles(build_resume_styles(options.theme), options.style_scale)
+
+
+def _render_document(
+    resume_data: ResumeData,
+    output_target: str | BinaryIO,
+    options: RenderOptions,
+    section_cache: SectionFlowableCache | None = None,
+) -> None:
+    styles = resolve_styles(options)
+    if options.engine == ENGINE_CANVAS:
+        # The canvas engine rebuilds every section; its blocks are too cheap to cache.
+        _draw_canvas_document(_create_canvas(resume_data, output_target, options), resume_data, styles)
+        return
+    doc = _create_document(resume_data, output_target, options, styles)
+    _build_document(doc, resume_data, options, styles, section_cache)
+
+
+def _build_document(
+    doc: BaseDocTemplate,
+    resume_data: ResumeData,
+    options: RenderOptions,
+    styles: ResumeStyles,
+    section_cache: SectionFlowableCache | None = None,
+) -> None:
+    with measure_stage(STAGE_BUILD_FLOWABLES):
+        if section_cache is None:
+            flowables = _build_all_flowables(resume_data, styles)
+        else:
+            flowables, _ = section_cache.build_all(resume_data, styles)
+    _layout_document(doc, flowables, _canvas_maker(resume_data, options))
+
+
+def _layout_document(doc: BaseDocTemplate, flowables: list, canvas_maker: Callable[..., Canvas] = Canvas) -> None:
+    with measure_stage(STAGE_LAYOUT):
+        doc.build(list(flowables), canvasmaker=canvas_maker)
+
+
+def _draw_canvas_document(canvas: Canvas, resume_data: ResumeData, styles: ResumeStyles) -> None:
+    with measure_stage(STAGE_BUILD_FLOWABLES):
+        blocks = []
+        for section_name, section_input in iter_section_inputs(resume_data):
+            blocks.extend(build_section_blocks(section_name, section_input, styles))
+    with measure_stage(STAGE_LAYOUT):
+        draw_blocks(canvas, blocks, styles)
+        canvas.save()
+
+
+def render_many(
+    input_paths: list[str],
+    output_dir: str,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+    parse_cache: ParseCache | None = None,
+) -> list[RenderOutcome]:
+    output_paths = build_output_paths(input_paths, output_dir)
+    conflicts = find_output_conflicts(output_paths)
+    return [
+        RenderOutcome(input_path, error=output_conflict_error(output_path))
+        if output_path in conflicts
+        else _render_single_input(input_path, output_path, options, cache, parse_cache)
+        for input_path, output_path in zip(input_paths, output_paths)
+    ]
+
+
+def _render_single_input(
+    input_path: str,
+    output_path: str,
+    options: RenderOptions | None,
+    cache: RenderCache | None,
+    parse_cache: ParseCache | None = None,
+) -> RenderOutcome:
+    started = time.perf_counter()
+    try:
+        resume_data = parse_resume_cached(input_path, parse_cache)
+        render_resume_pdf(resume_data, output_path, options, cache)
+    except Exception as error:
+        return RenderOutcome(input_path, error=format_render_error(error), elapsed_seconds=time.perf_counter() - started)
+    return RenderOutcome(input_path, output_path=output_path, elapsed_seconds=time.perf_counter() - started)
+
+
+def render_resume_job(
+    job: RenderJob,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+    section_cache: SectionFlowableCache | None = None,
+) -> RenderOutcome:
+    started = time.perf_counter()
+    try:
+        render_resume_pdf(job.resume_data, job.output_path, options, cache, section_cache)
+    except Exception as error:
+        return RenderOutcome(job.source, error=format_render_error(error), elapsed_seconds=time.perf_counter() - started)
+    return RenderOutcome(job.source, output_path=job.output_path, elapsed_seconds=time.perf_counter() - started)
+
+
+def _create_document(
+    resume_data: ResumeData,
+    output_target: str | BinaryIO,
+    options: RenderOptions,
+    styles: ResumeStyles = DEFAULT_RESUME_STYLES,
+) -> BaseDocTemplate:
     frame = Frame(
-        PAGE_MARGIN,
-        PAGE_MARGIN,
-        CONTENT_WIDTH,
-        PAGE_HEIGHT - (2 * PAGE_MARGIN),
+        styles.page_margin,
+        styles.page_margin,
+        styles.content_width,
+        styles.content_height,
         leftPadding=0,
         rightPadding=0,
         topPadding=0,
         bottomPadding=0,
     )
-    keywords = _build_keywords(resume_data.skills)
     doc = BaseDocTemplate(
-        output_path,
+        output_target,
         pagesize=(PAGE_WIDTH, PAGE_HEIGHT),
-        leftMargin=PAGE_MARGIN,
-        rightMargin=PAGE_MARGIN,
-        topMargin=PAGE_MARGIN,
-        bottomMargin=PAGE_MARGIN,
-        title=f"{resume_data.contact.name} - Resume",
-        author=resume_data.contact.name,
-        subject=resume_data.summary,
-        keywords=keywords,
-        creator=f"Resume Generator - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        leftMargin=styles.page_margin,
+        rightMargin=styles.page_margin,
+        topMargin=styles.page_margin,
+        bottomMargin=styles.page_margin,
+        invariant=options.deterministic,
+        pageCompression=_page_compression(options),
+        **_build_document_info(resume_data, options),
     )
     doc.addPageTemplates([PageTemplate(id="main", frames=[frame])])
     return doc
 
 
+def _create_canvas(resume_data: ResumeData, output_target: str | BinaryIO, options: RenderOptions) -> Canvas:
+    canvas = _canvas_maker(resume_data, options)(
+        output_target,
+        pagesize=(PAGE_WIDTH, PAGE_HEIGHT),
+        invariant=options.deterministic,
+        pageCompression=_page_compression(options),
+    )
+    for field_name, value in _build_document_info(resume_data, options).items():
+        getattr(canvas, f"set{field_name.capitalize()}")(value)
+    return canvas
+
+
+class _FlateCanvas(Canvas):
+    # ReportLab picks ASCII85 from the process-wide rl_config.useA85. Pages
+    # flagged uncompressed fall back to the document's default filters
+    # instead, so this canvas alone writes binary Flate streams.
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._doc.defaultStreamFilters = [PDFZCompress]
+
+    def showPage(self) -> None:
+        page_compression, self._pageCompression = self._pageCompression, 0
+        super().showPage()
+        self._pageCompression = page_compression
+
+
+def _canvas_maker(resume_data: ResumeData, options: RenderOptions) -> Callable[..., Canvas]:
+    canvas_class = _FlateCanvas if options.compression == COMPRESSION_FLATE else Canvas
+    if not options.deterministic:
+        return canvas_class
+    document_id = _document_id(resume_data, options)
+
+    def make_canvas(*args, **kwargs) -> Canvas:
+        canvas = canvas_class(*args, **kwargs)
+        # ReportLab hashes only the timestamp and info fields into /ID, so two
+        # resumes sharing a name, summary and skills would share an ID.
+        canvas._doc._ID = b"\n[<%s><%s>]\n" % (document_id, document_id)
+        return canvas
+
+    return make_canvas
+
+
+def _document_id(resume_data: ResumeData, options: RenderOptions) -> bytes:
+    payload = {"resume": asdict(resume_data), "options": asdict(options), "renderer": RENDERER_VERSION}
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:32].encode("ascii")
+
+
+def _page_compression(options: RenderOptions) -> int:
+    return 0 if options.compression == COMPRESSION_NONE else 1
+
+
+def _build_document_info(resume_data: ResumeData, options: RenderOptions) -> dict[str, str]:
+    if options.strip_metadata:
+        # Subject and keywords repeat the summary and skills already on the page.
+        return {
+            "title": f"{resume_data.contact.name} - Resume",
+            "author": resume_data.contact.name,
+            "subject": "",
+            "keywords": "",
+            "creator": "",
+            "producer": "",
+        }
+    return {
+        "title": f"{resume_data.contact.name} - Resume",
+        "author": resume_data.contact.name,
+        "subject": resume_data.summary,
+        "keywords": _build_keywords(resume_data.skills),
+        "creator": _build_creator(options),
+    }
+
+
+def _build_creator(options: RenderOptions) -> str:
+    if options.deterministic:
+        return DOCUMENT_CREATOR
+    return f"{DOCUMENT_CREATOR} - {_render_time().strftime('%Y-%m-%d %H:%M')}"
+
+
+def _render_time() -> datetime:
+    # ReportLab dates the document from the same variable when it is set.
+    source_date_epoch = os.environ.get(SOURCE_DATE_EPOCH_ENV, "").strip()
+    if source_date_epoch:
+        return datetime.fromtimestamp(int(source_date_epoch), timezone.utc)
+    return datetime.now()
+
+
 def _build_keywords(skills: list[SkillCategory]) -> str:
     all_items = []
     for skill_category in skills:
@@ -99,36 +357,82 @@ def _build_keywords(skills: list[SkillCategory]) -> str:
 def _ensure_output_directory(output_path: str) -> None:
     directory = os.path.dirname(output_path)
     if directory and not os.path.exists(directory):
-        os.makedirs(directory)
+        os.makedirs(directory, exist_ok=True)
 
 
-def _build_all_flowables(resume_data: ResumeData) -> list:
+def _build_all_flowables(resume_data: ResumeData, styles: ResumeStyles = DEFAULT_RESUME_STYLES) -> list:
     flowables = []
-
-    flowables.extend(_build_contact_header(resume_data.contact))
-
-    if resume_data.summary:
-        flowables.extend(_build_summary_section(resume_data.summary))
-
-    if resume_data.skills:
-        flowables.extend(_build_skills_section(resume_data.skills))
-
-    if resume_data.experience:
-        flowables.extend(_build_experience_section(resume_data.experience))
-
-    if resume_data.projects:
-        flowables.extend(_build_projects_section(resume_data.projects))
-
-    if resume_data.education:
-        flowables.extend(_build_education_section(resume_data.education))
-
+    for section_name, section_input in iter_section_inputs(resume_data):
+        flowables.extend(build_section_flowables(section_name, section_input, styles))
     return flowables
 
 
-def _build_contact_header(contact: ContactInfo) -> list:
+def iter_section_inputs(resume_data: ResumeData) -> Iterator[tuple[str, object]]:
+    yield SECTION_CONTACT, resume_data.contact
+    for section_name in SECTION_ORDER[1:]:
+        section_input = getattr(resume_data, section_name)
+        if section_input:
+            yield section_name, section_input
+
+
+def build_section_flowables(
+    section_name: str,
+    section_input: object,
+    styles: ResumeStyles = DEFAULT_RESUME_STYLES,
+) -> list:
+    return _SECTION_BUILDERS[section_name](section_input, styles)
+
+
+def section_cache_key(section_name: str, section_input: object, styles: ResumeStyles) -> tuple:
+    return section_name, styles.key, _SECTION_FREEZERS[section_name](section_input)
+
+
+class SectionFlowableCache:
+    # Cached flowables are reused by every document built from the same section
+    # input, so an instance must not be shared by concurrently running builds.
+    def __init__(self, max_entries: int = DEFAULT_SECTION_CACHE_SIZE) -> None:
+        self._entries = LRUCache(max_entries)
+
+    def flowables_for(
+        self,
+        section_name: str,
+        section_input: object,
+        styles: ResumeStyles = DEFAULT_RESUME_STYLES,
+    ) -> tuple[list, bool]:
+        key = section_cache_key(section_name, section_input, styles)
+        flowables = self._entries.get(key)
+        if flowables is not None:
+            reset_layout_state(flowables)
+            return flowables, True
+        flowables = build_section_flowables(section_name, section_input, styles)
+        self._entries.put(key, flowables)
+        return flowables, False
+
+    def build_all(
+        self,
+        resume_data: ResumeData,
+        styles: ResumeStyles = DEFAULT_RESUME_STYLES,
+    ) -> tuple[list, list[str]]:
+        flowables = []
+        rebuilt_sections = []
+        for section_name, section_input in iter_section_inputs(resume_data):
+            section_flowables, reused = self.flowables_for(section_name, section_input, styles)
+            if not reused:
+                rebuilt_sections.append(section_name)
+            flowables.extend(section_flowables)
+        return flowables, rebuilt_sections
+
+    def stats(self) -> CacheStats:
+        return self._entries.stats()
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _build_contact_header(contact: ContactInfo, styles: ResumeStyles) -> list:
     flowables = []
 
-    flowables.append(Paragraph(html.escape(contact.name), STYLE_NAME))
+    flowables.append(build_paragraph(html.escape(contact.name), styles.name))
 
     contact_parts = [html.escape(contact.email)]
     if contact.phone:
@@ -143,85 +447,56 @@ def _build_contact_header(contact: ContactInfo) -> list:
         contact_parts.append(html.escape(contact.location))
 
     contact_line = CONTACT_SEPARATOR.join(contact_parts)
-    flowables.append(Paragraph(contact_line, STYLE_CONTACT))
+    flowables.append(build_paragraph(contact_line, styles.contact))
 
     return flowables
 
 
-def _build_section_header(title: str) -> list:
+def _build_section_header(title: str, styles: ResumeStyles) -> list:
     flowables = []
 
-    flowables.append(Paragraph(title.upper(), STYLE_SECTION_HEADER))
-
-    rule = HRFlowable(
-        width="100%",
-        thickness=LINE_RULE_WIDTH,
-        color="black",
-        spaceAfter=2,
-        spaceBefore=0,
-    )
-    flowables.append(rule)
+    flowables.append(build_paragraph(title.upper(), styles.section_header))
+    flowables.append(build_section_rule(styles.rule_space_after))
 
     return flowables
 
 
-def _build_two_column_row(
-    left_text: str,
-    left_style: ParagraphStyle,
-    right_text: str,
-    right_style: ParagraphStyle,
-) -> Table:
-    left_paragraph = Paragraph(left_text, left_style)
-    right_paragraph = Paragraph(right_text, right_style)
-
-    left_column_width = CONTENT_WIDTH * LEFT_COLUMN_RATIO
-    right_column_width = CONTENT_WIDTH * RIGHT_COLUMN_RATIO
-
-    table = Table(
-        [[left_paragraph, right_paragraph]],
-        colWidths=[left_column_width, right_column_width],
-    )
-    table.setStyle(TABLE_STYLE_DEFAULT)
-
-    return table
-
-
-def _build_summary_section(summary: str) -> list:
+def _build_summary_section(summary: str, styles: ResumeStyles) -> list:
     flowables = []
-    flowables.extend(_build_section_header("Summary"))
-    flowables.append(Paragraph(html.escape(summary), STYLE_SUMMARY))
+    flowables.extend(_build_section_header("Summary", styles))
+    flowables.append(build_paragraph(html.escape(summary), styles.summary))
     return flowables
 
 
-def _build_skills_section(skills: list[SkillCategory]) -> list:
+def _build_skills_section(skills: list[SkillCategory], styles: ResumeStyles) -> list:
     flowables = []
-    flowables.extend(_build_section_header("Skills"))
+    flowables.extend(_build_section_header("Skills", styles))
 
     for skill_category in skills:
         category = html.escape(skill_category.category)
         items = [html.escape(item) for item in skill_category.items]
         items_text = ", ".join(items)
         line = f"<b>{category}:</b> {items_text}"
-        flowables.append(Paragraph(line, STYLE_SKILLS))
+        flowables.append(build_paragraph(line, styles.skills))
 
     return flowables
 
 
-def _build_list_section(title: str, items: list, build_single_item: Callable) -> list:
+def _build_list_section(title: str, items: list, build_single_item: Callable, styles: ResumeStyles) -> list:
     flowables = []
-    flowables.extend(_build_section_header(title))
+    flowables.extend(_build_section_header(title, styles))
     for index, item in enumerate(items):
         if index > 0:
-            flowables.append(Spacer(1, ITEM_VERTICAL_GAP))
-        flowables.extend(build_single_item(item))
+            flowables.append(build_item_gap(styles.item_gap))
+        flowables.extend(build_single_item(item, styles))
     return flowables
 
 
-def _build_experience_section(experiences: list[Experience]) -> list:
-    return _build_list_section("Experience", experiences, _build_single_experience)
+def _build_experience_section(experiences: list[Experience], styles: ResumeStyles) -> list:
+    return _build_list_section("Experience", experiences, _build_single_experience, styles)
 
 
-def _build_single_experience(exp: Experience) -> list:
+def _build_single_experience(exp: Experience, styles: ResumeStyles) -> list:
     flowables = []
 
     start_date = html.escape(exp.start_date)
@@ -233,30 +508,28 @@ def _build_single_experience(exp: Experience) -> list:
     date_range = f"{start_date} {EN_DASH} {end_date}"
     role_text = f"<b>{company}</b> {EM_DASH} {role}"
 
-    row = _build_two_column_row(
-        role_text, STYLE_ROLE_LEFT,
-        date_range, STYLE_DATE_RIGHT,
+    row = build_two_column_row(
+        role_text, styles.role_left,
+        date_range, styles.date_right,
+        styles.column_widths,
     )
     flowables.append(row)
 
-    location_row = _build_two_column_row(
-        f"<i>{location}</i>", STYLE_LOCATION_LEFT,
-        "", STYLE_LOCATION_LEFT,
-    )
-    flowables.append(location_row)
+    # The location row style's right indent reserves the empty date column.
+    flowables.append(build_paragraph(f"<i>{location}</i>", styles.location_row))
 
     for bullet in exp.bullets:
         bullet_text = f"{BULLET_CHAR} {html.escape(bullet)}"
-        flowables.append(Paragraph(bullet_text, STYLE_BULLET))
+        flowables.append(build_paragraph(bullet_text, styles.bullet))
 
     return flowables
 
 
-def _build_education_section(education: list[Education]) -> list:
-    return _build_list_section("Education", education, _build_single_education)
+def _build_education_section(education: list[Education], styles: ResumeStyles) -> list:
+    return _build_list_section("Education", education, _build_single_education, styles)
 
 
-def _build_single_education(edu: Education) -> list:
+def _build_single_education(edu: Education, styles: ResumeStyles) -> list:
     flowables = []
 
     start_date = html.escape(edu.start_date)
@@ -267,24 +540,25 @@ def _build_single_education(edu: Education) -> list:
     date_range = f"{start_date} {EN_DASH} {end_date}"
     degree_text = f"<b>{university}</b> {EM_DASH} {degree}"
 
-    row = _build_two_column_row(
-        degree_text, STYLE_ROLE_LEFT,
-        date_range, STYLE_DATE_RIGHT,
+    row = build_two_column_row(
+        degree_text, styles.role_left,
+        date_range, styles.date_right,
+        styles.column_widths,
     )
     flowables.append(row)
 
     for detail in edu.details:
         detail_text = f"{BULLET_CHAR} {html.escape(detail)}"
-        flowables.append(Paragraph(detail_text, STYLE_BULLET))
+        flowables.append(build_paragraph(detail_text, styles.bullet))
 
     return flowables
 
 
-def _build_projects_section(projects: list[Project]) -> list:
-    return _build_list_section("Projects", projects, _build_single_project)
+def _build_projects_section(projects: list[Project], styles: ResumeStyles) -> list:
+    return _build_list_section("Projects", projects, _build_single_project, styles)
 
 
-def _build_single_project(proj: Project) -> list:
+def _build_single_project(proj: Project, styles: ResumeStyles) -> list:
     flowables = []
 
     name = html.escape(proj.name)
@@ -293,18 +567,37 @@ def _build_single_project(proj: Project) -> list:
     name_text = f"<b>{name}</b>"
     if link:
         name_text = f"<b>{name}</b> | {link}"
-    flowables.append(Paragraph(name_text, STYLE_PROJECT_NAME))
+    flowables.append(build_paragraph(name_text, styles.project_name))
 
     if proj.description:
-        flowables.append(Paragraph(html.escape(proj.description), STYLE_PROJECT_DETAIL))
+        flowables.append(build_paragraph(html.escape(proj.description), styles.project_detail))
 
     for bullet in proj.bullets:
         bullet_text = f"{BULLET_CHAR} {html.escape(bullet)}"
-        flowables.append(Paragraph(bullet_text, STYLE_BULLET))
+        flowables.append(build_paragraph(bullet_text, styles.bullet))
 
     if proj.tech_stack:
         tech_stack = [html.escape(t) for t in proj.tech_stack]
         tech_text = f"<b>Tech:</b> {', '.join(tech_stack)}"
-        flowables.append(Paragraph(tech_text, STYLE_PROJECT_DETAIL))
+        flowables.append(build_paragraph(tech_text, styles.project_detail))
 
     return flowables
+
+
+_SECTION_BUILDERS = {
+    SECTION_CONTACT: _build_contact_header,
+    "summary": _build_summary_section,
+    "skills": _build_skills_section,
+    "experience": _build_experience_section,
+    "projects": _build_projects_section,
+    "education": _build_education_section,
+}
+
+_SECTION_FREEZERS = {
+    SECTION_CONTACT: freeze_contact,
+    "summary": str,
+    "skills": freeze_skills,
+    "experience": freeze_experience,
+    "projects": freeze_projects,
+    "education": freeze_education,
+}
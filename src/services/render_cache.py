@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import asdict
+from functools import lru_cache
+
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import TableStyle
+
+from src.core import styles
+from src.core.settings import RENDERER_VERSION, SOURCE_DATE_EPOCH_ENV
+from src.models.render_options import RenderOptions
+from src.models.resume_data import ResumeData
+
+CACHE_ENTRY_SUFFIX = ".pdf"
+CACHE_ENTRY_MODE = 0o644
+BYTES_PER_MB = 1024 * 1024
+
+
+class RenderCache:
+    # _total_bytes only counts this process's stores and decides when to
+    # evict; eviction itself rescans the directory, so entries written by
+    # other processes sharing it are trimmed on the next eviction pass.
+    def __init__(self, directory: str, max_bytes: int, hard_link: bool = False) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hard_link = hard_link
+        os.makedirs(directory, exist_ok=True)
+        self._total_bytes = sum(size for _, _, size in self._list_entries())
+
+    def key_for(self, resume_data: ResumeData, options: RenderOptions) -> str:
+        payload = {
+            "resume": asdict(resume_data),
+            "options": asdict(options),
+            "styles": _style_fingerprint(),
+            "renderer": RENDERER_VERSION,
+            # Document dates follow this variable even in deterministic mode.
+            "source_date_epoch": os.environ.get(SOURCE_DATE_EPOCH_ENV),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        entry_path = self._entry_path(key)
+        try:
+            os.utime(entry_path)
+        except FileNotFoundError:
+            self._unlink_shared_output(output_path)
+            return False
+        try:
+            self._place(entry_path, output_path)
+        except FileNotFoundError:
+            # Evicted, possibly by another process, between utime and the copy.
+            self._unlink_shared_output(output_path)
+            return False
+        return True
+
+    def store(self, key: str, rendered_path: str) -> None:
+        # The PDF is already at its output path; failing to cache it only
+        # costs a render next time, so disk errors are not passed on.
+        try:
+            file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        entry_path = self._entry_path(key)
+        try:
+            os.close(file_descriptor)
+            shutil.copyfile(rendered_path, temp_path)
+            os.chmod(temp_path, CACHE_ENTRY_MODE)
+            size = os.path.getsize(temp_path)
+            try:
+                replaced_size = os.path.getsize(entry_path)
+            except FileNotFoundError:
+                replaced_size = 0
+            os.replace(temp_path, entry_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        self._total_bytes += size - replaced_size
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + CACHE_ENTRY_SUFFIX)
+
+    def _place(self, entry_path: str, output_path: str) -> None:
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.hard_link:
+            try:
+                if os.path.lexists(output_path):
+                    os.remove(output_path)
+                os.link(entry_path, output_path)
+                return
+            except OSError:
+                pass
+        shutil.copyfile(entry_path, output_path)
+
+    def _unlink_shared_output(self, output_path: str) -> None:
+        # A hard-linked output shares its inode with a cache entry, so rendering
+        # over it in place would corrupt that entry.
+        try:
+            if os.stat(output_path).st_nlink > 1:
+                os.remove(output_path)
+        except FileNotFoundError:
+            pass
+
+    def _list_entries(self) -> list[tuple[float, str, int]]:
+        entries = []
+        with os.scandir(self.directory) as scan:
+            for entry in scan:
+                if entry.name.endswith(CACHE_ENTRY_SUFFIX):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._list_entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        self._total_bytes = total
+
+
+@lru_cache(maxsize=1)
+def _style_fingerprint() -> dict:
+    fingerprint = {}
+    for name, value in vars(styles).items():
+        if not name.isupper():
+            continue
+        if isinstance(value, ParagraphStyle):
+            fingerprint[name] = sorted(value.__dict__.items())
+        elif isinstance(value, TableStyle):
+            fingerprint[name] = value.getCommands()
+        elif isinstance(value, (int, float, str, tuple)):
+            fingerprint[name] = value
+    return fingerprint
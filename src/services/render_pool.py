@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from typing import Callable, Iterable, Iterator
+
+from src.core.styles import build_resume_styles
+from src.models.render_job import RenderJob, RenderOutcome
+from src.models.render_options import RenderOptions
+from src.models.theme import Theme
+from src.services.input_sources import build_output_paths, find_output_conflicts, output_conflict_error
+from src.services.parse_cache import ParseCache, parse_resume_cached
+from src.services.pdf_renderer import SectionFlowableCache, render_resume_job
+from src.services.render_cache import RenderCache
+from src.services.yaml_parser import format_render_error, parse_resume_file
+
+IN_FLIGHT_PER_WORKER = 2
+
+
+def render_parallel(
+    jobs: Iterable[RenderJob],
+    workers: int,
+    max_in_flight: int | None = None,
+    ordered: bool = True,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+    share_sections: bool = False,
+) -> Iterator[RenderOutcome]:
+    render_job = partial(_render_job, options=options, cache=cache, share_sections=share_sections)
+    with create_render_pool(workers) as executor:
+        futures = ((job.source, _submit(executor, job.source, render_job, job)) for job in jobs)
+        yield from _collect_results(futures, max_in_flight or workers * IN_FLIGHT_PER_WORKER, ordered)
+
+
+def render_many_parallel(
+    input_paths: Iterable[str],
+    output_dir: str,
+    workers: int,
+    max_in_flight: int | None = None,
+    ordered: bool = True,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+    parse_cache: ParseCache | None = None,
+) -> Iterator[RenderOutcome]:
+    input_paths = list(input_paths)
+    output_paths = build_output_paths(input_paths, output_dir)
+    conflicts = find_output_conflicts(output_paths)
+    with create_render_pool(workers) as executor:
+        futures = (
+            (
+                input_path,
+                _completed_future(RenderOutcome(input_path, error=output_conflict_error(output_path)))
+                if output_path in conflicts
+                else _submit_input(executor, input_path, output_path, options, cache, parse_cache),
+            )
+            for input_path, output_path in zip(input_paths, output_paths)
+        )
+        yield from _collect_results(futures, max_in_flight or workers * IN_FLIGHT_PER_WORKER, ordered)
+
+
+def create_render_pool(workers: int, themes: Iterable[Theme] = ()) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker, initargs=(tuple(themes),))
+
+
+def _warm_worker(themes: tuple[Theme, ...] = ()) -> None:
+    import reportlab.platypus  # noqa: F401
+
+    for theme in themes:
+        build_resume_styles(theme)
+
+
+def _render_job(
+    job: RenderJob,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+    share_sections: bool = False,
+) -> RenderOutcome:
+    section_cache = _worker_section_cache() if share_sections else None
+    return render_resume_job(job, options, cache, section_cache)
+
+
+def _render_input(
+    input_path: str,
+    output_path: str,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+) -> RenderOutcome:
+    try:
+        resume_data = parse_resume_file(input_path)
+    except Exception as error:
+        return RenderOutcome(input_path, error=format_render_error(error))
+    return _render_job(RenderJob(input_path, resume_data, output_path), options, cache)
+
+
+@lru_cache(maxsize=1)
+def _worker_section_cache() -> SectionFlowableCache:
+    # Each worker process renders one job at a time, so a process-wide cache
+    # lets jobs landing on the same worker share their unchanged sections.
+    return SectionFlowableCache()
+
+
+def _submit_input(
+    executor: ProcessPoolExecutor,
+    input_path: str,
+    output_path: str,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+    parse_cache: ParseCache | None = None,
+) -> Future:
+    if parse_cache is None:
+        # Parsing in the workers keeps the parent from serialising the batch.
+        return _submit(executor, input_path, _render_input, input_path, output_path, options, cache)
+    # The parse cache lives in this process, so cached inputs are parsed here.
+    try:
+        resume_data = parse_resume_cached(input_path, parse_cache)
+    except Exception as error:
+        return _completed_future(RenderOutcome(input_path, error=format_render_error(error)))
+    job = RenderJob(input_path, resume_data, output_path)
+    return _submit(executor, input_path, _render_job, job, options, cache)
+
+
+def _submit(executor: ProcessPoolExecutor, source: str, function: Callable[..., RenderOutcome], *args) -> Future:
+    try:
+        return executor.submit(function, *args)
+    except BrokenProcessPool as error:
+        return _completed_future(_worker_failure(source, error))
+
+
+def _worker_failure(source: str, error: Exception) -> RenderOutcome:
+    return RenderOutcome(source, error=f"Worker failed: {str(error) or type(error).__name__}")
+
+
+def _completed_future(outcome: RenderOutcome) -> Future:
+    future = Future()
+    future.set_result(outcome)
+    return future
+
+
+def _collect_results(
+    futures: Iterator[tuple[str, Future]],
+    max_in_flight: int,
+    ordered: bool,
+) -> Iterator[RenderOutcome]:
+    if ordered:
+        yield from _collect_ordered(futures, max_in_flight)
+    else:
+        yield from _collect_unordered(futures, max_in_flight)
+
+
+def _collect_ordered(futures: Iterator[tuple[str, Future]], max_in_flight: int) -> Iterator[RenderOutcome]:
+    pending = deque()
+    for source, future in futures:
+        pending.append((source, future))
+        if len(pending) >= max_in_flight:
+            yield _outcome_of(*pending.popleft())
+    while pending:
+        yield _outcome_of(*pending.popleft())
+
+
+def _collect_unordered(futures: Iterator[tuple[str, Future]], max_in_flight: int) -> Iterator[RenderOutcome]:
+    sources = {}
+    for source, future in futures:
+        sources[future] = source
+        if len(sources) >= max_in_flight:
+            done, _ = wait(sources, return_when=FIRST_COMPLETED)
+            for finished in done:
+                yield _outcome_of(sources.pop(finished), finished)
+    for finished in as_completed(list(sources)):
+        yield _outcome_of(sources.pop(finished), finished)
+
+
+def _outcome_of(source: str, future: Future) -> RenderOutcome:
+    # Render errors come back as outcomes, so anything raised here is the pool
+    # itself failing: a killed worker or a job or result that cannot be pickled.
+    try:
+        return future.result()
+    except Exception as error:
+        return _worker_failure(source, error)
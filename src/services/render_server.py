@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+import socketserver
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http import HTTPStatus
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from src.core.settings import (
+    DEFAULT_QUEUE_LIMIT,
+    DEFAULT_REQUEST_TIMEOUT_SECONDS,
+    INPUT_FORMAT_JSON,
+    INPUT_FORMAT_MSGPACK,
+    INPUT_FORMAT_YAML,
+    MAX_PAYLOAD_BYTES,
+)
+from src.core.styles import build_resume_styles
+from src.models.render_options import DEFAULT_RENDER_OPTIONS, RenderOptions
+from src.models.theme import Theme
+from src.services.pdf_renderer import render_resume_pdf_bytes
+from src.services.render_pool import create_render_pool
+from src.services.yaml_parser import ResumeParseError, parse_resume_bytes, parse_resume_text
+from src.utils.validators import ResumeValidationError
+
+HEALTH_PATH = "/health"
+RENDER_PATH = "/render"
+PDF_CONTENT_TYPE = "application/pdf"
+TEXT_CONTENT_TYPE = "text/plain; charset=utf-8"
+# Any other request Content-Type is read as YAML, which also accepts JSON.
+PAYLOAD_FORMATS = {
+    "application/json": INPUT_FORMAT_JSON,
+    "application/msgpack": INPUT_FORMAT_MSGPACK,
+    "application/x-msgpack": INPUT_FORMAT_MSGPACK,
+}
+
+
+class RenderQueueFullError(Exception):
+    pass
+
+
+class RenderTimeoutError(Exception):
+    pass
+
+
+class UnknownThemeError(Exception):
+    pass
+
+
+class RenderServer:
+    def __init__(
+        self,
+        workers: int,
+        queue_limit: int = DEFAULT_QUEUE_LIMIT,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT_SECONDS,
+        options: RenderOptions | None = None,
+        themes: dict[str, Theme] | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.options = options or DEFAULT_RENDER_OPTIONS
+        self.themes = dict(themes or {})
+        for theme in self.themes.values():
+            build_resume_styles(theme)
+        self._slots = threading.BoundedSemaphore(queue_limit)
+        self._executor = create_render_pool(workers, self.themes.values())
+
+    def render(
+        self,
+        payload: str | bytes,
+        theme_name: str | None = None,
+        input_format: str = INPUT_FORMAT_YAML,
+    ) -> bytes:
+        options = self._options_for(theme_name)
+        if not self._slots.acquire(blocking=False):
+            raise RenderQueueFullError("Render queue is full")
+        try:
+            # Parsing runs in the worker too, so the queue limit and the
+            # timeout cover the whole request.
+            future = self._executor.submit(_parse_and_render, payload, input_format, options)
+        except BaseException:
+            self._slots.release()
+            raise
+        # The slot follows the job rather than the request: a render that
+        # outlives its timeout keeps its slot until the worker finishes.
+        future.add_done_callback(lambda _: self._slots.release())
+
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            # Only a job still queued can be cancelled; a running render cannot
+            # be interrupted, so the timeout bounds how long the client waits.
+            future.cancel()
+            raise RenderTimeoutError(f"Render exceeded {self.timeout:g}s timeout")
+
+    def _options_for(self, theme_name: str | None) -> RenderOptions:
+        if theme_name is None:
+            return self.options
+        if theme_name not in self.themes:
+            raise UnknownThemeError(f"Unknown theme: '{theme_name}'")
+        return replace(self.options, theme=self.themes[theme_name])
+
+    def close(self) -> None:
+        self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self) -> RenderServer:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _parse_and_render(payload: str | bytes, input_format: str, options: RenderOptions) -> bytes:
+    if isinstance(payload, str):
+        resume_data = parse_resume_text(payload)
+    else:
+        resume_data = parse_resume_bytes(payload, input_format)
+    return render_resume_pdf_bytes(resume_data, options)
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.remove(self.server_address)
+
+
+def create_http_server(render_server: RenderServer, host: str, port: int) -> ThreadingHTTPServer:
+    return ThreadingHTTPServer((host, port), _build_handler(render_server))
+
+
+def create_unix_server(render_server: RenderServer, socket_path: str) -> ThreadingUnixHTTPServer:
+    return ThreadingUnixHTTPServer(socket_path, _build_handler(render_server))
+
+
+def _build_handler(render_server: RenderServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(_RenderRequestHandler):
+        pass
+
+    Handler.render_server = render_server
+    return Handler
+
+
+def _parse_content_length(value: str | None) -> int | None:
+    try:
+        content_length = int(value or 0)
+    except ValueError:
+        return None
+    return content_length if content_length >= 0 else None
+
+
+class _RenderRequestHandler(BaseHTTPRequestHandler):
+    render_server: RenderServer
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        if urlsplit(self.path).path == HEALTH_PATH:
+            self._send_text(HTTPStatus.OK, "ok")
+        else:
+            self._send_text(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path not in ("/", RENDER_PATH):
+            self._send_text(HTTPStatus.NOT_FOUND, f"Unknown path: {self.path}")
+            return
+        theme_name = parse_qs(url.query).get("theme", [None])[0]
+
+        content_length = _parse_content_length(self.headers.get("Content-Length"))
+        if content_length is None:
+            # The body cannot be skipped without a usable length.
+            self.close_connection = True
+            self._send_text(HTTPStatus.BAD_REQUEST, "Invalid Content-Length")
+            return
+        if content_length > MAX_PAYLOAD_BYTES:
+            self.close_connection = True
+            self._send_text(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Payload too large")
+            return
+
+        content_type = (self.headers.get("Content-Type") or "").split(";")[0].strip().lower()
+        input_format = PAYLOAD_FORMATS.get(content_type, INPUT_FORMAT_YAML)
+        payload = self.rfile.read(content_length)
+        if input_format == INPUT_FORMAT_YAML:
+            try:
+                payload = payload.decode("utf-8")
+            except UnicodeDecodeError as decode_error:
+                self._send_text(HTTPStatus.BAD_REQUEST, f"Parse error: Payload is not valid UTF-8: {decode_error}")
+                return
+
+        try:
+            pdf_bytes = self.render_server.render(payload, theme_name, input_format)
+        except UnknownThemeError as theme_error:
+            self._send_text(HTTPStatus.BAD_REQUEST, str(theme_error))
+        except ResumeParseError as parse_error:
+            self._send_text(HTTPStatus.BAD_REQUEST, f"Parse error: {parse_error}")
+        except ResumeValidationError as validation_error:
+            self._send_text(HTTPStatus.UNPROCESSABLE_ENTITY, f"Validation error: {validation_error}")
+        except RenderQueueFullError as queue_error:
+            self._send_text(HTTPStatus.SERVICE_UNAVAILABLE, str(queue_error), retry_after=1)
+        except RenderTimeoutError as timeout_error:
+            self._send_text(HTTPStatus.GATEWAY_TIMEOUT, str(timeout_error))
+        except Exception as unexpected_error:
+            self._send_text(HTTPStatus.INTERNAL_SERVER_ERROR, f"Unexpected error: {unexpected_error}")
+        else:
+            self._send(HTTPStatus.OK, pdf_bytes, PDF_CONTENT_TYPE)
+
+    def address_string(self) -> str:
+        # Unix domain sockets report an empty client address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def _send_text(self, status: HTTPStatus, message: str, retry_after: int | None = None) -> None:
+        self._send(status, f"{message}\n".encode("utf-8"), TEXT_CONTENT_TYPE, retry_after)
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: str,
+        retry_after: int | None = None,
+    ) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if retry_after is not None:
+            self.send_header("Retry-After", str(retry_after))
+        self.end_headers()
+        self.wfile.write(body)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from typing import Iterable, Iterator
+
+from src.models.render_job import RenderJob, RenderOutcome
+from src.models.render_options import RenderOptions
+from src.models.resume_data import Experience, Project, ResumeData, SkillCategory
+from src.models.variant_spec import VariantSpec
+from src.services.input_sources import PDF_EXTENSION
+from src.services.pdf_renderer import SectionFlowableCache, render_resume_job
+from src.services.render_cache import RenderCache
+from src.services.render_pool import render_parallel
+
+
+def render_variants(
+    base: ResumeData,
+    specs: Iterable[VariantSpec],
+    output_dir: str,
+    workers: int = 1,
+    options: RenderOptions | None = None,
+    cache: RenderCache | None = None,
+) -> Iterator[RenderOutcome]:
+    jobs = (
+        RenderJob(spec.name, apply_variant(base, spec), build_variant_output_path(spec, output_dir))
+        for spec in specs
+    )
+    if workers > 1:
+        yield from render_parallel(jobs, workers, options=options, cache=cache, share_sections=True)
+        return
+
+    section_cache = SectionFlowableCache()
+    for job in jobs:
+        yield render_resume_job(job, options, cache, section_cache)
+
+
+def build_variant_output_path(spec: VariantSpec, output_dir: str) -> str:
+    return os.path.join(output_dir, spec.name + PDF_EXTENSION)
+
+
+def apply_variant(base: ResumeData, spec: VariantSpec) -> ResumeData:
+    # Sections the spec does not touch keep the base objects, so they freeze
+    # to equal keys and their flowables are reused across variants.
+    changes = {}
+    if spec.summary is not None:
+        changes["summary"] = spec.summary
+    if spec.skill_categories is not None or spec.include_skills is not None or spec.exclude_skills:
+        changes["skills"] = _filter_skills(base.skills, spec)
+    if spec.experience_order or spec.max_bullets is not None:
+        changes["experience"] = _tailor_experience(base.experience, spec)
+    if spec.projects is not None or spec.max_bullets is not None:
+        changes["projects"] = _tailor_projects(base.projects, spec)
+    return replace(base, **changes) if changes else base
+
+
+def _filter_skills(skills: list[SkillCategory], spec: VariantSpec) -> list[SkillCategory]:
+    if spec.skill_categories is not None:
+        by_category = {skill.category: skill for skill in skills}
+        skills = [by_category[category] for category in spec.skill_categories if category in by_category]
+
+    included = None if spec.include_skills is None else set(spec.include_skills)
+    excluded = set(spec.exclude_skills)
+    result = []
+    for skill in skills:
+        items = [
+            item for item in skill.items
+            if (included is None or item in included) and item not in excluded
+        ]
+        if len(items) == len(skill.items):
+            result.append(skill)
+        elif items:
+            result.append(replace(skill, items=items))
+    return result
+
+
+def _tailor_experience(experience: list[Experience], spec: VariantSpec) -> list[Experience]:
+    if spec.experience_order:
+        rank = {company: index for index, company in enumerate(spec.experience_order)}
+        experience = sorted(experience, key=lambda exp: rank.get(exp.company, len(rank)))
+    return [_trim_bullets(exp, spec.max_bullets) for exp in experience]
+
+
+def _tailor_projects(projects: list[Project], spec: VariantSpec) -> list[Project]:
+    if spec.projects is not None:
+        by_name = {proj.name: proj for proj in projects}
+        projects = [by_name[name] for name in spec.projects if name in by_name]
+    return [_trim_bullets(proj, spec.max_bullets) for proj in projects]
+
+
+def _trim_bullets(entry: Experience | Project, max_bullets: int | None) -> Experience | Project:
+    if max_bullets is None or len(entry.bullets) <= max_bullets:
+        return entry
+    return replace(entry, bullets=entry.bullets[:max_bullets])
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from src.core.settings import DEFAULT_WATCH_POLL_SECONDS, ENGINE_CANVAS
+from src.models.render_options import RenderOptions
+from src.models.resume_data import ResumeData
+from src.services.pdf_renderer import (
+    SectionFlowableCache,
+    iter_section_inputs,
+    render_flowables_pdf,
+    render_resume_pdf,
+    resolve_styles,
+)
+from src.services.parse_cache import ParseCache
+from src.services.yaml_parser import ResumeParseError, format_render_error
+from src.utils.validators import ResumeValidationError
+
+
+@dataclass
+class WatchEvent:
+    rendered: bool
+    elapsed_seconds: float
+    rebuilt_sections: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+class ResumeWatcher:
+    def __init__(
+        self,
+        input_path: str,
+        output_path: str,
+        options: RenderOptions | None = None,
+        poll_interval: float = DEFAULT_WATCH_POLL_SECONDS,
+        parse_cache: ParseCache | None = None,
+    ) -> None:
+        self.input_path = input_path
+        self.output_path = output_path
+        self.options = options
+        self.poll_interval = poll_interval
+        self._file_signature = None
+        self._resume_data: ResumeData | None = None
+        self._section_cache = SectionFlowableCache()
+        # Saves that leave the content unchanged still move the mtime, so
+        # the watcher compares content hashes instead.
+        self.parse_cache = parse_cache or ParseCache(verify_hash=True)
+
+    def run(self, report: Callable[[WatchEvent], None]) -> None:
+        while True:
+            event = self.poll()
+            if event is not None:
+                report(event)
+            time.sleep(self.poll_interval)
+
+    def poll(self) -> WatchEvent | None:
+        signature = _read_file_signature(self.input_path)
+        if signature is None or signature == self._file_signature:
+            return None
+        self._file_signature = signature
+
+        started = time.perf_counter()
+        try:
+            resume_data = self.parse_cache.parse(self.input_path)
+        except (ResumeParseError, ResumeValidationError) as error:
+            return WatchEvent(False, time.perf_counter() - started, error=format_render_error(error))
+
+        if resume_data == self._resume_data:
+            return WatchEvent(False, time.perf_counter() - started)
+
+        try:
+            rebuilt_sections = self._render(resume_data)
+        except Exception as error:
+            self._section_cache.clear()
+            return WatchEvent(False, time.perf_counter() - started, error=format_render_error(error))
+
+        self._resume_data = resume_data
+        return WatchEvent(True, time.perf_counter() - started, rebuilt_sections)
+
+    def _render(self, resume_data: ResumeData) -> list[str]:
+        if self.options is not None and self.options.engine == ENGINE_CANVAS:
+            # The canvas engine redraws the whole document; it is cheaper than
+            # reusing Platypus flowables for a single changed section.
+            render_resume_pdf(resume_data, self.output_path, self.options)
+            return [section_name for section_name, _ in iter_section_inputs(resume_data)]
+        flowables, rebuilt_sections = self._section_cache.build_all(resume_data, resolve_styles(self.options))
+        render_flowables_pdf(resume_data, flowables, self.output_path, self.options)
+        return rebuilt_sections
+
+
+def _read_file_signature(path: str) -> tuple[int, int, int] | None:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        # Editors that save by rename briefly leave no file in place.
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
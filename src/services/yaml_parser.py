@@ -1,7 +1,27 @@
 from __future__ import annotations
 
+import os
+from dataclasses import replace
+from typing import Callable, Iterator
+
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    from orjson import JSONDecodeError, loads as json_loads
+except ImportError:
+    from json import JSONDecodeError, loads as json_loads
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from src.core.settings import INPUT_FORMAT_JSON, INPUT_FORMAT_MSGPACK, INPUT_FORMAT_YAML
 from src.models.resume_data import (
     ContactInfo,
     Education,
@@ -10,23 +30,132 @@ from src.models.resume_data import (
     ResumeData,
     SkillCategory,
 )
-from src.utils.validators import ResumeValidationError, validate_resume_data
+from src.models.theme import DEFAULT_THEME, Theme
+from src.models.variant_spec import VariantSpec
+from src.utils.profiling import (
+    STAGE_BUILD_MODEL,
+    STAGE_LOAD,
+    STAGE_VALIDATE,
+    measure_stage,
+)
+from src.utils.validators import (
+    ResumeValidationError,
+    validate_resume_data,
+    validate_theme_specs,
+    validate_variant_specs,
+)
 
 
 class ResumeParseError(Exception):
     pass
 
 
-def parse_resume_file(filepath: str) -> ResumeData:
-    raw_dict = _load_yaml_file(filepath)
-    _run_validation(raw_dict)
-    return _build_resume_data(raw_dict)
+ResumeLoader = Callable[[bytes], object]
+
+
+def parse_resume_file(filepath: str, input_format: str | None = None) -> ResumeData:
+    input_format = input_format or input_format_for_path(filepath)
+    with measure_stage(STAGE_LOAD):
+        if input_format == INPUT_FORMAT_YAML:
+            raw_dict = _load_yaml_file(filepath)
+        else:
+            raw_dict = _load_resume_bytes(_read_file_bytes(filepath), input_format)
+    return _validate_and_build(raw_dict)
+
+
+def parse_resume_text(text: str) -> ResumeData:
+    with measure_stage(STAGE_LOAD):
+        raw_dict = _load_yaml_text(text)
+    return _validate_and_build(raw_dict)
+
+
+def parse_resume_bytes(data: bytes, input_format: str = INPUT_FORMAT_YAML) -> ResumeData:
+    with measure_stage(STAGE_LOAD):
+        raw_dict = _load_resume_bytes(data, input_format)
+    return _validate_and_build(raw_dict)
+
+
+def parse_resume_dict(raw_dict: dict) -> ResumeData:
+    return _validate_and_build(raw_dict)
+
+
+def register_resume_loader(input_format: str, loader: ResumeLoader, extensions: tuple[str, ...] = ()) -> None:
+    _RESUME_LOADERS[input_format] = loader
+    for extension in extensions:
+        _FORMAT_EXTENSIONS[extension.lower()] = input_format
+
+
+def input_format_for_path(path: str) -> str:
+    # Anything unrecognised is read as YAML, which also accepts plain JSON.
+    extension = os.path.splitext(path)[1].lower()
+    return _FORMAT_EXTENSIONS.get(extension, INPUT_FORMAT_YAML)
+
+
+def resume_file_extensions() -> tuple[str, ...]:
+    return tuple(_FORMAT_EXTENSIONS)
+
+
+def format_render_error(error: Exception) -> str:
+    if isinstance(error, ResumeParseError):
+        return f"Parse error: {error}"
+    if isinstance(error, ResumeValidationError):
+        return f"Validation error: {error}"
+    return f"Unexpected error: {error}"
+
+
+def _validate_and_build(raw_dict: dict) -> ResumeData:
+    with measure_stage(STAGE_VALIDATE):
+        _run_validation(raw_dict)
+    with measure_stage(STAGE_BUILD_MODEL):
+        return _build_resume_data(raw_dict)
+
+
+def parse_variant_file(filepath: str) -> list[VariantSpec]:
+    raw_variants = _load_yaml_file(filepath)
+    errors = validate_variant_specs(raw_variants)
+    if errors:
+        raise ResumeValidationError(errors)
+    return [_build_variant_spec(entry) for entry in raw_variants]
+
+
+def parse_theme_file(filepath: str) -> dict[str, Theme]:
+    raw_themes = _load_yaml_file(filepath)
+    errors = validate_theme_specs(raw_themes)
+    if errors:
+        raise ResumeValidationError(errors)
+    return {
+        str(name): replace(DEFAULT_THEME, name=str(name), **settings)
+        for name, settings in raw_themes.items()
+    }
+
+
+def iter_resume_documents(filepath: str) -> Iterator[tuple[int, ResumeData | None, ResumeValidationError | None]]:
+    # A document that fails validation is yielded with its error in place of
+    # the model, so one bad resume neither stops the stream nor vanishes.
+    try:
+        file = open(filepath, "r")
+    except FileNotFoundError:
+        raise ResumeParseError(f"File not found: {filepath}")
+
+    with file:
+        try:
+            for index, raw_dict in enumerate(yaml.load_all(file, Loader=SafeLoader)):
+                if raw_dict is None:
+                    continue
+                try:
+                    _run_validation(raw_dict)
+                except ResumeValidationError as validation_error:
+                    yield index, None, validation_error
+                    continue
+                yield index, _build_resume_data(raw_dict), None
+        except yaml.YAMLError as exc:
+            raise ResumeParseError(f"Invalid YAML syntax: {exc}")
 
 
 def _load_yaml_file(filepath: str) -> dict:
     try:
         with open(filepath, "r") as file:
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=SafeLoader)
     except FileNotFoundError:
         raise ResumeParseError(f"File not found: {filepath}")
     except yaml.YAMLError as exc:
@@ -38,6 +167,74 @@ def _load_yaml_file(filepath: str) -> dict:
     return data
 
 
+def _read_file_bytes(filepath: str) -> bytes:
+    try:
+        with open(filepath, "rb") as file:
+            return file.read()
+    except FileNotFoundError:
+        raise ResumeParseError(f"File not found: {filepath}")
+
+
+def _load_resume_bytes(data: bytes, input_format: str) -> object:
+    loader = _RESUME_LOADERS.get(input_format)
+    if loader is None:
+        raise ResumeParseError(f"Unknown input format: '{input_format}'")
+    return loader(data)
+
+
+def _load_yaml_bytes(data: bytes) -> object:
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise ResumeParseError(f"Invalid UTF-8 in YAML input: {exc}")
+    return _load_yaml_text(text)
+
+
+def _load_json_bytes(data: bytes) -> object:
+    try:
+        return json_loads(data)
+    except UnicodeDecodeError as exc:
+        # The stdlib fallback decodes bytes before parsing; orjson reports
+        # bad UTF-8 as a JSONDecodeError instead.
+        raise ResumeParseError(f"Invalid UTF-8 in JSON input: {exc}")
+    except JSONDecodeError as exc:
+        raise ResumeParseError(f"Invalid JSON syntax: {exc}")
+
+
+def _load_msgpack_bytes(data: bytes) -> object:
+    if msgpack is None:
+        raise ResumeParseError("MessagePack input requires the 'msgpack' package")
+    try:
+        return msgpack.unpackb(data)
+    except (ValueError, msgpack.UnpackException) as exc:
+        raise ResumeParseError(f"Invalid MessagePack data: {exc}")
+
+
+_RESUME_LOADERS: dict[str, ResumeLoader] = {
+    INPUT_FORMAT_YAML: _load_yaml_bytes,
+    INPUT_FORMAT_JSON: _load_json_bytes,
+    INPUT_FORMAT_MSGPACK: _load_msgpack_bytes,
+}
+_FORMAT_EXTENSIONS = {
+    ".yaml": INPUT_FORMAT_YAML,
+    ".yml": INPUT_FORMAT_YAML,
+    ".json": INPUT_FORMAT_JSON,
+    ".msgpack": INPUT_FORMAT_MSGPACK,
+}
+
+
+def _load_yaml_text(text: str) -> dict:
+    try:
+        data = yaml.load(text, Loader=SafeLoader)
+    except yaml.YAMLError as exc:
+        raise ResumeParseError(f"Invalid YAML syntax: {exc}")
+
+    if data is None:
+        raise ResumeParseError("YAML document is empty")
+
+    return data
+
+
 def _run_validation(raw_dict: dict) -> None:
     errors = validate_resume_data(raw_dict)
     if errors:
@@ -125,3 +322,21 @@ def _build_projects(projects_list: list[dict]) -> list[Project]:
         )
         result.append(proj)
     return result
+
+
+def _build_variant_spec(entry: dict) -> VariantSpec:
+    skills = entry.get("skills") or {}
+    return VariantSpec(
+        name=entry["name"],
+        summary=entry.get("summary"),
+        skill_categories=_optional_tuple(skills.get("categories")),
+        include_skills=_optional_tuple(skills.get("include")),
+        exclude_skills=tuple(skills.get("exclude", ())),
+        experience_order=tuple(entry.get("experience_order", ())),
+        projects=_optional_tuple(entry.get("projects")),
+        max_bullets=entry.get("max_bullets"),
+    )
+
+
+def _optional_tuple(values: list | None) -> tuple | None:
+    return None if values is None else tuple(values)
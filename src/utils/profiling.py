@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Iterator, TextIO
+
+STAGE_LOAD = "load"
+STAGE_VALIDATE = "validate"
+STAGE_BUILD_MODEL = "build_model"
+STAGE_BUILD_FLOWABLES = "build_flowables"
+STAGE_LAYOUT = "layout"
+
+PIPELINE_STAGES = (
+    STAGE_LOAD,
+    STAGE_VALIDATE,
+    STAGE_BUILD_MODEL,
+    STAGE_BUILD_FLOWABLES,
+    STAGE_LAYOUT,
+)
+
+
+@dataclass
+class StageTiming:
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    allocated_blocks: int | None = None
+    allocated_bytes: int | None = None
+    peak_bytes: int | None = None
+    error: str | None = None
+
+
+StageHook = Callable[[StageTiming], None]
+
+_stage_hooks: list[StageHook] = []
+
+
+def add_stage_hook(hook: StageHook) -> None:
+    _stage_hooks.append(hook)
+
+
+def remove_stage_hook(hook: StageHook) -> None:
+    _stage_hooks.remove(hook)
+
+
+@contextmanager
+def measure_stage(stage: str) -> Iterator[None]:
+    if not _stage_hooks:
+        yield
+        return
+
+    # Deferred until a hook is installed: tracemalloc pulls in pickle, which
+    # would otherwise land on every CLI startup.
+    import tracemalloc
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        snapshot_before = tracemalloc.take_snapshot()
+    wall_started = time.perf_counter()
+    cpu_started = time.thread_time()
+    error = None
+
+    try:
+        yield
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        # A failing stage still gets its record, marked with the exception type.
+        timing = StageTiming(
+            stage=stage,
+            wall_seconds=time.perf_counter() - wall_started,
+            cpu_seconds=time.thread_time() - cpu_started,
+            error=error,
+        )
+        if tracing:
+            _, timing.peak_bytes = tracemalloc.get_traced_memory()
+            differences = tracemalloc.take_snapshot().compare_to(snapshot_before, "filename")
+            timing.allocated_blocks = sum(difference.count_diff for difference in differences)
+            timing.allocated_bytes = sum(difference.size_diff for difference in differences)
+
+        for hook in list(_stage_hooks):
+            hook(timing)
+
+
+class JsonLinesStageWriter:
+    def __init__(self, stream: TextIO) -> None:
+        self.stream = stream
+
+    def __call__(self, timing: StageTiming) -> None:
+        import json
+
+        record = {"timestamp": time.time(), "pid": os.getpid(), **asdict(timing)}
+        self.stream.write(json.dumps(record) + "\n")
+        self.stream.flush()
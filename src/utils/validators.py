@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, fields
+from functools import lru_cache
+
+from src.models.theme import DEFAULT_THEME, Theme
+
 VALID_MONTH_NAMES = {
     "jan", "january",
     "feb", "february",
@@ -21,7 +26,40 @@ class ResumeValidationError(Exception):
         self.errors = errors
         super().__init__(f"Validation failed: {'; '.join(errors)}")
 
+    def __reduce__(self):
+        return (type(self), (self.errors,))
+
+
+VALIDATION_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class _EntrySchema:
+    label: str
+    required_keys: tuple[str, ...]
+    list_fields: tuple[str, ...] = ()
+    date_fields: tuple[str, ...] = ()
 
+
+_TOP_LEVEL_REQUIRED_KEYS = ("contact", "summary")
+_CONTACT_REQUIRED_KEYS = ("name", "email")
+_CONTACT_URL_FIELDS = ("linkedin", "github", "leetcode")
+
+_EXPERIENCE_SCHEMA = _EntrySchema(
+    "Experience",
+    ("company", "role", "location", "start_date", "end_date", "bullets"),
+    list_fields=("bullets",),
+    date_fields=("start_date", "end_date"),
+)
+_EDUCATION_SCHEMA = _EntrySchema(
+    "Education",
+    ("degree", "university", "start_date", "end_date"),
+    date_fields=("start_date", "end_date"),
+)
+_PROJECT_SCHEMA = _EntrySchema("Project", ("name",), list_fields=("bullets",))
+
+
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def _is_valid_email(value: str) -> bool:
     if not value or " " in value:
         return False
@@ -42,6 +80,7 @@ def _is_valid_email(value: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def _is_valid_url(value: str) -> bool:
     if not value or " " in value:
         return False
@@ -63,6 +102,7 @@ def _is_valid_url(value: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=VALIDATION_CACHE_SIZE)
 def _is_valid_date(value: str) -> bool:
     if not value:
         return False
@@ -91,48 +131,38 @@ def _is_valid_date(value: str) -> bool:
 def validate_required_fields(data: dict, required_keys: list[str]) -> list[str]:
     errors = []
     for key in required_keys:
-        if key not in data or data[key] is None:
+        value = data.get(key)
+        if value is None:
             errors.append(f"Missing required field: '{key}'")
-        elif isinstance(data[key], str) and data[key].strip() == "":
+        elif isinstance(value, str) and value.strip() == "":
             errors.append(f"Field '{key}' cannot be empty")
     return errors
 
 
-def _validate_single_entry(
-    entry: dict,
-    required_keys: list[str],
-    list_fields: list[str],
-    date_fields: list[str],
-) -> list[str]:
-    errors = validate_required_fields(entry, required_keys)
-    for field_name in list_fields:
+def _validate_single_entry(entry: dict, schema: _EntrySchema) -> list[str]:
+    errors = validate_required_fields(entry, schema.required_keys)
+    for field_name in schema.list_fields:
         if field_name in entry and not isinstance(entry[field_name], list):
             errors.append(f"'{field_name}' must be a list")
-    for field_name in date_fields:
+    for field_name in schema.date_fields:
         field_value = entry.get(field_name)
         if field_value and not _is_valid_date(str(field_value)):
             errors.append(f"Invalid {field_name} format: '{field_value}'")
     return errors
 
 
-def _validate_entry_list(
-    entries: list,
-    label: str,
-    required_keys: list[str],
-    list_fields: list[str] = (),
-    date_fields: list[str] = (),
-) -> list[str]:
+def _validate_entry_list(entries: list, schema: _EntrySchema) -> list[str]:
     if not isinstance(entries, list):
-        return [f"'{label.lower()}' must be a list"]
+        return [f"'{schema.label.lower()}' must be a list"]
     errors = []
     for index, entry in enumerate(entries):
-        entry_label = f"{label} entry {index + 1}"
         if not isinstance(entry, dict):
-            errors.append(f"{entry_label} must be a dictionary")
+            errors.append(f"{schema.label} entry {index + 1} must be a dictionary")
             continue
-        entry_errors = _validate_single_entry(entry, required_keys, list_fields, date_fields)
-        for error in entry_errors:
-            errors.append(f"{entry_label}: {error}")
+        entry_errors = _validate_single_entry(entry, schema)
+        if entry_errors:
+            entry_label = f"{schema.label} entry {index + 1}"
+            errors.extend(f"{entry_label}: {error}" for error in entry_errors)
     return errors
 
 
@@ -140,42 +170,26 @@ def validate_contact_info(contact_dict: dict) -> list[str]:
     if not isinstance(contact_dict, dict):
         return ["'contact' must be a dictionary"]
 
-    errors = validate_required_fields(contact_dict, ["name", "email"])
+    errors = validate_required_fields(contact_dict, _CONTACT_REQUIRED_KEYS)
 
     email = contact_dict.get("email")
     if email and not _is_valid_email(email):
         errors.append(f"Invalid email format: '{email}'")
 
-    linkedin = contact_dict.get("linkedin")
-    if linkedin and not _is_valid_url(linkedin):
-        errors.append(f"Invalid URL format for linkedin: '{linkedin}'")
-
-    github = contact_dict.get("github")
-    if github and not _is_valid_url(github):
-        errors.append(f"Invalid URL format for github: '{github}'")
-
-    leetcode = contact_dict.get("leetcode")
-    if leetcode and not _is_valid_url(leetcode):
-        errors.append(f"Invalid URL format for leetcode: '{leetcode}'")
+    for field_name in _CONTACT_URL_FIELDS:
+        url = contact_dict.get(field_name)
+        if url and not _is_valid_url(url):
+            errors.append(f"Invalid URL format for {field_name}: '{url}'")
 
     return errors
 
 
 def validate_experience_entries(entries: list) -> list[str]:
-    required_keys = ["company", "role", "location", "start_date", "end_date", "bullets"]
-    return _validate_entry_list(
-        entries, "Experience", required_keys,
-        list_fields=["bullets"],
-        date_fields=["start_date", "end_date"],
-    )
+    return _validate_entry_list(entries, _EXPERIENCE_SCHEMA)
 
 
 def validate_education_entries(entries: list) -> list[str]:
-    required_keys = ["degree", "university", "start_date", "end_date"]
-    return _validate_entry_list(
-        entries, "Education", required_keys,
-        date_fields=["start_date", "end_date"],
-    )
+    return _validate_entry_list(entries, _EDUCATION_SCHEMA)
 
 
 def validate_skills_entries(entries: list) -> list[str]:
@@ -188,44 +202,148 @@ def validate_skills_entries(entries: list) -> list[str]:
             errors.append(f"Skills entry {index + 1} must be a dictionary")
             continue
 
-        if "category" not in entry or not entry["category"]:
+        if not entry.get("category"):
             errors.append(f"Skills entry {index + 1}: Missing required field: 'category'")
 
-        if "items" not in entry or not isinstance(entry["items"], list):
+        if not isinstance(entry.get("items"), list):
             errors.append(f"Skills entry {index + 1}: 'items' must be a list")
 
     return errors
 
 
 def validate_project_entries(entries: list) -> list[str]:
-    return _validate_entry_list(
-        entries, "Project", ["name"],
-        list_fields=["bullets"],
-    )
+    return _validate_entry_list(entries, _PROJECT_SCHEMA)
+
+
+# Validation plan compiled once: sections are checked in this order in a single
+# walk over the raw dict, matching the historical error ordering.
+_SECTION_VALIDATORS = (
+    ("contact", validate_contact_info),
+    ("experience", validate_experience_entries),
+    ("education", validate_education_entries),
+    ("skills", validate_skills_entries),
+    ("projects", validate_project_entries),
+)
 
 
 def validate_resume_data(raw_dict: dict) -> list[str]:
     if not isinstance(raw_dict, dict):
         return ["Resume data must be a dictionary"]
 
+    errors = validate_required_fields(raw_dict, _TOP_LEVEL_REQUIRED_KEYS)
+
+    for section_key, validate_section in _SECTION_VALIDATORS:
+        if section_key in raw_dict:
+            errors.extend(validate_section(raw_dict[section_key]))
+
+    return errors
+
+
+_VARIANT_STRING_FIELDS = ("summary",)
+_VARIANT_LIST_FIELDS = ("experience_order", "projects")
+_VARIANT_SKILL_FIELDS = ("categories", "include", "exclude")
+_VARIANT_FIELDS = ("name", "skills", "max_bullets") + _VARIANT_STRING_FIELDS + _VARIANT_LIST_FIELDS
+
+
+def validate_variant_specs(raw_variants: object) -> list[str]:
+    if not isinstance(raw_variants, list):
+        return ["Variant spec must be a list of variants"]
+    if not raw_variants:
+        return ["Variant spec must define at least one variant"]
+
     errors = []
+    seen_names = set()
+    for index, entry in enumerate(raw_variants):
+        entry_label = f"Variant entry {index + 1}"
+        if not isinstance(entry, dict):
+            errors.append(f"{entry_label} must be a dictionary")
+            continue
+
+        entry_errors = _validate_variant_entry(entry)
+        name = entry.get("name")
+        if isinstance(name, str) and name in seen_names:
+            entry_errors.append(f"Duplicate variant name: '{name}'")
+        seen_names.add(name)
+        errors.extend(f"{entry_label}: {error}" for error in entry_errors)
+    return errors
+
 
-    top_level_errors = validate_required_fields(raw_dict, ["contact", "summary"])
-    errors.extend(top_level_errors)
+def _validate_variant_entry(entry: dict) -> list[str]:
+    errors = validate_required_fields(entry, ("name",))
 
-    if "contact" in raw_dict:
-        errors.extend(validate_contact_info(raw_dict["contact"]))
+    for field_name in entry:
+        if field_name not in _VARIANT_FIELDS:
+            errors.append(f"Unknown field: '{field_name}'")
 
-    if "experience" in raw_dict:
-        errors.extend(validate_experience_entries(raw_dict["experience"]))
+    name = entry.get("name")
+    if name is not None and (not isinstance(name, str) or "/" in name or "\\" in name or name in (".", "..")):
+        errors.append(f"Invalid variant name: '{name}'")
 
-    if "education" in raw_dict:
-        errors.extend(validate_education_entries(raw_dict["education"]))
+    for field_name in _VARIANT_STRING_FIELDS:
+        if field_name in entry and not isinstance(entry[field_name], str):
+            errors.append(f"'{field_name}' must be a string")
 
-    if "skills" in raw_dict:
-        errors.extend(validate_skills_entries(raw_dict["skills"]))
+    for field_name in _VARIANT_LIST_FIELDS:
+        if field_name in entry and not isinstance(entry[field_name], list):
+            errors.append(f"'{field_name}' must be a list")
 
-    if "projects" in raw_dict:
-        errors.extend(validate_project_entries(raw_dict["projects"]))
+    skills = entry.get("skills")
+    if skills is not None:
+        if not isinstance(skills, dict):
+            errors.append("'skills' must be a dictionary")
+        else:
+            for field_name in skills:
+                if field_name not in _VARIANT_SKILL_FIELDS:
+                    errors.append(f"Unknown field: 'skills.{field_name}'")
+                elif not isinstance(skills[field_name], list):
+                    errors.append(f"'skills.{field_name}' must be a list")
+
+    max_bullets = entry.get("max_bullets")
+    if max_bullets is not None and (not isinstance(max_bullets, int) or isinstance(max_bullets, bool) or max_bullets < 0):
+        errors.append("'max_bullets' must be a non-negative integer")
 
     return errors
+
+
+_THEME_FIELD_TYPES = {field.name: field.type for field in fields(Theme) if field.name != "name"}
+_THEME_POSITIVE_SUFFIXES = ("_font_size", "_ratio")
+
+
+def validate_theme_specs(raw_themes: object) -> list[str]:
+    if not isinstance(raw_themes, dict):
+        return ["Theme file must map theme names to settings"]
+
+    errors = []
+    for name, settings in raw_themes.items():
+        theme_label = f"Theme '{name}'"
+        if not isinstance(settings, dict):
+            errors.append(f"{theme_label} must be a dictionary")
+            continue
+        errors.extend(f"{theme_label}: {error}" for error in _validate_theme_settings(settings))
+    return errors
+
+
+def _validate_theme_settings(settings: dict) -> list[str]:
+    errors = []
+    for field_name, value in settings.items():
+        if field_name not in _THEME_FIELD_TYPES:
+            errors.append(f"Unknown field: '{field_name}'")
+        elif _THEME_FIELD_TYPES[field_name] == "str":
+            if not isinstance(value, str) or not value.strip():
+                errors.append(f"'{field_name}' must be a non-empty string")
+        elif field_name.endswith(_THEME_POSITIVE_SUFFIXES):
+            if not _is_number(value) or value <= 0:
+                errors.append(f"'{field_name}' must be a positive number")
+        elif not _is_number(value) or value < 0:
+            errors.append(f"'{field_name}' must be a non-negative number")
+
+    left_ratio = settings.get("left_column_ratio", DEFAULT_THEME.left_column_ratio)
+    right_ratio = settings.get("right_column_ratio", DEFAULT_THEME.right_column_ratio)
+    if _is_number(left_ratio) and _is_number(right_ratio) and left_ratio + right_ratio > 1:
+        errors.append("'left_column_ratio' and 'right_column_ratio' must add up to at most 1")
+    return errors
+
+
+def _is_number(value: object) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.services import async_renderer
+from src.services.async_renderer import (
+    AsyncRenderer,
+    async_parse_resume,
+    async_render_resume_pdf_bytes,
+)
+
+
+def test_async_parse_and_render_bytes():
+    async def run():
+        resume_data = await async_parse_resume("resume.yaml")
+        return await async_render_resume_pdf_bytes(resume_data)
+
+    assert asyncio.run(run()).startswith(b"%PDF")
+
+
+def test_async_renderer_limits_concurrency(monkeypatch):
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_render(resume_data, options):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        threading.Event().wait(0.05)
+        with lock:
+            active -= 1
+        return b"%PDF"
+
+    monkeypatch.setattr(async_renderer, "render_resume_pdf_bytes", slow_render)
+
+    async def run():
+        renderer = AsyncRenderer(ThreadPoolExecutor(max_workers=8), max_concurrency=2)
+        return await asyncio.gather(*(renderer.render_bytes(None) for _ in range(6)))
+
+    assert asyncio.run(run()) == [b"%PDF"] * 6
+    assert peak == 2
+
+
+def test_async_renderer_cancellation_keeps_slot_until_job_finishes(monkeypatch):
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def blocking_render(resume_data, options):
+        nonlocal calls
+        calls += 1
+        started.set()
+        release.wait(5)
+        return b"%PDF"
+
+    monkeypatch.setattr(async_renderer, "render_resume_pdf_bytes", blocking_render)
+
+    async def run():
+        renderer = AsyncRenderer(ThreadPoolExecutor(max_workers=2), max_concurrency=1)
+        task = asyncio.create_task(renderer.render_bytes(None))
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        waiting = asyncio.create_task(renderer.render_bytes(None))
+        await asyncio.sleep(0.05)
+        assert not waiting.done() and calls == 1
+        release.set()
+        return await waiting
+
+    assert asyncio.run(run()) == b"%PDF"
+    assert calls == 2
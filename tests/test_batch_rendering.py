@@ -0,0 +1,115 @@
+import multiprocessing
+import os
+import shutil
+
+import pytest
+
+from src.services.input_sources import resolve_resume_inputs
+from src.services.pdf_renderer import render_many
+from src.services import render_pool
+from src.services.render_pool import render_many_parallel
+from src.services.yaml_parser import ResumeParseError
+
+INVALID_RESUME_YAML = "contact:\n  name: Nobody\nsummary: Missing email\n"
+
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    input_dir = tmp_path / "inputs"
+    input_dir.mkdir()
+    shutil.copy("resume.yaml", input_dir / "alice.yaml")
+    shutil.copy("resume.yaml", input_dir / "bob.yml")
+    (input_dir / "broken.yaml").write_text(INVALID_RESUME_YAML)
+    (input_dir / "notes.txt").write_text("not a resume")
+    return input_dir
+
+
+def test_resolve_directory_lists_only_yaml_files(batch_dir):
+    paths = resolve_resume_inputs(str(batch_dir))
+    assert [p.split("/")[-1] for p in paths] == ["alice.yaml", "bob.yml", "broken.yaml"]
+
+
+def test_resolve_manifest_relative_to_manifest_directory(batch_dir):
+    manifest = batch_dir / "manifest.lst"
+    manifest.write_text("# nightly\nalice.yaml\n\nbob.yml\n")
+    paths = resolve_resume_inputs(str(manifest))
+    assert paths == [str(batch_dir / "alice.yaml"), str(batch_dir / "bob.yml")]
+
+
+def test_resolve_glob_without_matches_raises(tmp_path):
+    with pytest.raises(ResumeParseError):
+        resolve_resume_inputs(str(tmp_path / "*.yaml"))
+
+
+def test_render_many_continues_after_validation_failure(batch_dir, tmp_path):
+    output_dir = tmp_path / "pdfs"
+    outcomes = render_many(resolve_resume_inputs(str(batch_dir)), str(output_dir))
+
+    assert [outcome.succeeded for outcome in outcomes] == [True, True, False]
+    assert outcomes[2].error.startswith("Validation error:")
+    assert (output_dir / "alice.pdf").stat().st_size > 0
+    assert (output_dir / "bob.pdf").stat().st_size > 0
+    assert not (output_dir / "broken.pdf").exists()
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_render_many_parallel_reports_every_input(batch_dir, tmp_path, ordered):
+    input_paths = resolve_resume_inputs(str(batch_dir))
+    outcomes = list(render_many_parallel(
+        input_paths, str(tmp_path / "pdfs"), workers=2, max_in_flight=2, ordered=ordered,
+    ))
+
+    if ordered:
+        assert [outcome.source for outcome in outcomes] == input_paths
+    assert sorted(outcome.source for outcome in outcomes) == input_paths
+    assert sum(outcome.succeeded for outcome in outcomes) == 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_same_named_inputs_in_different_folders_get_separate_outputs(tmp_path, workers):
+    for folder in ("a", "b"):
+        (tmp_path / "in" / folder).mkdir(parents=True)
+        shutil.copy("resume.yaml", tmp_path / "in" / folder / "resume.yaml")
+    input_paths = resolve_resume_inputs(str(tmp_path / "in" / "**" / "*.yaml"))
+    output_dir = tmp_path / "out"
+
+    if workers > 1:
+        outcomes = list(render_many_parallel(input_paths, str(output_dir), workers=workers))
+    else:
+        outcomes = render_many(input_paths, str(output_dir))
+
+    assert [outcome.output_path for outcome in outcomes] == [
+        str(output_dir / "a" / "resume.pdf"), str(output_dir / "b" / "resume.pdf"),
+    ]
+    assert all((output_dir / folder / "resume.pdf").stat().st_size > 0 for folder in ("a", "b"))
+
+
+def test_inputs_sharing_an_output_are_reported_as_conflicts(tmp_path):
+    shutil.copy("resume.yaml", tmp_path / "resume.yaml")
+    shutil.copy("resume.yaml", tmp_path / "resume.yml")
+    output_dir = tmp_path / "out"
+
+    outcomes = render_many(resolve_resume_inputs(str(tmp_path)), str(output_dir))
+
+    assert [outcome.succeeded for outcome in outcomes] == [False, False]
+    assert all(outcome.error.startswith("Output conflict: ") for outcome in outcomes)
+    assert not output_dir.exists()
+
+
+@pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched parser")
+@pytest.mark.parametrize("ordered", [True, False])
+def test_crashed_worker_fails_its_inputs_without_aborting_the_batch(batch_dir, tmp_path, monkeypatch, ordered):
+    def crash_on_bob(input_path):
+        if input_path.endswith("bob.yml"):
+            os._exit(1)
+        raise ResumeParseError("not rendered")
+
+    monkeypatch.setattr(render_pool, "parse_resume_file", crash_on_bob)
+    input_paths = resolve_resume_inputs(str(batch_dir))
+
+    outcomes = list(render_many_parallel(input_paths, str(tmp_path / "pdfs"), workers=1, ordered=ordered))
+
+    assert sorted(outcome.source for outcome in outcomes) == input_paths
+    errors = {os.path.basename(outcome.source): outcome.error for outcome in outcomes}
+    assert errors["bob.yml"].startswith("Worker failed: ")
+    assert errors["alice.yaml"] == "Parse error: not rendered"
@@ -0,0 +1,27 @@
+from benchmarks.compare import compare_results
+
+
+def _result(p50_by_stage):
+    return {
+        "scenarios": [
+            {
+                "name": "bullets=4,sections=1,documents=10",
+                "stages": {stage: {"p50_ms": value} for stage, value in p50_by_stage.items()},
+            }
+        ]
+    }
+
+
+def test_compare_flags_only_stages_beyond_threshold():
+    baseline = _result({"load": 1.0, "layout": 10.0})
+    current = _result({"load": 1.05, "layout": 12.0})
+
+    regressions = compare_results(baseline, current, threshold=0.10)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("bullets=4,sections=1,documents=10 layout:")
+
+
+def test_compare_ignores_scenarios_missing_from_baseline():
+    baseline = {"scenarios": []}
+    assert compare_results(baseline, _result({"load": 5.0}), threshold=0.0) == []
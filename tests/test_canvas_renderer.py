@@ -0,0 +1,79 @@
+import io
+import re
+
+import pytest
+from reportlab.platypus import Paragraph
+
+from benchmarks.synthetic import build_synthetic_resume, load_base_resume
+from src.core.settings import ENGINE_CANVAS, ENGINE_PLATYPUS
+from src.core.styles import BULLET_CHAR, DEFAULT_RESUME_STYLES, scale_resume_styles
+from src.models.render_options import RenderOptions
+from src.services.canvas_renderer import _bullet_block
+from src.services.pdf_renderer import render_resume_pdf_to_stream
+from src.services.yaml_parser import _build_resume_data, parse_resume_file
+
+PAGE_PATTERN = re.compile(rb"/Type /Page\b(?!s)")
+BULLET_TEXT = (
+    "Led the migration of a monolithic billing service to event-driven microservices, "
+    "cutting invoice latency by 40% while keeping every downstream reconciliation job green"
+)
+
+
+def _render(resume_data, engine):
+    stream = io.BytesIO()
+    render_resume_pdf_to_stream(resume_data, stream, RenderOptions(deterministic=True, engine=engine))
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.91])
+def test_text_block_breaks_lines_like_paragraph(scale):
+    styles = scale_resume_styles(DEFAULT_RESUME_STYLES, scale)
+    block = _bullet_block(BULLET_TEXT, styles.bullet)
+    paragraph = Paragraph(f"{BULLET_CHAR} {BULLET_TEXT}", styles.bullet)
+
+    height = block.wrap(styles.content_width)
+
+    assert height == paragraph.wrap(styles.content_width, styles.content_height)[1]
+    expected = [" ".join(line[1]) for line in paragraph.blPara.lines]
+    assert [" ".join(text for _, text in words) for _, words in block.lines] == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "https://example.com/" + "a" * 200,
+        f"Stack: {'/'.join(['kubernetes'] * 30)} and more",
+        f"{BULLET_TEXT} {'x' * 180} tail",
+    ],
+)
+def test_text_block_splits_over_long_words_like_paragraph(text):
+    styles = DEFAULT_RESUME_STYLES
+    block = _bullet_block(text, styles.bullet)
+    paragraph = Paragraph(f"{BULLET_CHAR} {text}", styles.bullet)
+
+    height = block.wrap(styles.content_width)
+
+    assert height == paragraph.wrap(styles.content_width, styles.content_height)[1]
+    expected = [" ".join(line[1]) for line in paragraph.blPara.lines]
+    assert [" ".join(text for _, text in words) for _, words in block.lines] == expected
+    assert all(line_width <= styles.content_width for line_width, _ in block.lines)
+
+
+@pytest.mark.parametrize("bullets, sections", [(None, 1), (7, 2), (15, 3)])
+def test_canvas_engine_matches_platypus_page_count(bullets, sections):
+    resume_data = _build_resume_data(
+        build_synthetic_resume(load_base_resume(), bullet_count=bullets, section_repeat=sections)
+    )
+
+    canvas_pages = len(PAGE_PATTERN.findall(_render(resume_data, ENGINE_CANVAS)))
+
+    assert canvas_pages == len(PAGE_PATTERN.findall(_render(resume_data, ENGINE_PLATYPUS)))
+
+
+def test_canvas_engine_writes_document_info():
+    resume_data = parse_resume_file("resume.yaml")
+
+    pdf = _render(resume_data, ENGINE_CANVAS)
+
+    assert pdf.startswith(b"%PDF")
+    assert f"({resume_data.contact.name} - Resume)".encode() in pdf
@@ -0,0 +1,29 @@
+from reportlab.platypus import Paragraph, Table
+
+from src.core.styles import (
+    CONTENT_WIDTH,
+    STYLE_DATE_RIGHT,
+    STYLE_ROLE_LEFT,
+    TABLE_STYLE_DEFAULT,
+    TWO_COLUMN_WIDTHS,
+)
+from src.services.flowable_factory import build_section_rule, build_two_column_row
+
+LONG_ROLE = "<b>Company</b> " + "with a very long role description " * 4
+
+
+def test_two_column_row_matches_table_geometry():
+    row = build_two_column_row(LONG_ROLE, STYLE_ROLE_LEFT, "Jan 2020", STYLE_DATE_RIGHT)
+    table = Table(
+        [[Paragraph(LONG_ROLE, STYLE_ROLE_LEFT), Paragraph("Jan 2020", STYLE_DATE_RIGHT)]],
+        colWidths=list(TWO_COLUMN_WIDTHS),
+    )
+    table.setStyle(TABLE_STYLE_DEFAULT)
+
+    assert row.wrap(CONTENT_WIDTH, 1000) == table.wrap(CONTENT_WIDTH, 1000)
+
+
+def test_section_rules_are_independent_instances():
+    first = build_section_rule()
+    first._postponed = 1
+    assert not hasattr(build_section_rule(), "_postponed")
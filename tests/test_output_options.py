@@ -0,0 +1,91 @@
+import os
+import re
+import zlib
+from dataclasses import replace
+
+import pytest
+import reportlab
+
+from src.core.settings import COMPRESSION_ASCII85, COMPRESSION_FLATE, COMPRESSION_NONE, RENDER_ENGINES
+from src.core.styles import build_resume_styles
+from src.models.render_options import RenderOptions
+from src.models.theme import DEFAULT_THEME
+from src.services.pdf_renderer import render_resume_pdf_bytes
+from src.services.yaml_parser import parse_resume_file
+from src.utils.validators import ResumeValidationError
+
+REPORTLAB_FONTS = os.path.join(os.path.dirname(reportlab.__file__), "fonts")
+VERA_THEME = replace(
+    DEFAULT_THEME,
+    name="vera",
+    font_name="Vera",
+    font_name_bold="VeraBd",
+    font_name_italic="VeraIt",
+    font_file=os.path.join(REPORTLAB_FONTS, "Vera.ttf"),
+    font_file_bold=os.path.join(REPORTLAB_FONTS, "VeraBd.ttf"),
+    font_file_italic=os.path.join(REPORTLAB_FONTS, "VeraIt.ttf"),
+)
+STREAM_PATTERN = re.compile(rb"<<([^>]*)>>\s*stream\r?\n")
+
+
+def _render(**option_fields):
+    return render_resume_pdf_bytes(parse_resume_file("resume.yaml"), RenderOptions(deterministic=True, **option_fields))
+
+
+def _page_streams(pdf):
+    streams = []
+    for match in STREAM_PATTERN.finditer(pdf):
+        length = int(re.search(rb"/Length (\d+)", match.group(1)).group(1))
+        streams.append((match.group(1), pdf[match.end():match.end() + length]))
+    return streams
+
+
+@pytest.mark.parametrize("engine", RENDER_ENGINES)
+def test_flate_compression_writes_smaller_binary_streams(engine):
+    ascii85 = _render(engine=engine, compression=COMPRESSION_ASCII85)
+    flate = _render(engine=engine, compression=COMPRESSION_FLATE)
+    uncompressed = _render(engine=engine, compression=COMPRESSION_NONE)
+
+    assert len(flate) < len(ascii85) < len(uncompressed)
+    assert b"ASCII85Decode" not in flate and b"FlateDecode" not in uncompressed
+    decoded = [zlib.decompress(data) for _, data in _page_streams(flate)]
+    assert decoded == [data for _, data in _page_streams(uncompressed)]
+
+
+def test_default_compression_keeps_reportlab_encoding():
+    assert _render() == _render(compression=COMPRESSION_ASCII85)
+
+
+@pytest.mark.parametrize("engine", RENDER_ENGINES)
+def test_strip_metadata_drops_repeated_fields(engine):
+    resume_data = parse_resume_file("resume.yaml")
+
+    full = _render(engine=engine)
+    stripped = _render(engine=engine, strip_metadata=True)
+
+    assert len(stripped) < len(full)
+    assert b"/Subject ()" in stripped and b"/Keywords ()" in stripped
+    assert f"/Title ({resume_data.contact.name} - Resume)".encode() in stripped
+
+
+@pytest.mark.parametrize("engine", RENDER_ENGINES)
+def test_font_files_are_embedded_as_subsets(engine):
+    pdf = _render(engine=engine, theme=VERA_THEME)
+
+    base_fonts = set(re.findall(rb"/BaseFont /(\S+)", pdf))
+    assert {b"AAAAAA+BitstreamVeraSans-Roman", b"AAAAAA+BitstreamVeraSans-Bold"} <= base_fonts
+    assert len(pdf) < sum(os.path.getsize(path) for path in (VERA_THEME.font_file, VERA_THEME.font_file_bold))
+
+
+def test_font_file_cannot_replace_builtin_font():
+    theme = replace(DEFAULT_THEME, name="broken", font_file=VERA_THEME.font_file)
+
+    with pytest.raises(ResumeValidationError, match="built-in"):
+        build_resume_styles(theme)
+
+
+def test_missing_font_file_is_a_validation_error():
+    theme = replace(DEFAULT_THEME, name="missing", font_name="Missing", font_file="no-such-font.ttf")
+
+    with pytest.raises(ResumeValidationError, match="Cannot load font file"):
+        build_resume_styles(theme)
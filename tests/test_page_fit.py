@@ -0,0 +1,72 @@
+import io
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.synthetic import build_synthetic_resume, load_base_resume
+from src.core.settings import FIT_SCALE_STEP
+from src.models.render_options import RenderOptions
+from src.services.page_fit import PageFitter
+from src.services.pdf_renderer import _build_all_flowables, _create_document, resolve_styles
+from src.services.yaml_parser import _build_resume_data, parse_resume_file
+
+
+def _synthetic_resume(bullets, sections):
+    return _build_resume_data(build_synthetic_resume(load_base_resume(), bullet_count=bullets, section_repeat=sections))
+
+
+def _built_page_count(resume_data, scale):
+    options = RenderOptions(deterministic=True, style_scale=scale)
+    doc = _create_document(resume_data, io.BytesIO(), options)
+    doc.build(_build_all_flowables(resume_data, resolve_styles(options)))
+    return doc.page
+
+
+@pytest.mark.parametrize("bullets, sections, scale", [(None, 1, 1.0), (6, 2, 0.85), (13, 3, 0.7)])
+def test_trial_layout_matches_document_build(bullets, sections, scale):
+    resume_data = _synthetic_resume(bullets, sections)
+
+    assert PageFitter().count_pages(resume_data, scale) == _built_page_count(resume_data, scale)
+
+
+def test_fit_finds_largest_scale_that_fits():
+    resume_data = parse_resume_file("resume.yaml")
+    fitter = PageFitter()
+
+    result = fitter.fit(resume_data, max_pages=1)
+
+    assert result.fits and result.scale < 1.0
+    assert _built_page_count(resume_data, result.scale) == 1
+    assert _built_page_count(resume_data, round(result.scale + FIT_SCALE_STEP, 4)) == 2
+
+
+def test_fit_keeps_full_size_when_content_already_fits():
+    result = PageFitter().fit(parse_resume_file("resume.yaml"), max_pages=2)
+
+    assert (result.scale, result.page_count, result.fits, result.trials) == (1.0, 2, True, 1)
+
+
+def test_fit_reports_unreachable_page_budget():
+    result = PageFitter().fit(_synthetic_resume(13, 3), max_pages=1)
+
+    assert not result.fits
+    assert result.page_count > 1
+
+
+def test_fit_rejects_page_budget_below_one():
+    with pytest.raises(ValueError, match="max_pages must be at least 1"):
+        PageFitter().fit(parse_resume_file("resume.yaml"), max_pages=0)
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "two"])
+def test_cli_rejects_non_positive_fit_pages(value, tmp_path):
+    completed = subprocess.run(
+        [sys.executable, "main.py", "--fit-pages", value, "--output", str(tmp_path / "out.pdf")],
+        capture_output=True,
+        text=True,
+    )
+
+    assert completed.returncode == 2
+    assert "--fit-pages: must be a positive integer" in completed.stderr
+    assert not (tmp_path / "out.pdf").exists()
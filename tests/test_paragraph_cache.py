@@ -0,0 +1,42 @@
+from reportlab.platypus import Paragraph
+
+from src.core.styles import CONTENT_WIDTH, STYLE_BULLET, STYLE_SKILLS
+from src.services.paragraph_cache import ParagraphCache
+from src.utils.lru_cache import LRUCache
+
+SKILL_LINE = "<b>Backend:</b> Node.js, Express, Golang (Goroutines), REST APIs, GraphQL, Socket.io, Python"
+
+
+def test_cached_paragraph_wraps_like_plain_paragraph():
+    cache = ParagraphCache(max_entries=16)
+    expected = Paragraph(SKILL_LINE, STYLE_SKILLS).wrap(CONTENT_WIDTH / 3, 1000)
+
+    first = cache.paragraph(SKILL_LINE, STYLE_SKILLS)
+    second = cache.paragraph(SKILL_LINE, STYLE_SKILLS)
+
+    assert first.wrap(CONTENT_WIDTH / 3, 1000) == expected
+    assert second.wrap(CONTENT_WIDTH / 3, 1000) == expected
+    assert len(second.blPara.lines) == len(first.blPara.lines) > 1
+
+
+def test_cache_counts_hits_per_text_style_and_width():
+    cache = ParagraphCache(max_entries=16)
+    for width in (CONTENT_WIDTH, CONTENT_WIDTH, CONTENT_WIDTH / 2):
+        cache.paragraph(SKILL_LINE, STYLE_SKILLS).wrap(width, 1000)
+    cache.paragraph(SKILL_LINE, STYLE_BULLET).wrap(CONTENT_WIDTH, 1000)
+
+    stats = cache.stats()
+    assert (stats["markup"].hits, stats["markup"].misses) == (2, 2)
+    assert (stats["layout"].hits, stats["layout"].misses) == (1, 3)
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.stats().evictions == 1
@@ -0,0 +1,107 @@
+import os
+import shutil
+
+import pytest
+
+from src.services import parse_cache as parse_cache_module
+from src.services.parse_cache import ParseCache
+from src.services.yaml_parser import parse_resume_file
+
+
+@pytest.fixture
+def resume_path(tmp_path):
+    path = tmp_path / "resume.yaml"
+    shutil.copy("resume.yaml", path)
+    return path
+
+
+def _forbid_parsing(monkeypatch):
+    def fail(*_args):
+        raise AssertionError("cache hit should not parse")
+
+    monkeypatch.setattr(parse_cache_module, "parse_resume_file", fail)
+    monkeypatch.setattr(parse_cache_module, "parse_resume_bytes", fail)
+
+
+def _edit_keeping_signature(path, old, new):
+    assert len(old) == len(new)
+    stat = os.stat(path)
+    path.write_text(path.read_text().replace(old, new, 1))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_unchanged_file_is_served_from_memory(resume_path, monkeypatch):
+    cache = ParseCache()
+    first = cache.parse(str(resume_path))
+    _forbid_parsing(monkeypatch)
+
+    assert cache.parse(str(resume_path)) is first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+
+def test_edited_file_replaces_its_entry(resume_path):
+    cache = ParseCache()
+    cache.parse(str(resume_path))
+    resume_path.write_text(resume_path.read_text().replace("Shubham More", "Jordan Example"))
+
+    assert cache.parse(str(resume_path)).contact.name == "Jordan Example"
+    assert cache.stats().misses == 2 and len(cache._entries) == 1
+
+
+def test_disk_entries_survive_new_cache_instances(resume_path, tmp_path, monkeypatch):
+    directory = str(tmp_path / "parse-cache")
+    expected = ParseCache(directory=directory).parse(str(resume_path))
+    _forbid_parsing(monkeypatch)
+
+    cache = ParseCache(directory=directory)
+
+    assert cache.parse(str(resume_path)) == expected
+    assert cache.stats().disk_hits == 1
+
+
+def test_corrupt_disk_entry_is_reparsed(resume_path, tmp_path):
+    directory = tmp_path / "parse-cache"
+    ParseCache(directory=str(directory)).parse(str(resume_path))
+    for entry in directory.iterdir():
+        entry.write_bytes(b"not a pickle")
+
+    cache = ParseCache(directory=str(directory))
+
+    assert cache.parse(str(resume_path)) == parse_resume_file("resume.yaml")
+    assert cache.stats().misses == 1
+
+
+def test_content_hash_ignores_touch_but_catches_same_signature_edits(resume_path):
+    cache = ParseCache(verify_hash=True)
+    cache.parse(str(resume_path))
+    os.utime(resume_path)
+    cache.parse(str(resume_path))
+    assert cache.stats().hits == 1
+
+    _edit_keeping_signature(resume_path, "Shubham More", "Shubham Mora")
+
+    assert cache.parse(str(resume_path)).contact.name == "Shubham Mora"
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ParseCache(max_entries=1)
+    for name in ("first.yaml", "second.yaml"):
+        shutil.copy("resume.yaml", tmp_path / name)
+        cache.parse(str(tmp_path / name))
+
+    assert cache.stats().evictions == 1
+
+
+def test_disk_store_failure_keeps_parse_and_leaves_no_temp_file(resume_path, tmp_path, monkeypatch):
+    directory = tmp_path / "parse-cache"
+    cache = ParseCache(directory=str(directory))
+
+    def disk_full(*_args, **_kwargs):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(parse_cache_module.pickle, "dump", disk_full)
+
+    assert cache.parse(str(resume_path)) == parse_resume_file("resume.yaml")
+    assert list(directory.iterdir()) == []
+    assert cache.parse(str(resume_path)) is not None and cache.stats().hits == 1
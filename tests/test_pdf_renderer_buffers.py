@@ -0,0 +1,32 @@
+import io
+
+from src.models.render_options import RenderOptions
+from src.services.pdf_renderer import (
+    render_resume_pdf,
+    render_resume_pdf_bytes,
+    render_resume_pdf_to_stream,
+)
+from src.services.yaml_parser import parse_resume_file
+
+DETERMINISTIC = RenderOptions(deterministic=True)
+
+
+def test_render_bytes_matches_file_output(tmp_path):
+    resume_data = parse_resume_file("resume.yaml")
+    output_path = tmp_path / "resume.pdf"
+    render_resume_pdf(resume_data, str(output_path), DETERMINISTIC)
+
+    pdf_bytes = render_resume_pdf_bytes(resume_data, DETERMINISTIC)
+
+    assert pdf_bytes.startswith(b"%PDF")
+    assert pdf_bytes == output_path.read_bytes()
+
+
+def test_render_to_stream_writes_into_caller_buffer():
+    resume_data = parse_resume_file("resume.yaml")
+    stream = io.BytesIO(b"header:")
+    stream.seek(0, io.SEEK_END)
+
+    render_resume_pdf_to_stream(resume_data, stream, DETERMINISTIC)
+
+    assert stream.getvalue().startswith(b"header:%PDF")
@@ -0,0 +1,66 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from src.services.pdf_renderer import render_resume_pdf_bytes
+from src.services.yaml_parser import parse_resume_file
+from src.utils.profiling import (
+    PIPELINE_STAGES,
+    JsonLinesStageWriter,
+    add_stage_hook,
+    measure_stage,
+    remove_stage_hook,
+)
+
+
+@pytest.fixture
+def recorded_timings():
+    timings = []
+    add_stage_hook(timings.append)
+    yield timings
+    remove_stage_hook(timings.append)
+
+
+def test_hooks_receive_every_pipeline_stage(recorded_timings):
+    render_resume_pdf_bytes(parse_resume_file("resume.yaml"))
+
+    assert tuple(timing.stage for timing in recorded_timings) == PIPELINE_STAGES
+    assert all(timing.wall_seconds >= 0 for timing in recorded_timings)
+    assert all(timing.allocated_blocks is None for timing in recorded_timings)
+
+
+def test_json_lines_writer_emits_one_record_per_stage():
+    stream = io.StringIO()
+    writer = JsonLinesStageWriter(stream)
+    add_stage_hook(writer)
+    try:
+        parse_resume_file("resume.yaml")
+    finally:
+        remove_stage_hook(writer)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [record["stage"] for record in records] == ["load", "validate", "build_model"]
+    assert {"wall_seconds", "cpu_seconds", "pid", "timestamp"} <= set(records[0])
+
+
+def test_failing_stage_still_emits_its_record(recorded_timings):
+    with pytest.raises(ValueError):
+        with measure_stage("load"):
+            raise ValueError("boom")
+
+    assert [(timing.stage, timing.error) for timing in recorded_timings] == [("load", "ValueError")]
+
+
+def test_trace_allocations_implies_timings():
+    completed = subprocess.run(
+        [sys.executable, "main.py", "--validate-only", "--trace-allocations"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    records = [json.loads(line) for line in completed.stderr.splitlines() if line.startswith("{")]
+    assert records and all(record["allocated_blocks"] is not None for record in records)
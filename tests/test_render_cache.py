@@ -0,0 +1,114 @@
+import hashlib
+import os
+
+import pytest
+
+from src.models.render_options import RenderOptions
+from src.services import pdf_renderer, render_cache
+from src.services.pdf_renderer import render_resume_pdf
+from src.services.render_cache import RenderCache
+from src.services.yaml_parser import parse_resume_file
+
+DETERMINISTIC = RenderOptions(deterministic=True)
+
+
+def _digest(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+@pytest.fixture
+def resume_data():
+    return parse_resume_file("resume.yaml")
+
+
+def test_deterministic_render_is_byte_identical(resume_data, tmp_path):
+    first = tmp_path / "first.pdf"
+    second = tmp_path / "second.pdf"
+    render_resume_pdf(resume_data, str(first), DETERMINISTIC)
+    render_resume_pdf(resume_data, str(second), DETERMINISTIC)
+    assert _digest(first) == _digest(second)
+
+
+def test_cache_hit_skips_build(resume_data, tmp_path, monkeypatch):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+    render_resume_pdf(resume_data, str(tmp_path / "miss.pdf"), DETERMINISTIC, cache)
+
+    def fail_build(_resume_data):
+        raise AssertionError("cache hit should not build flowables")
+
+    monkeypatch.setattr(pdf_renderer, "_build_all_flowables", fail_build)
+    render_resume_pdf(resume_data, str(tmp_path / "hit.pdf"), DETERMINISTIC, cache)
+
+    assert _digest(tmp_path / "hit.pdf") == _digest(tmp_path / "miss.pdf")
+
+
+def test_cache_key_changes_with_content_and_options(resume_data, tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=1)
+    base_key = cache.key_for(resume_data, DETERMINISTIC)
+    assert cache.key_for(resume_data, RenderOptions()) != base_key
+    resume_data.summary = "Changed summary"
+    assert cache.key_for(resume_data, DETERMINISTIC) != base_key
+
+
+def test_cache_evicts_least_recently_used_entries(resume_data, tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = RenderCache(str(cache_dir), max_bytes=1)
+    render_resume_pdf(resume_data, str(tmp_path / "out.pdf"), DETERMINISTIC, cache)
+    assert list(cache_dir.iterdir()) == []
+
+
+def test_storing_an_existing_key_replaces_its_size(tmp_path):
+    rendered = tmp_path / "rendered.pdf"
+    rendered.write_bytes(b"%PDF" * 100)
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024)
+
+    cache.store("key", str(rendered))
+    cache.store("key", str(rendered))
+
+    assert cache._total_bytes == 400
+
+
+@pytest.mark.parametrize("hard_link", [False, True])
+def test_entry_evicted_during_fetch_is_a_miss(tmp_path, monkeypatch, hard_link):
+    rendered = tmp_path / "rendered.pdf"
+    rendered.write_bytes(b"%PDF")
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024, hard_link=hard_link)
+    cache.store("key", str(rendered))
+    real_utime = os.utime
+
+    def utime_then_evict(path, *args, **kwargs):
+        real_utime(path, *args, **kwargs)
+        os.remove(path)
+
+    monkeypatch.setattr(render_cache.os, "utime", utime_then_evict)
+
+    assert cache.fetch("key", str(tmp_path / "out.pdf")) is False
+
+
+def test_store_failure_is_not_fatal_and_leaves_no_temp_file(tmp_path, monkeypatch):
+    rendered = tmp_path / "rendered.pdf"
+    rendered.write_bytes(b"%PDF")
+    cache_dir = tmp_path / "cache"
+    cache = RenderCache(str(cache_dir), max_bytes=10 * 1024 * 1024)
+
+    def read_only(*_args):
+        raise PermissionError(13, "Permission denied")
+
+    monkeypatch.setattr(render_cache.os, "chmod", read_only)
+    cache.store("key", str(rendered))
+
+    assert list(cache_dir.iterdir()) == []
+    assert cache._total_bytes == 0
+
+
+def test_hard_linked_output_is_not_overwritten_in_place(resume_data, tmp_path):
+    cache = RenderCache(str(tmp_path / "cache"), max_bytes=10 * 1024 * 1024, hard_link=True)
+    output = tmp_path / "out.pdf"
+    render_resume_pdf(resume_data, str(output), DETERMINISTIC, cache)
+    render_resume_pdf(resume_data, str(output), DETERMINISTIC, cache)
+    cached_digests = {_digest(entry) for entry in (tmp_path / "cache").iterdir()}
+
+    resume_data.summary = "Changed summary"
+    render_resume_pdf(resume_data, str(output), DETERMINISTIC, cache)
+
+    assert cached_digests <= {_digest(entry) for entry in (tmp_path / "cache").iterdir()}
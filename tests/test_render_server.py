@@ -0,0 +1,127 @@
+import http.client
+import json
+import socket
+import subprocess
+import sys
+import threading
+
+import pytest
+import yaml
+
+from src.models.theme import Theme
+from src.services.render_server import RenderServer, create_http_server
+
+
+@pytest.fixture
+def server_factory():
+    servers = []
+
+    def start(queue_limit=4, themes=None):
+        render_server = RenderServer(workers=1, queue_limit=queue_limit, timeout=30, themes=themes)
+        http_server = create_http_server(render_server, "127.0.0.1", 0)
+        thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+        thread.start()
+        servers.append((render_server, http_server))
+        return http_server.server_port
+
+    yield start
+
+    for render_server, http_server in servers:
+        http_server.shutdown()
+        http_server.server_close()
+        render_server.close()
+
+
+def _post(port, body, path="/render", headers=None):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    connection.request("POST", path, body=body.encode("utf-8"), headers=headers or {})
+    response = connection.getresponse()
+    return response.status, response.getheader("Content-Type"), response.read()
+
+
+def test_server_renders_yaml_and_json_payloads(server_factory):
+    port = server_factory()
+    with open("resume.yaml") as resume_file:
+        yaml_payload = resume_file.read()
+    json_payload = json.dumps(yaml.safe_load(yaml_payload))
+
+    for payload in (yaml_payload, json_payload):
+        status, content_type, body = _post(port, payload)
+        assert status == 200
+        assert content_type == "application/pdf"
+        assert body.startswith(b"%PDF")
+
+
+def test_server_parses_json_content_type_with_json_loader(server_factory):
+    port = server_factory()
+    with open("resume.yaml") as resume_file:
+        json_payload = json.dumps(yaml.safe_load(resume_file))
+    headers = {"Content-Type": "application/json; charset=utf-8"}
+
+    status, _, body = _post(port, json_payload, headers=headers)
+    assert status == 200 and body.startswith(b"%PDF")
+
+    status, _, body = _post(port, json_payload[:-1], headers=headers)
+    assert status == 400
+    assert body.startswith(b"Parse error: Invalid JSON syntax: ")
+
+
+def _post_raw(port, content_length, body=b""):
+    request = f"POST /render HTTP/1.1\r\nHost: localhost\r\nContent-Length: {content_length}\r\n\r\n"
+    with socket.create_connection(("127.0.0.1", port), timeout=30) as connection:
+        connection.sendall(request.encode("ascii") + body)
+        response = http.client.HTTPResponse(connection)
+        response.begin()
+        return response.status, response.read()
+
+
+@pytest.mark.parametrize("content_length", ["abc", "-1"])
+def test_server_rejects_malformed_content_length(server_factory, content_length):
+    port = server_factory()
+    status, body = _post_raw(port, content_length)
+    assert status == 400
+    assert body == b"Invalid Content-Length\n"
+
+
+def test_server_rejects_payload_that_is_not_utf8(server_factory):
+    port = server_factory()
+    body = b"contact:\n  name: \xff\n"
+    status, response_body = _post_raw(port, len(body), body)
+    assert status == 400
+    assert response_body.startswith(b"Parse error: Payload is not valid UTF-8")
+
+
+def test_server_rejects_invalid_payload(server_factory):
+    port = server_factory()
+    status, _, body = _post(port, "contact:\n  name: Nobody\nsummary: Missing email\n")
+    assert status == 422
+    assert b"Missing required field: 'email'" in body
+
+
+def test_server_applies_backpressure_when_queue_is_full(server_factory):
+    port = server_factory(queue_limit=0)
+    with open("resume.yaml") as resume_file:
+        status, _, _ = _post(port, resume_file.read())
+    assert status == 503
+
+
+def test_server_renders_requested_theme(server_factory):
+    port = server_factory(themes={"serif": Theme(name="serif", font_name="Times-Roman")})
+    with open("resume.yaml") as resume_file:
+        payload = resume_file.read()
+
+    status, _, body = _post(port, payload, "/render?theme=serif")
+    assert status == 200
+    assert b"Times-Roman" in body
+
+    status, _, body = _post(port, payload, "/render?theme=missing")
+    assert status == 400
+    assert body == b"Unknown theme: 'missing'\n"
+
+
+@pytest.mark.parametrize("flag, value", [("--queue-limit", "0"), ("--queue-limit", "-1"), ("--cache-max-mb", "-1")])
+def test_cli_rejects_non_positive_limits(flag, value):
+    completed = subprocess.run([sys.executable, "main.py", "--serve", flag, value], capture_output=True, text=True)
+
+    assert completed.returncode == 2
+    assert f"{flag}: must be a positive integer" in completed.stderr
@@ -0,0 +1,64 @@
+import hashlib
+import os
+import re
+import subprocess
+import sys
+from dataclasses import replace
+
+import pytest
+
+from src.core.settings import RENDER_ENGINES, SOURCE_DATE_EPOCH_ENV
+from src.models.render_options import RenderOptions
+from src.services.pdf_renderer import render_resume_pdf_bytes
+from src.services.yaml_parser import parse_resume_file
+
+DOCUMENT_ID_PATTERN = re.compile(rb"/ID \s*\[<([0-9a-f]+)>")
+
+
+@pytest.fixture
+def resume_data():
+    return parse_resume_file("resume.yaml")
+
+
+def _render_in_subprocess(output_path, engine, hash_seed):
+    environment = {**os.environ, "PYTHONHASHSEED": str(hash_seed)}
+    environment.pop(SOURCE_DATE_EPOCH_ENV, None)
+    subprocess.run(
+        [sys.executable, "main.py", "--deterministic", "--engine", engine, "--output", str(output_path)],
+        capture_output=True,
+        check=True,
+        env=environment,
+    )
+    return hashlib.sha256(output_path.read_bytes()).hexdigest()
+
+
+@pytest.mark.parametrize("engine", RENDER_ENGINES)
+def test_deterministic_output_hash_is_stable_across_processes(resume_data, tmp_path, monkeypatch, engine):
+    monkeypatch.delenv(SOURCE_DATE_EPOCH_ENV, raising=False)
+    in_process = render_resume_pdf_bytes(resume_data, RenderOptions(deterministic=True, engine=engine))
+
+    hashes = {_render_in_subprocess(tmp_path / f"seed-{seed}.pdf", engine, seed) for seed in (1, 2)}
+
+    assert hashes == {hashlib.sha256(in_process).hexdigest()}
+
+
+def test_document_id_follows_content_not_metadata(resume_data):
+    options = RenderOptions(deterministic=True)
+    edited = replace(resume_data, experience=resume_data.experience[:-1])
+
+    first = DOCUMENT_ID_PATTERN.search(render_resume_pdf_bytes(resume_data, options)).group(1)
+    second = DOCUMENT_ID_PATTERN.search(render_resume_pdf_bytes(edited, options)).group(1)
+
+    assert first != second
+    assert first == DOCUMENT_ID_PATTERN.search(render_resume_pdf_bytes(resume_data, options)).group(1)
+
+
+def test_source_date_epoch_fixes_document_dates(resume_data, monkeypatch):
+    monkeypatch.setenv(SOURCE_DATE_EPOCH_ENV, "1700000000")
+
+    first = render_resume_pdf_bytes(resume_data)
+    second = render_resume_pdf_bytes(resume_data)
+
+    assert first == second
+    assert b"/CreationDate (D:20231114221320+00'00')" in first
+    assert b"(Resume Generator - 2023-11-14 22:13)" in first
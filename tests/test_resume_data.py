@@ -0,0 +1,30 @@
+from src.models.render_options import RenderOptions
+from src.models.frozen_resume_data import freeze_resume_data
+from src.services.pdf_renderer import render_resume_pdf_bytes
+from src.services.render_cache import RenderCache
+from src.services.yaml_parser import parse_resume_file
+
+DETERMINISTIC = RenderOptions(deterministic=True)
+
+
+def test_model_instances_have_no_instance_dict():
+    resume_data = parse_resume_file("resume.yaml")
+    assert not hasattr(resume_data, "__dict__")
+    assert not hasattr(resume_data.experience[0], "__dict__")
+
+
+def test_frozen_resume_is_hashable_and_uses_tuples():
+    frozen = freeze_resume_data(parse_resume_file("resume.yaml"))
+    assert isinstance(frozen.experience[0].bullets, tuple)
+    assert hash(frozen) == hash(freeze_resume_data(parse_resume_file("resume.yaml")))
+    assert len({frozen, freeze_resume_data(parse_resume_file("resume.yaml"))}) == 1
+
+
+def test_frozen_resume_renders_like_mutable_resume(tmp_path):
+    resume_data = parse_resume_file("resume.yaml")
+    frozen = freeze_resume_data(resume_data)
+
+    assert render_resume_pdf_bytes(frozen, DETERMINISTIC) == render_resume_pdf_bytes(resume_data, DETERMINISTIC)
+
+    cache = RenderCache(str(tmp_path), max_bytes=1)
+    assert cache.key_for(frozen, DETERMINISTIC) == cache.key_for(resume_data, DETERMINISTIC)
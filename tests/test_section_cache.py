@@ -0,0 +1,34 @@
+import copy
+
+from benchmarks.synthetic import build_synthetic_resume, load_base_resume
+from src.models.render_options import RenderOptions
+from src.services.pdf_renderer import SectionFlowableCache, render_resume_pdf_bytes
+from src.services.yaml_parser import _build_resume_data, parse_resume_file
+
+DETERMINISTIC = RenderOptions(deterministic=True)
+
+
+def test_variant_reuses_untouched_sections():
+    section_cache = SectionFlowableCache()
+    base = parse_resume_file("resume.yaml")
+    variant = copy.deepcopy(base)
+    variant.skills = variant.skills[:2]
+
+    _, first_rebuilt = section_cache.build_all(base)
+    _, variant_rebuilt = section_cache.build_all(variant)
+
+    assert first_rebuilt == ["contact", "summary", "skills", "experience", "projects", "education"]
+    assert variant_rebuilt == ["skills"]
+    assert section_cache.stats().hits == 5
+
+
+def test_cached_sections_render_identical_multi_page_output():
+    resume_data = _build_resume_data(
+        build_synthetic_resume(load_base_resume(), bullet_count=12, section_repeat=4)
+    )
+    expected = render_resume_pdf_bytes(resume_data, DETERMINISTIC)
+    section_cache = SectionFlowableCache()
+
+    renders = [render_resume_pdf_bytes(resume_data, DETERMINISTIC, section_cache) for _ in range(3)]
+
+    assert renders == [expected] * 3
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+import pytest
+
+# Startup is guarded by what gets imported rather than by wall time, which
+# varies with the machine; benchmarks/bench_startup.py reports the timings.
+
+
+def _imported_modules(arguments):
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {line.split("|")[-1].strip() for line in completed.stderr.splitlines()}
+
+
+@pytest.mark.parametrize("arguments", [["--help"], ["--validate-only"]])
+def test_cli_does_not_load_reportlab(arguments):
+    modules = _imported_modules(["main.py", *arguments])
+
+    loaded = sorted(module for module in modules if module.split(".")[0] == "reportlab")
+    assert not loaded, f"{arguments} imported {loaded}"
+
+
+def test_validate_only_parses_the_resume():
+    assert "src.services.yaml_parser" in _imported_modules(["main.py", "--validate-only"])
+
+
+def test_help_skips_yaml():
+    assert "yaml" not in _imported_modules(["main.py", "--help"])
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.styles import DEFAULT_RESUME_STYLES, STYLE_BULLET, build_resume_styles
+from src.models.render_options import RenderOptions
+from src.models.theme import DEFAULT_THEME, Theme
+from src.services.pdf_renderer import render_resume_pdf_bytes
+from src.services.yaml_parser import parse_resume_file, parse_theme_file
+from src.utils.validators import ResumeValidationError
+
+COMPACT = Theme(name="compact", bullet_font_size=8, page_margin=24, left_column_ratio=0.8, right_column_ratio=0.2)
+
+
+def test_default_theme_styles_are_the_module_styles():
+    assert build_resume_styles(DEFAULT_THEME) is DEFAULT_RESUME_STYLES
+    assert DEFAULT_RESUME_STYLES.bullet is STYLE_BULLET
+
+
+def test_theme_styles_are_cached_and_uniquely_named():
+    styles = build_resume_styles(COMPACT)
+
+    assert build_resume_styles(Theme(**vars(COMPACT))) is styles
+    assert styles.bullet.fontSize == 8
+    assert styles.bullet.name != STYLE_BULLET.name
+    assert build_resume_styles(Theme(name="compact", bullet_font_size=7)).key != styles.key
+    assert styles.column_widths == (styles.content_width * 0.8, styles.content_width * 0.2)
+
+
+def test_themes_render_concurrently_in_one_process():
+    resume_data = parse_resume_file("resume.yaml")
+    themes = [DEFAULT_THEME, COMPACT, Theme(name="serif", font_name="Times-Roman")] * 3
+    expected = {
+        theme: render_resume_pdf_bytes(resume_data, RenderOptions(deterministic=True, theme=theme))
+        for theme in themes
+    }
+
+    with ThreadPoolExecutor(max_workers=len(themes)) as executor:
+        renders = list(executor.map(
+            lambda theme: render_resume_pdf_bytes(resume_data, RenderOptions(deterministic=True, theme=theme)),
+            themes,
+        ))
+
+    assert renders == [expected[theme] for theme in themes]
+    assert len(set(expected.values())) == 3
+
+
+def test_parse_theme_file_reports_invalid_settings(tmp_path):
+    theme_path = tmp_path / "themes.yaml"
+    theme_path.write_text(
+        "tight:\n  bullet_font_size: 0\n  colour: red\n  left_column_ratio: 0.9\n"
+        "serif:\n  font_name: Times-Roman\n"
+    )
+
+    with pytest.raises(ResumeValidationError) as error:
+        parse_theme_file(str(theme_path))
+
+    assert error.value.errors == [
+        "Theme 'tight': 'bullet_font_size' must be a positive number",
+        "Theme 'tight': Unknown field: 'colour'",
+        "Theme 'tight': 'left_column_ratio' and 'right_column_ratio' must add up to at most 1",
+    ]
+
+
+def test_unknown_font_is_rejected_when_building_styles():
+    with pytest.raises(ResumeValidationError, match="Unknown font: 'Comic-Sans'"):
+        build_resume_styles(Theme(name="comic", font_name="Comic-Sans"))
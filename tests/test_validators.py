@@ -1,5 +1,7 @@
+import pickle
+
 import pytest
-from src.utils.validators import _is_valid_date
+from src.utils.validators import ResumeValidationError, _is_valid_date, validate_resume_data
 
 def test_is_valid_date_empty():
     assert _is_valid_date(None) is False
@@ -48,3 +50,34 @@ def test_is_valid_date_other_invalid_formats():
     assert _is_valid_date("Jan 2023 extra") is False
     assert _is_valid_date("2023 Jan") is False
     assert _is_valid_date("Jan-2023") is False
+
+def test_validation_error_survives_pickling():
+    error = pickle.loads(pickle.dumps(ResumeValidationError(["Missing required field: 'email'"])))
+    assert error.errors == ["Missing required field: 'email'"]
+    assert str(error) == "Validation failed: Missing required field: 'email'"
+
+def test_validate_resume_data_reports_errors_in_section_order():
+    raw_dict = {
+        "contact": {"name": "Jane", "email": "jane", "github": "not a url"},
+        "summary": " ",
+        "experience": [{"company": "Acme", "bullets": "one"}, "oops"],
+        "education": [{"degree": "BSc", "university": "U", "start_date": "2019", "end_date": "Jan-2023"}],
+        "skills": [{"items": "Python"}],
+        "projects": {"name": "Tool"},
+    }
+
+    assert validate_resume_data(raw_dict) == [
+        "Field 'summary' cannot be empty",
+        "Invalid email format: 'jane'",
+        "Invalid URL format for github: 'not a url'",
+        "Experience entry 1: Missing required field: 'role'",
+        "Experience entry 1: Missing required field: 'location'",
+        "Experience entry 1: Missing required field: 'start_date'",
+        "Experience entry 1: Missing required field: 'end_date'",
+        "Experience entry 1: 'bullets' must be a list",
+        "Experience entry 2 must be a dictionary",
+        "Education entry 1: Invalid end_date format: 'Jan-2023'",
+        "Skills entry 1: Missing required field: 'category'",
+        "Skills entry 1: 'items' must be a list",
+        "'project' must be a list",
+    ]
@@ -0,0 +1,77 @@
+import pytest
+
+from src.models.render_options import RenderOptions
+from src.models.variant_spec import VariantSpec
+from src.services.pdf_renderer import render_resume_pdf
+from src.services.variant_renderer import apply_variant, render_variants
+from src.services.yaml_parser import parse_resume_file, parse_variant_file
+from src.utils.validators import ResumeValidationError
+
+DETERMINISTIC = RenderOptions(deterministic=True)
+
+
+@pytest.fixture
+def base():
+    return parse_resume_file("resume.yaml")
+
+
+def test_apply_variant_filters_reorders_and_trims(base):
+    spec = VariantSpec(
+        name="backend",
+        skill_categories=("Databases & Cache", "Backend"),
+        exclude_skills=("Python",),
+        experience_order=("Irys India",),
+        max_bullets=2,
+    )
+
+    variant = apply_variant(base, spec)
+
+    assert [skill.category for skill in variant.skills] == ["Databases & Cache", "Backend"]
+    assert "Python" not in variant.skills[1].items
+    assert variant.experience[0].company == "Irys India"
+    assert all(len(exp.bullets) <= 2 for exp in variant.experience)
+    assert variant.education is base.education
+    assert len(base.experience[0].bullets) > 2
+
+
+def test_apply_variant_include_drops_empty_categories(base):
+    variant = apply_variant(base, VariantSpec(name="react", include_skills=("React", "Redux")))
+
+    assert [(skill.category, skill.items) for skill in variant.skills] == [("Frontend", ["React", "Redux"])]
+
+
+def test_parse_variant_file_reports_every_invalid_entry(tmp_path):
+    spec_path = tmp_path / "variants.yaml"
+    spec_path.write_text("- name: a\n  max_bullets: -1\n- name: a\n  colour: red\n- summary: no name\n")
+
+    with pytest.raises(ResumeValidationError) as error:
+        parse_variant_file(str(spec_path))
+
+    assert error.value.errors == [
+        "Variant entry 1: 'max_bullets' must be a non-negative integer",
+        "Variant entry 2: Unknown field: 'colour'",
+        "Variant entry 2: Duplicate variant name: 'a'",
+        "Variant entry 3: Missing required field: 'name'",
+    ]
+
+
+def test_render_variants_matches_individual_renders(base, tmp_path):
+    specs = parse_variant_file("variants.example.yaml")
+
+    outcomes = list(render_variants(base, specs, str(tmp_path / "variants"), options=DETERMINISTIC))
+
+    assert [outcome.source for outcome in outcomes] == [spec.name for spec in specs]
+    for spec, outcome in zip(specs, outcomes):
+        expected_path = tmp_path / f"{spec.name}-expected.pdf"
+        render_resume_pdf(apply_variant(base, spec), str(expected_path), DETERMINISTIC)
+        assert outcome.succeeded and outcome.elapsed_seconds > 0
+        assert open(outcome.output_path, "rb").read() == expected_path.read_bytes()
+
+
+def test_render_variants_in_process_pool(base, tmp_path):
+    specs = parse_variant_file("variants.example.yaml")
+
+    outcomes = list(render_variants(base, specs, str(tmp_path), workers=2, options=DETERMINISTIC))
+
+    assert [outcome.succeeded for outcome in outcomes] == [True] * len(specs)
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(f"{spec.name}.pdf" for spec in specs)
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from src.services.watcher import ResumeWatcher
+
+
+@pytest.fixture
+def watched_files(tmp_path):
+    input_path = tmp_path / "resume.yaml"
+    with open("resume.yaml") as resume_file:
+        input_path.write_text(resume_file.read())
+    return input_path, tmp_path / "resume.pdf"
+
+
+def _rewrite(path, content):
+    previous_mtime = path.stat().st_mtime_ns
+    path.write_text(content)
+    os.utime(path, ns=(previous_mtime + 1_000_000, previous_mtime + 1_000_000))
+
+
+def test_watcher_renders_once_until_file_changes(watched_files):
+    input_path, output_path = watched_files
+    watcher = ResumeWatcher(str(input_path), str(output_path))
+
+    first = watcher.poll()
+
+    assert first.rendered
+    assert first.rebuilt_sections == ["contact", "summary", "skills", "experience", "projects", "education"]
+    assert output_path.stat().st_size > 0
+    assert watcher.poll() is None
+
+
+def test_watcher_skips_comment_only_changes(watched_files):
+    input_path, output_path = watched_files
+    watcher = ResumeWatcher(str(input_path), str(output_path))
+    watcher.poll()
+
+    _rewrite(input_path, "# tuning notes\n" + input_path.read_text() + "\n\n")
+    event = watcher.poll()
+
+    assert event is not None
+    assert not event.rendered
+    assert event.error is None
+
+
+def test_watcher_rebuilds_only_changed_sections(watched_files):
+    input_path, output_path = watched_files
+    watcher = ResumeWatcher(str(input_path), str(output_path))
+    watcher.poll()
+
+    _rewrite(input_path, input_path.read_text().replace("Engineered a multi-tenant", "Built a multi-tenant"))
+    event = watcher.poll()
+
+    assert event.rendered
+    assert event.rebuilt_sections == ["experience"]
+
+
+def test_watcher_reports_parse_errors_and_recovers(watched_files):
+    input_path, output_path = watched_files
+    original = input_path.read_text()
+    watcher = ResumeWatcher(str(input_path), str(output_path))
+    watcher.poll()
+
+    _rewrite(input_path, "contact: [unclosed\n")
+    assert watcher.poll().error.startswith("Parse error:")
+
+    _rewrite(input_path, original.replace("Pune, Maharashtra", "Mumbai"))
+    event = watcher.poll()
+    assert event.rendered
+    assert event.rebuilt_sections == ["contact"]
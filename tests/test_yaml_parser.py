@@ -0,0 +1,122 @@
+import json
+import sys
+
+import pytest
+import yaml
+
+from src.core.settings import INPUT_FORMAT_JSON, INPUT_FORMAT_MSGPACK
+from src.services import yaml_parser
+from src.services.yaml_parser import (
+    ResumeParseError,
+    iter_resume_documents,
+    parse_resume_bytes,
+    parse_resume_dict,
+    parse_resume_file,
+)
+from src.utils.validators import ResumeValidationError
+
+LOADERS = [yaml.SafeLoader]
+if yaml.__with_libyaml__:
+    LOADERS.append(yaml.CSafeLoader)
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_parse_resume_file_with_each_loader(monkeypatch, loader):
+    monkeypatch.setattr(yaml_parser, "SafeLoader", loader)
+    resume_data = parse_resume_file("resume.yaml")
+    assert resume_data.contact.name == "Shubham More"
+    assert resume_data.experience[0].start_date == "Apr 2025"
+
+
+@pytest.mark.parametrize("loader", LOADERS)
+def test_invalid_yaml_raises_parse_error_with_each_loader(monkeypatch, tmp_path, loader):
+    monkeypatch.setattr(yaml_parser, "SafeLoader", loader)
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("contact: [unclosed\n")
+    with pytest.raises(ResumeParseError, match="^Invalid YAML syntax: "):
+        parse_resume_file(str(broken))
+
+
+def test_iter_resume_documents_reports_errors_without_aborting(tmp_path):
+    with open("resume.yaml") as resume_file:
+        valid_document = resume_file.read()
+    bundle = tmp_path / "bundle.yaml"
+    bundle.write_text(
+        valid_document
+        + "\n---\ncontact:\n  name: Nobody\nsummary: Missing email\n"
+        + "---\n"
+        + valid_document
+    )
+
+    documents = list(iter_resume_documents(str(bundle)))
+
+    assert [index for index, _, _ in documents] == [0, 1, 2]
+    assert documents[2][1].contact.name == "Shubham More"
+    assert documents[1][1] is None
+    assert isinstance(documents[1][2], ResumeValidationError)
+    assert documents[1][2].errors == ["Missing required field: 'email'"]
+    assert documents[0][2] is None and documents[2][2] is None
+
+
+def test_iter_resume_documents_is_lazy(tmp_path):
+    bundle = tmp_path / "bundle.yaml"
+    with open("resume.yaml") as resume_file:
+        bundle.write_text(resume_file.read() + "\n---\ncontact: [unclosed\n")
+
+    documents = iter_resume_documents(str(bundle))
+
+    index, resume_data, error = next(documents)
+    assert index == 0 and error is None
+    with pytest.raises(ResumeParseError, match="^Invalid YAML syntax: "):
+        next(documents)
+
+
+@pytest.fixture
+def raw_resume():
+    with open("resume.yaml") as resume_file:
+        return yaml.safe_load(resume_file)
+
+
+JSON_DECODERS = [(json.loads, json.JSONDecodeError)]
+if "orjson" in sys.modules:
+    JSON_DECODERS.append((sys.modules["orjson"].loads, sys.modules["orjson"].JSONDecodeError))
+
+
+@pytest.mark.parametrize("loads, decode_error", JSON_DECODERS)
+def test_json_file_matches_yaml(monkeypatch, tmp_path, raw_resume, loads, decode_error):
+    monkeypatch.setattr(yaml_parser, "json_loads", loads)
+    monkeypatch.setattr(yaml_parser, "JSONDecodeError", decode_error)
+    resume_json = tmp_path / "resume.json"
+    resume_json.write_text(json.dumps(raw_resume))
+
+    assert parse_resume_file(str(resume_json)) == parse_resume_file("resume.yaml")
+    with pytest.raises(ResumeParseError, match="^Invalid JSON syntax: "):
+        parse_resume_bytes(b'{"contact": ', INPUT_FORMAT_JSON)
+
+
+@pytest.mark.parametrize("loads, decode_error", JSON_DECODERS)
+def test_json_with_invalid_utf8_is_a_parse_error(monkeypatch, loads, decode_error):
+    monkeypatch.setattr(yaml_parser, "json_loads", loads)
+    monkeypatch.setattr(yaml_parser, "JSONDecodeError", decode_error)
+
+    with pytest.raises(ResumeParseError, match="^Invalid (UTF-8 in JSON input|JSON syntax): "):
+        parse_resume_bytes(b'{"a": "\xff"}', INPUT_FORMAT_JSON)
+
+
+def test_parse_resume_dict_validates_without_file_io(raw_resume):
+    assert parse_resume_dict(raw_resume) == parse_resume_file("resume.yaml")
+    with pytest.raises(ResumeValidationError, match="Missing required field: 'email'"):
+        parse_resume_dict({"contact": {"name": "Nobody"}, "summary": "Missing email"})
+
+
+def test_msgpack_payload_matches_yaml(raw_resume):
+    msgpack = pytest.importorskip("msgpack")
+
+    assert parse_resume_bytes(msgpack.packb(raw_resume), INPUT_FORMAT_MSGPACK) == parse_resume_file("resume.yaml")
+
+
+def test_msgpack_without_package_is_a_parse_error(monkeypatch):
+    monkeypatch.setattr(yaml_parser, "msgpack", None)
+
+    with pytest.raises(ResumeParseError, match="requires the 'msgpack' package"):
+        parse_resume_bytes(b"\x80", INPUT_FORMAT_MSGPACK)